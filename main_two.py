@@ -12,38 +12,43 @@ except ImportError:
 import select
 
 from src.tools.comm.interface_factory import create_interface
-from src.tools.telemetry.telemetry_dispatcher import (
-    send_tlm_gps, send_tlm_imu, send_tlm_battery, send_tlm_heartbeat
-)
+from src.tools.telemetry.telemetry_dispatcher import send_tlm_bundle
 from src.tools.command.command_dispatcher import (
     cmd_takeoff,
     cmd_landing,
     cmd_goto,
     cmd_waypoints
 )
-from src.core.frame_codec import parse_mesh_frame
+from src.core.frame_codec import decode_mesh_frame
 from src.core.frame_router import route_frame
-from src.tools.telemetry.telemetry_cache import reset_cache, get_all_cached_data
+from src.tools.telemetry.telemetry_cache import reset_cache, subscribe
+from src.tools.telemetry.telemetry_recorder import TelemetryRecorder
 
 def job_telemetry(interface, src, dst):
-    send_tlm_gps(interface, lat=37.0 + src*0.001, lon=35.0 + src*0.001, alt=100.0, dst=dst, src=src)
-    send_tlm_imu(interface, roll=1.0+src, pitch=2.0+src, yaw=3.0+src, dst=dst, src=src)
-    send_tlm_battery(interface, voltage=11.0-src*0.1, current=2.0+src*0.1, level=90.0-src, dst=dst, src=src)
-    send_tlm_heartbeat(interface, mode="AUTO", health="OK", is_armed=True, gps_fix=True, sat_count=10+src, dst=dst, src=src)
+    # GPS, IMU, BATTERY ve HEARTBEAT tek bir bundle frame ile gönderilir
+    send_tlm_bundle(interface, [
+        (0x01, [37.0 + src*0.001, 35.0 + src*0.001, 100.0]),
+        (0x02, [1.0+src, 2.0+src, 3.0+src]),
+        (0x03, [11.0-src*0.1, 2.0+src*0.1, 90.0-src]),
+        (0x04, ["AUTO", "OK", True, True, 10+src]),
+    ], dst=dst, src=src)
 
 def job_frame_processing(interface):
-    raw = interface.read()
-    if not raw:
-        return
-    try:
-        frame = parse_mesh_frame(raw)
-    except ValueError as e:
-        print(f"[ERROR] Frame parse edilemedi: {e} raw={raw.hex()}")
+    # Bekleyen tüm frame'ler tek seferde işlenir (tick başına tek frame sınırı yok)
+    frames = interface.read_many()
+    if not frames:
         return
+    for raw in frames:
+        try:
+            frame = decode_mesh_frame(raw, context=interface.context)
+        except ValueError as e:
+            print(f"[ERROR] Frame parse edilemedi: {e} raw={raw.hex()}")
+            continue
+        route_frame(frame, interface)
 
-    route_frame(frame, interface)
-    cache = get_all_cached_data()
-    print(f"[CACHE] {cache}")
+def print_cache_update(src_id, data_type, data):
+    # Tüm cache yerine yalnızca güncellenen kayıt yazdırılır
+    print(f"[CACHE] SRC {src_id} {data_type}: {data}")
 
 def send_command(interface, src, dst, key):
     """
@@ -103,6 +108,12 @@ def main():
     interface = create_interface()
     interface.start()
     reset_cache()
+    subscribe(print_cache_update)
+
+    # Config'te açıksa telemetri ikili log'a da kaydedilir
+    recorder = TelemetryRecorder.from_config()
+    if recorder:
+        recorder.attach()
 
     my_src_id = 1
     other_dst_id = 2
@@ -127,6 +138,8 @@ def main():
     finally:
         sched.shutdown(wait=False)
         interface.stop()
+        if recorder:
+            recorder.close()
         print("Program sonlandırıldı.")
 
 if __name__ == "__main__":
@@ -0,0 +1,122 @@
+# src/core/crc.py
+
+"""
+CRC-16-CCITT-FALSE Engine
+
+Single CRC implementation shared by the frame codec and the transports
+(poly=0x1021, init=0xFFFF, no reflection, no final XOR).
+
+The API is incremental: `update(crc, chunk)` continues a running CRC, so
+callers can checksum a frame piece by piece (header, then payload) or as
+bytes arrive from a serial link, without concatenating buffers first.
+
+Backends:
+  - "crcmod-c":      crcmod's C extension, used when it is importable.
+  - "python-slice8": pure-Python slice-by-8 tables, used otherwise.
+
+Run `python -m src.tools.dev.bench_crc` to compare them.
+"""
+
+from typing import List, Optional
+
+CRC_INIT: int = 0xFFFF
+CRC_POLY: int = 0x1021
+
+
+def _build_tables(poly: int = CRC_POLY) -> List[List[int]]:
+    """
+    Build the eight 256-entry lookup tables for slice-by-8.
+
+    tables[0][b] is the classic byte-at-a-time table; tables[k][b] is the CRC
+    contribution of byte b followed by k zero bytes.
+    """
+    t0 = []
+    for byte in range(256):
+        crc = byte << 8
+        for _ in range(8):
+            crc = ((crc << 1) ^ poly) if crc & 0x8000 else (crc << 1)
+        t0.append(crc & 0xFFFF)
+
+    tables = [t0]
+    for _ in range(7):
+        prev = tables[-1]
+        tables.append([((v << 8) & 0xFFFF) ^ t0[v >> 8] for v in prev])
+    return tables
+
+
+_TABLES = _build_tables()
+
+
+def update_python(crc: int, chunk) -> int:
+    """
+    Continue a CRC over `chunk` using the pure-Python slice-by-8 tables.
+
+    Args:
+        crc (int): Running CRC (start with CRC_INIT).
+        chunk (bytes | bytearray | memoryview): Data to add.
+
+    Returns:
+        int: Updated CRC.
+    """
+    t0, t1, t2, t3, t4, t5, t6, t7 = _TABLES
+    data = chunk if isinstance(chunk, (bytes, bytearray)) else bytes(chunk)
+    n = len(data)
+    end8 = n - (n % 8)
+
+    i = 0
+    while i < end8:
+        crc ^= (data[i] << 8) | data[i + 1]
+        crc = (
+            t7[crc >> 8] ^ t6[crc & 0xFF] ^
+            t5[data[i + 2]] ^ t4[data[i + 3]] ^
+            t3[data[i + 4]] ^ t2[data[i + 5]] ^
+            t1[data[i + 6]] ^ t0[data[i + 7]]
+        )
+        i += 8
+
+    while i < n:
+        crc = ((crc << 8) & 0xFFFF) ^ t0[(crc >> 8) ^ data[i]]
+        i += 1
+
+    return crc
+
+
+try:
+    import crcmod.predefined
+    from crcmod import _crcfunext  # noqa: F401  (present only when the C extension is built)
+    _crcmod_func: Optional[object] = crcmod.predefined.mkPredefinedCrcFun('crc-ccitt-false')
+except ImportError:
+    _crcmod_func = None
+
+
+if _crcmod_func is not None:
+    BACKEND: str = "crcmod-c"
+
+    def update(crc: int, chunk) -> int:
+        """
+        Continue a running CRC over `chunk`.
+
+        Args:
+            crc (int): Running CRC (start with CRC_INIT).
+            chunk (bytes | bytearray | memoryview): Data to add.
+
+        Returns:
+            int: Updated CRC.
+        """
+        return _crcmod_func(chunk, crc)
+else:
+    BACKEND = "python-slice8"
+    update = update_python
+
+
+def crc16(data) -> int:
+    """
+    Compute the CRC-16-CCITT-FALSE of a complete buffer.
+
+    Args:
+        data (bytes | bytearray | memoryview): Data to checksum.
+
+    Returns:
+        int: 16-bit CRC.
+    """
+    return update(CRC_INIT, data)
@@ -0,0 +1,135 @@
+# src/core/frame_batch.py
+
+"""
+Frame Batch Encoder
+
+Packs several mesh frames back-to-back into one preallocated buffer so they
+can be transmitted with a single send (one UDP datagram or one UART write).
+The encoder does not know about transports: `flush()` hands the buffer to a
+send callable supplied by the caller. Headers and CRCs are written in place with `pack_into`; the
+payload is copied once into the buffer and no per-frame `bytes` objects are
+created.
+
+Receivers split such a buffer with `frame_codec.split_mesh_frames`.
+"""
+
+import struct
+from typing import Callable, List, Optional
+
+from src.core.crc import CRC_INIT, update as crc_update
+from src.core.protocol_context import (
+    ProtocolContext,
+    HEADER_LEN,
+    CRC_LEN,
+    get_protocol_context,
+)
+
+_CRC_STRUCT = struct.Struct(">H")
+
+
+class FrameBatchEncoder:
+    """
+    Accumulates mesh frames in a reusable bytearray.
+
+    Example:
+        batch = FrameBatchEncoder()
+        batch.add('T', src, dst, gps_payload)
+        batch.add('T', src, dst, imu_payload)
+        batch.flush(interface.send)     # one send for both frames
+    """
+
+    def __init__(self, capacity: int = 512, context: Optional[ProtocolContext] = None) -> None:
+        """
+        Args:
+            capacity (int): Initial buffer size in bytes; grows if exceeded.
+            context (ProtocolContext | None): Protocol context; shared default if None.
+        """
+        self.context = context if context is not None else get_protocol_context()
+        self._buf = bytearray(capacity)
+        self._size = 0
+        self._offsets: List[int] = []
+
+    def __len__(self) -> int:
+        """Number of frames currently in the batch."""
+        return len(self._offsets)
+
+    @property
+    def offsets(self) -> List[int]:
+        """Start offset of every frame in the batch buffer."""
+        return list(self._offsets)
+
+    @property
+    def nbytes(self) -> int:
+        """Total encoded size of the batch in bytes."""
+        return self._size
+
+    def _reserve(self, needed: int) -> None:
+        """Grow the buffer so that `needed` more bytes fit."""
+        required = self._size + needed
+        if required > len(self._buf):
+            new_cap = max(required, len(self._buf) * 2)
+            self._buf.extend(bytes(new_cap - len(self._buf)))
+
+    def add(self, frame_type: str, src_id: int, dst_id: int, payload: bytes) -> int:
+        """
+        Append one frame to the batch.
+
+        Args:
+            frame_type (str): Single-character frame type (e.g. 'T').
+            src_id (int): Source device ID.
+            dst_id (int): Destination device ID.
+            payload (bytes): Serialized payload.
+
+        Returns:
+            int: Offset of the new frame within the batch buffer.
+        """
+        ctx = self.context
+        payload_len = len(payload)
+        frame_len = HEADER_LEN + payload_len + CRC_LEN
+        self._reserve(frame_len)
+
+        offset = self._size
+        buf = self._buf
+        ctx.header_struct.pack_into(
+            buf, offset,
+            ctx.start_byte, ctx.start_byte_2, ctx.version,
+            ord(frame_type), src_id, dst_id, payload_len
+        )
+        crc_end = offset + HEADER_LEN + payload_len
+        buf[offset + HEADER_LEN:crc_end] = payload
+
+        with memoryview(buf) as view:
+            crc = crc_update(CRC_INIT, view[offset:crc_end])
+        _CRC_STRUCT.pack_into(buf, crc_end, crc)
+
+        self._size = crc_end + CRC_LEN
+        self._offsets.append(offset)
+        return offset
+
+    def getvalue(self) -> bytes:
+        """
+        Return the encoded batch as bytes (safe to keep after reset()).
+        """
+        return bytes(memoryview(self._buf)[:self._size])
+
+    def reset(self) -> None:
+        """Drop all frames while keeping the allocated buffer."""
+        self._size = 0
+        self._offsets.clear()
+
+    def flush(self, send: Callable[[bytes], None]) -> int:
+        """
+        Pass every frame in the batch to one send call, then reset.
+
+        Args:
+            send (Callable[[bytes], None]): Writes the encoded batch, e.g.
+                interface.send.
+
+        Returns:
+            int: Number of frames sent.
+        """
+        count = len(self._offsets)
+        if count:
+            send(self.getvalue())
+            self.reset()
+        return count
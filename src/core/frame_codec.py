@@ -1,14 +1,29 @@
 import os
 import struct
 import json
-import crcmod
 
-# CRC-16-CCITT-FALSE (poly=0x1021, init=0xFFFF)
-CRC_FUNC = crcmod.predefined.mkPredefinedCrcFun('crc-ccitt-false')
+from src.core.crc import CRC_INIT, crc16, update as crc_update
+from src.core.protocol_context import (
+    ProtocolContext,
+    HEADER_LEN,
+    CRC_LEN,
+    get_protocol_context,
+)
+
+# CRC-16-CCITT-FALSE (poly=0x1021, init=0xFFFF) — bkz. src/core/crc.py
+CRC_FUNC = crc16
+
+# Önceden derlenmiş yapılar: header gövdesi (version, type, src, dst, len) ve CRC
+_HEADER_BODY = struct.Struct(">BBBBH")
+_CRC_STRUCT = struct.Struct(">H")
+
+# En kısa frame: 2 start + 1 versiyon + 1 tip + 1 src + 1 dst + 2 len + 2 CRC = 10 bayt
+MIN_FRAME_LEN = HEADER_LEN + CRC_LEN
 
 def load_protocol_config(config_path=None):
     """
-    Config'ten protokol sabitlerini alır:
+    Config dosyasını okuyup protokol sabitlerini alır (her çağrıda dosya açılır;
+    sık çağrılan yollar için get_protocol_context() kullanın):
       - start_byte: frame'in ilk baytı
       - start_byte_2: frame'in ikinci baytı
       - version: protokol versiyonu
@@ -22,7 +37,7 @@ def load_protocol_config(config_path=None):
         return proto["start_byte"], proto["start_byte_2"], proto["version"]
 
 def load_device_id(config_path=None):
-    """Config'ten cihaz ID'sini alır."""
+    """Config dosyasını okuyup cihaz ID'sini alır (önbelleksiz)."""
     if config_path is None:
         base_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), "../../"))
         config_path = os.path.join(base_dir, "config.json")
@@ -30,78 +45,177 @@ def load_device_id(config_path=None):
         cfg = json.load(f)
         return cfg["vehicle"]["id"]
 
-def build_mesh_frame(frame_type: str, src_id: int, dst_id: int, payload: bytes, config_path=None) -> bytes:
+def _get_context(config_path=None, context: ProtocolContext = None) -> ProtocolContext:
+    """Verilen context'i ya da config yoluna ait paylaşılan context'i döner."""
+    return context if context is not None else get_protocol_context(config_path)
+
+def build_mesh_frame(frame_type: str, src_id: int, dst_id: int, payload: bytes, config_path=None,
+                     context: ProtocolContext = None) -> bytes:
     """
     Frame oluşturma:
       [start_byte][start_byte_2][version][frame_type][src_id][dst_id][payload_len]
       [payload...]
       [CRC-16 (2 bytes)]
+
+    Protokol sabitleri `context`'ten (yoksa önbellekteki paylaşılan context'ten) alınır.
     """
-    start_byte, start_byte_2, version = load_protocol_config(config_path)
+    return build_mesh_frame_from_parts(frame_type, src_id, dst_id, (payload,), config_path, context)
+
+def build_mesh_frame_from_parts(frame_type: str, src_id: int, dst_id: int, parts, config_path=None,
+                                context: ProtocolContext = None) -> bytes:
+    """
+    Payload'u parça parça (ör. FTP chunk öneki + dosya verisi) alan frame oluşturucu.
+
+    CRC header ve her parça üzerinden artımlı hesaplanır; parçalar önceden
+    birleştirilmez, frame tek bir join ile oluşturulur.
+    """
+    ctx = _get_context(config_path, context)
     frame_type_byte = ord(frame_type)
-    payload_len = len(payload)
+    payload_len = sum(len(p) for p in parts)
 
     # Header: iki start baytı, versiyon, frame tipi, src_id, dst_id, payload uzunluğu
-    header = struct.pack(
-        ">BBBBBBH",
-        start_byte,
-        start_byte_2,
-        version,
+    header = ctx.header_struct.pack(
+        ctx.start_byte,
+        ctx.start_byte_2,
+        ctx.version,
         frame_type_byte,
         src_id,
         dst_id,
         payload_len
     )
 
-    frame_wo_crc = header + payload
-    crc = CRC_FUNC(frame_wo_crc)
-    return frame_wo_crc + struct.pack(">H", crc)
+    crc = crc_update(CRC_INIT, header)
+    for part in parts:
+        crc = crc_update(crc, part)
+    return b"".join((header, *parts, _CRC_STRUCT.pack(crc)))
 
-def parse_mesh_frame(data: bytes, config_path=None) -> dict:
+class MeshFrame:
     """
-    Frame çözümleme ve doğrulama:
-      - İlk iki baytı kontrol et (start bytes)
-      - Header unpack et
-      - Payload ve CRC'yi ayır, CRC doğrula
+    Çözümlenmiş mesh frame'i (hafif, __slots__ tabanlı).
+
+    `payload` alım tamponu üzerinde bir memoryview'dur; kopya yapılmaz.
+    Payload'u frame'den uzun süre saklayacak kod bytes(...) ile kopyalamalıdır.
+    Eski dict tabanlı koda uyum için frame["src_id"] ve frame.get("dst_id")
+    erişimleri desteklenir.
+    """
+
+    __slots__ = ("version", "frame_type", "src_id", "dst_id", "payload")
+
+    def __init__(self, version: int, frame_type: int, src_id: int, dst_id: int, payload: memoryview):
+        self.version = version
+        self.frame_type = frame_type
+        self.src_id = src_id
+        self.dst_id = dst_id
+        self.payload = payload
+
+    def __getitem__(self, key: str):
+        if key not in MeshFrame.__slots__:
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def __contains__(self, key) -> bool:
+        return key in MeshFrame.__slots__
+
+    def get(self, key: str, default=None):
+        """dict.get uyumlu alan erişimi."""
+        return getattr(self, key) if key in MeshFrame.__slots__ else default
+
+    def keys(self):
+        return MeshFrame.__slots__
+
+    def to_dict(self) -> dict:
+        """parse_mesh_frame ile aynı biçimde dict döner (payload bytes olarak kopyalanır)."""
+        return {
+            "version": self.version,
+            "frame_type": self.frame_type,
+            "src_id": self.src_id,
+            "dst_id": self.dst_id,
+            "payload": bytes(self.payload)
+        }
+
+    def __repr__(self) -> str:
+        return (
+            f"MeshFrame(type={chr(self.frame_type)!r}, src={self.src_id}, dst={self.dst_id}, "
+            f"len={len(self.payload)})"
+        )
+
+def decode_mesh_frame(data, config_path=None, context: ProtocolContext = None) -> MeshFrame:
+    """
+    Kopyasız frame çözümleme: bytes, bytearray veya memoryview kabul eder.
+
+    Header önceden derlenmiş Struct'larla doğrudan tampon üzerinden okunur,
+    CRC tampon görünümü üzerinden hesaplanır ve payload bir memoryview olarak
+    döner. Doğrulama kuralları parse_mesh_frame ile aynıdır.
+
+    Not: bytearray girdide dönen payload tampona referans tutar; payload
+    yaşadığı sürece bytearray yeniden boyutlandırılamaz.
     """
-    start_byte, start_byte_2, version_expected = load_protocol_config(config_path)
+    ctx = _get_context(config_path, context)
+    view = data if isinstance(data, memoryview) else memoryview(data)
+    total = len(view)
 
-    # En kısa frame: 2 start + 1 versiyon + 1 tip + 1 src + 1 dst + 2 len + 2 CRC = 10 bayt
-    min_len = 1 + 1 + 1 + 1 + 1 + 1 + 2 + 2
-    if len(data) < min_len:
+    if total < MIN_FRAME_LEN:
         raise ValueError("Frame çok kısa")
 
     # Başlangıç baytları kontrolü
-    if data[0] != start_byte or data[1] != start_byte_2:
+    if view[0] != ctx.start_byte or view[1] != ctx.start_byte_2:
         raise ValueError("Geçersiz start bytes")
 
-    # Header alanını çöz
     # bytes 2-7: version(1), frame_type(1), src_id(1), dst_id(1), payload_len(2)
-    version, frame_type, src_id, dst_id, payload_len = struct.unpack(
-        ">BBBBH",
-        data[2:8]
-    )
-
-    if version != version_expected:
-        raise ValueError(f"Protokol versiyonu uyuşmuyor: {version} ≠ {version_expected}")
+    version, frame_type, src_id, dst_id, payload_len = _HEADER_BODY.unpack_from(view, 2)
 
-    expected_len = min_len + payload_len
-    if len(data) != expected_len:
-        raise ValueError(f"Frame uzunluğu hatalı: {len(data)} ≠ {expected_len}")
+    if version != ctx.version:
+        raise ValueError(f"Protokol versiyonu uyuşmuyor: {version} ≠ {ctx.version}")
 
-    # Payload ve CRC ayırma
-    payload_start = 8
-    payload = data[payload_start:payload_start + payload_len]
+    expected_len = MIN_FRAME_LEN + payload_len
+    if total != expected_len:
+        raise ValueError(f"Frame uzunluğu hatalı: {total} ≠ {expected_len}")
 
-    crc_received = struct.unpack(">H", data[payload_start + payload_len:payload_start + payload_len + 2])[0]
-    crc_calc = CRC_FUNC(data[:payload_start + payload_len])
-    if crc_received != crc_calc:
+    crc_offset = HEADER_LEN + payload_len
+    crc_received, = _CRC_STRUCT.unpack_from(view, crc_offset)
+    if crc_received != CRC_FUNC(view[:crc_offset]):
         raise ValueError("CRC uyuşmazlığı")
 
-    return {
-        "version": version,
-        "frame_type": frame_type,
-        "src_id": src_id,
-        "dst_id": dst_id,
-        "payload": payload
-    }
+    return MeshFrame(version, frame_type, src_id, dst_id, view[HEADER_LEN:crc_offset])
+
+def parse_mesh_frame(data: bytes, config_path=None, context: ProtocolContext = None) -> dict:
+    """
+    Frame çözümleme ve doğrulama:
+      - İlk iki baytı kontrol et (start bytes)
+      - Header unpack et
+      - Payload ve CRC'yi ayır, CRC doğrula
+
+    Geriye uyumluluk sarmalayıcısıdır: decode_mesh_frame sonucunu payload'u
+    bytes olan bir dict'e çevirir. Sıcak yollar decode_mesh_frame kullanmalıdır.
+    """
+    return decode_mesh_frame(data, config_path, context).to_dict()
+
+def split_mesh_frames(data, config_path=None, context: ProtocolContext = None):
+    """
+    Birden fazla frame içeren bir tamponu (ör. FrameBatchEncoder ile
+    gönderilmiş tek bir UDP datagramı) frame'lere ayırır.
+
+    Yalnızca start baytları ve uzunluk alanına bakılır; doğrulama
+    decode_mesh_frame'e bırakılır. Tampon tek bir frame ise nesnenin kendisi,
+    aksi halde kopyasız memoryview dilimleri döner. Çözülemeyen kalan kısım
+    tek parça olarak döner (decode aşamasında hata verir).
+    """
+    ctx = _get_context(config_path, context)
+    total = len(data)
+    if total >= MIN_FRAME_LEN and data[0] == ctx.start_byte and data[1] == ctx.start_byte_2:
+        first_len = MIN_FRAME_LEN + _HEADER_BODY.unpack_from(data, 2)[4]
+        if first_len == total:
+            return [data]
+
+    view = data if isinstance(data, memoryview) else memoryview(data)
+    frames = []
+    offset = 0
+    while offset < total:
+        if (total - offset < MIN_FRAME_LEN
+                or view[offset] != ctx.start_byte or view[offset + 1] != ctx.start_byte_2):
+            frames.append(view[offset:])
+            break
+        frame_len = MIN_FRAME_LEN + _HEADER_BODY.unpack_from(view, offset + 2)[4]
+        frames.append(view[offset:offset + frame_len])
+        offset += frame_len
+    return frames
@@ -6,7 +6,7 @@ from src.handlers.swarm.swarm_handler import handle_swarm
 from src.handlers.ack.ack_handler import handle_ack
 from src.handlers.ftp.file_handler import handle_file
 
-from src.core.frame_codec import load_device_id
+from src.core.protocol_context import resolve_context
 from src.tools.log.logger import logger
 
 # Frame Type → Handler Mapping
@@ -21,6 +21,9 @@ dispatch_table = {
 def route_frame(frame_dict: dict, interface):
     """
     Routes a decoded mesh frame to the appropriate handler.
+
+    Accepts either a `MeshFrame` from `decode_mesh_frame` or the legacy dict
+    returned by `parse_mesh_frame`; handlers receive the payload unchanged.
     """
 
     try:
@@ -32,7 +35,7 @@ def route_frame(frame_dict: dict, interface):
         if isinstance(frame_type, int):
             frame_type = chr(frame_type)
 
-        local_id = load_device_id()
+        local_id = resolve_context(interface).device_id
 
         if dst_id != 0xFF and dst_id != local_id:
             logger.debug(f"[ROUTER] IGNORED | Frame not addressed to this node (dst_id={dst_id}, local_id={local_id})")
@@ -0,0 +1,164 @@
+# src/core/protocol_context.py
+
+"""
+Protocol Context Module
+
+Holds the protocol constants (start bytes, version) and the local device ID
+loaded once from `config.json`, together with a precompiled header `Struct`.
+Frame builders, parsers and the router use a context instead of re-reading
+the configuration file for every frame.
+
+A shared default context is kept per config path; interfaces may carry their
+own context (see `interface_factory.create_interface`), and `reload()` picks
+up configuration changes explicitly.
+"""
+
+import json
+import os
+import struct
+import threading
+from typing import Dict, Optional
+
+# Project root `config.json` (two levels above src/core)
+DEFAULT_CONFIG_PATH: str = os.path.join(
+    os.path.abspath(os.path.join(os.path.dirname(__file__), "../../")),
+    "config.json"
+)
+
+# Header: start_byte, start_byte_2, version, frame_type, src_id, dst_id, payload_len
+HEADER_STRUCT: struct.Struct = struct.Struct(">BBBBBBH")
+HEADER_LEN: int = HEADER_STRUCT.size
+CRC_LEN: int = 2
+
+
+class ProtocolContext:
+    """
+    Protocol settings of one node, loaded once and reused for every frame.
+
+    Attributes:
+        config_path (str): Configuration file the context was loaded from.
+        start_byte (int): First frame sync byte.
+        start_byte_2 (int): Second frame sync byte.
+        version (int): Expected protocol version.
+        device_id (int): Local device ID (`vehicle.id`).
+        header_struct (struct.Struct): Precompiled mesh frame header layout.
+    """
+
+    __slots__ = (
+        "config_path",
+        "start_byte",
+        "start_byte_2",
+        "version",
+        "device_id",
+        "header_struct",
+    )
+
+    def __init__(
+        self,
+        start_byte: int,
+        start_byte_2: int,
+        version: int,
+        device_id: int,
+        config_path: Optional[str] = None
+    ) -> None:
+        self.config_path = config_path
+        self.start_byte = start_byte
+        self.start_byte_2 = start_byte_2
+        self.version = version
+        self.device_id = device_id
+        self.header_struct = HEADER_STRUCT
+
+    @classmethod
+    def from_config(cls, config_path: Optional[str] = None) -> "ProtocolContext":
+        """
+        Load a context from a configuration file.
+
+        Args:
+            config_path (str | None): Path to config.json; project root if None.
+
+        Returns:
+            ProtocolContext: Newly loaded context.
+        """
+        ctx = cls(0, 0, 0, 0, config_path or DEFAULT_CONFIG_PATH)
+        ctx.reload()
+        return ctx
+
+    def reload(self) -> None:
+        """
+        Re-read protocol constants and device ID from `config_path`.
+        """
+        with open(self.config_path, "r", encoding="utf-8") as f:
+            cfg = json.load(f)
+        proto = cfg.get("protocol", {})
+        self.start_byte = proto["start_byte"]
+        self.start_byte_2 = proto["start_byte_2"]
+        self.version = proto["version"]
+        self.device_id = cfg["vehicle"]["id"]
+
+    @property
+    def sync(self) -> bytes:
+        """The two start bytes that open every frame."""
+        return bytes((self.start_byte, self.start_byte_2))
+
+    def __repr__(self) -> str:
+        return (
+            f"ProtocolContext(start=0x{self.start_byte:02X}{self.start_byte_2:02X}, "
+            f"version={self.version}, device_id={self.device_id})"
+        )
+
+
+# Shared contexts, keyed by absolute config path
+_contexts: Dict[str, ProtocolContext] = {}
+_contexts_lock = threading.Lock()
+
+
+def get_protocol_context(config_path: Optional[str] = None) -> ProtocolContext:
+    """
+    Return the shared context for a config file, loading it on first use.
+
+    Args:
+        config_path (str | None): Path to config.json; project root if None.
+
+    Returns:
+        ProtocolContext: Cached context for that path.
+    """
+    key = os.path.abspath(config_path or DEFAULT_CONFIG_PATH)
+    ctx = _contexts.get(key)
+    if ctx is None:
+        with _contexts_lock:
+            ctx = _contexts.get(key)
+            if ctx is None:
+                ctx = ProtocolContext.from_config(key)
+                _contexts[key] = ctx
+    return ctx
+
+
+def reload_protocol_context(config_path: Optional[str] = None) -> ProtocolContext:
+    """
+    Re-read the shared context for a config file in place.
+
+    Every holder of the shared instance sees the new values.
+
+    Args:
+        config_path (str | None): Path to config.json; project root if None.
+
+    Returns:
+        ProtocolContext: The reloaded shared context.
+    """
+    ctx = get_protocol_context(config_path)
+    ctx.reload()
+    return ctx
+
+
+def resolve_context(interface=None) -> ProtocolContext:
+    """
+    Return the context attached to an interface, or the shared default.
+
+    Args:
+        interface: Communication interface, optionally carrying `.context`.
+
+    Returns:
+        ProtocolContext: Context to use for frames on that interface.
+    """
+    ctx = getattr(interface, "context", None)
+    return ctx if ctx is not None else get_protocol_context()
@@ -2,7 +2,7 @@
 
 from src.serializers.ack_serializer import deserialize_ack
 from src.handlers.command.command_handler import command_definitions, CommandDefinition
-from src.tools.ack.ack_tracker import register_ack
+from src.tools.ack.ack_tracker import register_ack, register_ftp_bitmap
 from src.tools.ack.ftp_ack_builder import COMMAND_IDS as FTP_COMMAND_IDS
 from src.tools.log.logger import logger
 
@@ -29,6 +29,13 @@ def handle_ack(payload: bytes, frame_meta: dict, uart_handler=None):
     src_id   = frame_meta.get("src_id")
     dst_id   = frame_meta.get("dst_id")
 
+    # --- FTP bitmap ACK: [0xAA][0x13][base:4B][bitmap...] ---
+    if cmd_id == FTP_COMMAND_IDS["BITMAP"]:
+        base = int.from_bytes(payload[2:6], "big")
+        register_ftp_bitmap(src_id, base, bytes(payload[6:]))
+        logger.debug(f"[ACK] FTP BITMAP received | BASE: {base} | SRC: {src_id} -> DST: {dst_id}")
+        return
+
     # --- FTP phases: they encode the status in 4 bytes at payload[2:6] ---
     if cmd_id in FTP_COMMAND_IDS.values():
         # Read 4-byte status (sequence or 0 for START/END)
@@ -44,6 +51,9 @@ def handle_ack(payload: bytes, frame_meta: dict, uart_handler=None):
 
         # Register ACK (0) or NACK (status_code)
         register_ack(tracker_key, src_id, 0 if is_ack else status_code)
+        # START ACK carries the ack_every the receiver accepted (0 = per-chunk ACKs)
+        if phase_name == "START" and is_ack:
+            register_ack("FTP_ACK_EVERY", src_id, status_code)
 
         ack_type = "ACK" if is_ack else "NACK"
         logger.info(
@@ -1,46 +1,73 @@
 # src/handlers/ftp/file_handler.py
 
 from src.serializers.ftp_serializer import (
+    FTP_ACK_REQUEST,
     FTP_PHASE_IDS,
     deserialize_ftp_start,
+    deserialize_ftp_start_ack_every,
     deserialize_ftp_chunk,
-    deserialize_ftp_end
+    deserialize_ftp_end,
+    encode_chunk_bitmap
 )
 from src.tools.ftp.storage import open_download_stream
 from src.tools.log.logger import logger
-from src.tools.ack.ack_dispatcher import send_ftp_ack
-from src.tools.ack.ack_tracker import register_ack
+from src.tools.ack.ack_dispatcher import send_ftp_ack, send_ftp_bitmap_ack
+from src.tools.ack.ack_tracker import register_ack, register_ftp_bitmap
 
-# transfer state: (src_id, dst_id) → { stream, chunks: {seq: bytes}, total: Optional[int] }
+# transfer state: (src_id, dst_id) → {
+#   stream, chunks: {seq: bytes}, total: Optional[int],
+#   ack_every: 0 = chunk başına ACK, >0 = bitmap ACK,
+#   base: kesintisiz alınan chunk sayısı, highest: en büyük seq, pending: son ACK'ten beri chunk
+# }
 _transfers: dict[tuple[int, int], dict] = {}
 
 
+def _send_bitmap(transfer: dict, interface, src: int) -> None:
+    """Alınan chunk'ların durumunu tek bir bitmap ACK ile bildirir."""
+    base = transfer["base"]
+    bitmap = encode_chunk_bitmap(base, transfer["chunks"], transfer["highest"])
+    send_ftp_bitmap_ack(interface, target_id=src, base=base, bitmap=bitmap)
+    register_ftp_bitmap(src, base, bitmap)
+    transfer["pending"] = 0
+
+
 def handle_file(payload: bytes, frame_dict: dict, interface):
     """
     FTP transfer için gelen frame’leri işler:
-    - START: dosya adı → stream aç → START-ACK
-    - CHUNK: seq → buffer’a ekle → CHUNK-ACK
-    - END: total → eksikleri NACK / tamamsa yaz → END-ACK
+    - START: dosya adı → stream aç → START-ACK (kabul edilen ack_every ile)
+    - CHUNK: seq → buffer’a ekle → CHUNK-ACK, bitmap modunda her ack_every
+      chunk'ta veya ACK_REQUEST bayrağında tek bir bitmap ACK
+    - END: total → eksikleri NACK (bitmap modunda tek bitmap) / tamamsa yaz → END-ACK
     """
     src = frame_dict["src_id"]
     dst = frame_dict["dst_id"]
     fid = (src, dst)
 
     logger.debug(f"[FTP DEBUG] RAW payload hex={payload.hex()}")
-    phase = payload[0]
+    phase = payload[0] & ~FTP_ACK_REQUEST
 
     # START: yalnızca yeni transferse
     if phase == FTP_PHASE_IDS["START"] and fid not in _transfers:
         try:
             filename = deserialize_ftp_start(payload)
+            ack_every = deserialize_ftp_start_ack_every(payload)
         except Exception as e:
             logger.error(f"[FTP] START deserialization failed: {e}")
             return
         stream = open_download_stream(filename)
-        _transfers[fid] = {"stream": stream, "chunks": {}, "total": None}
-        send_ftp_ack(interface, phase="START", target_id=src, success=True)
+        _transfers[fid] = {"stream": stream, "chunks": {}, "total": None,
+                           "ack_every": ack_every, "base": 0, "highest": -1, "pending": 0}
+        send_ftp_ack(interface, phase="START", target_id=src, success=True, status_code=ack_every)
         register_ack("FTP_START", src, status=0)
-        logger.info(f"[FTP] START received, filename={filename}")
+        register_ack("FTP_ACK_EVERY", src, status=ack_every)
+        logger.info(f"[FTP] START received, filename={filename}, ack_every={ack_every}")
+        return
+
+    # yinelenen START (ACK'i kaybolmuş olabilir): aynı ack_every ile yeniden ACK
+    if phase == FTP_PHASE_IDS["START"]:
+        send_ftp_ack(interface, phase="START", target_id=src, success=True,
+                     status_code=_transfers[fid]["ack_every"])
+        logger.debug(f"[FTP] Re-ACK duplicate START from {src}->{dst}")
         return
 
     # CHUNK: yalnızca transfer devam ediyorsa
@@ -52,9 +79,20 @@ def handle_file(payload: bytes, frame_dict: dict, interface):
             return
         logger.debug(f"[FTP DEBUG] parsed seq={seq}, data_length={len(data)} bytes")
         transfer = _transfers[fid]
-        transfer["chunks"][seq] = data
-        send_ftp_ack(interface, phase="CHUNK", target_id=src, success=True, status_code=seq)
-        register_ack(f"FTP_CHUNK_{seq}", src, status=0)
+        chunks = transfer["chunks"]
+        chunks[seq] = data
+        if transfer["ack_every"]:
+            base = transfer["base"]
+            while base in chunks:
+                base += 1
+            transfer["base"] = base
+            transfer["highest"] = max(transfer["highest"], seq)
+            transfer["pending"] += 1
+            if payload[0] & FTP_ACK_REQUEST or transfer["pending"] >= transfer["ack_every"]:
+                _send_bitmap(transfer, interface, src)
+        else:
+            send_ftp_ack(interface, phase="CHUNK", target_id=src, success=True, status_code=seq)
+            register_ack(f"FTP_CHUNK_{seq}", src, status=0)
         logger.debug(f"[FTP] CHUNK received seq={seq}, size={len(data)} bytes")
         return
 
@@ -71,7 +109,11 @@ def handle_file(payload: bytes, frame_dict: dict, interface):
         received = set(transfer["chunks"].keys())
         missing = set(range(total)) - received
 
-        if missing:
+        if missing and transfer["ack_every"]:
+            # Eksikler bitmap'teki boşluklardır; gönderici yalnızca onları yeniden yollar
+            _send_bitmap(transfer, interface, src)
+            logger.warning(f"[FTP] END received but missing chunks: {missing}")
+        elif missing:
             for seq in missing:
                 send_ftp_ack(interface, phase="CHUNK", target_id=src, success=False, status_code=seq)
                 register_ack(f"FTP_CHUNK_{seq}", src, status=1)
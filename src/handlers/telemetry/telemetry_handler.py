@@ -1,102 +1,89 @@
-from src.serializers.telemetry_serializer import deserialize_telemetry
+import logging
+from typing import Callable, Dict
+
+from src.serializers.telemetry_codecs import TELEMETRY_CODECS, TelemetryCodec, get_codec
+from src.serializers.telemetry_serializer import (
+    TLM_BUNDLE_ID,
+    decode_telemetry_record,
+    deserialize_telemetry,
+    iter_tlm_bundle
+)
 from src.tools.telemetry.telemetry_cache import set_device_data
 from src.tools.log.logger import logger
 
-# 📌 Telemetry Type Map
-TELEMETRY_TYPE_MAP = {
-    0x01: "gps",
-    0x02: "imu",
-    0x03: "battery",
-    0x04: "heartbeat"
-}
-
-# 🚀 Handle GPS data
-def handle_gps_data(data: dict, src_id: int, data_type: str):
-    gps_data = {
-        "lat": data["lat"],
-        "lon": data["lon"],
-        "alt": data["alt"],
-    }
-    set_device_data(src_id, data_type, gps_data)
-    logger.info(f"[TELEMETRY] Received GPS data from SRC: {src_id}")
-    logger.debug(
-        f"[TELEMETRY] -> LAT: {data['lat']:.6f}, "
-        f"LON: {data['lon']:.6f}, ALT: {data['alt']:.2f}"
-    )
-
-# 🚀 Handle IMU data
-def handle_imu_data(data: dict, src_id: int, data_type: str):
-    imu_data = {
-        "roll": data["roll"],
-        "pitch": data["pitch"],
-        "yaw": data["yaw"],
-    }
-    set_device_data(src_id, data_type, imu_data)
-    logger.info(f"[TELEMETRY] Received IMU data from SRC: {src_id}")
-    logger.debug(
-        f"[TELEMETRY] -> Roll: {data['roll']:.2f}, "
-        f"Pitch: {data['pitch']:.2f}, Yaw: {data['yaw']:.2f}"
-    )
-
-def handle_battery_data(data: dict, src_id: int, data_type: str):
-    battery_data = {
-        "voltage": data["voltage"],
-        "current": data["current"],
-        "level": data["level"]
-    }
-    set_device_data(src_id, data_type, battery_data)
-    logger.info(f"[TELEMETRY] Received BATTERY data from SRC: {src_id}")
-    logger.debug(
-        f"[TELEMETRY] -> Voltage: {data['voltage']:.2f}, "
-        f"Current: {data['current']:.2f}, Level: {data['level']:.2f}"
-    )
-
-def handle_heartbeat_data(data: dict, src_id: int, data_type: str):
-    heartbeat_data = {
-        "mode": data["mode"],
-        "health": data["health"],
-        "is_armed": data["is_armed"],
-        "gps_fix": data["gps_fix"],
-        "sat_count": data["sat_count"]
-    }
-    set_device_data(src_id, data_type, heartbeat_data)
-    logger.info(f"[TELEMETRY] Received HEARTBEAT from SRC: {src_id}")
-    logger.debug(
-        f"[TELEMETRY] -> MODE: {data['mode']}, "
-        f"HEALTH: {data['health']}, "
-        f"ARMED: {data['is_armed']}, GPS_FIX: {data['gps_fix']}, SATS: {data['sat_count']}"
-    )
+# 📌 Telemetry handler table: tlm_id -> handler(data, src_id)
+#    Filled on first use with a cache writer generated from the codec registry;
+#    register_telemetry_handler() overrides the writer for a type.
+TELEMETRY_HANDLERS: Dict[int, Callable[[dict, int], None]] = {}
+
+# 🏭 Generate the cache writer of a telemetry type from its schema
+def make_cache_writer(codec: TelemetryCodec) -> Callable[[dict, int], None]:
+    fields, data_type, label = codec.fields, codec.name, codec.label
+
+    def write_to_cache(data: dict, src_id: int):
+        set_device_data(src_id, data_type, {name: data[name] for name in fields})
+        logger.info(f"[TELEMETRY] Received {label} data from SRC: {src_id}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"[TELEMETRY] -> {codec.describe(data)}")
+
+    write_to_cache.__name__ = f"handle_{data_type}_data"
+    return write_to_cache
+
+# 🧩 Replace the generated handler of a telemetry type
+def register_telemetry_handler(tlm: int | str, handler: Callable[[dict, int], None]):
+    TELEMETRY_HANDLERS[get_codec(tlm).tlm_id] = handler
+
+def _resolve_handler(tlm_id: int):
+    handler = TELEMETRY_HANDLERS.get(tlm_id)
+    if handler is None:
+        codec = TELEMETRY_CODECS.get(tlm_id)
+        if codec is not None:
+            handler = TELEMETRY_HANDLERS[tlm_id] = make_cache_writer(codec)
+    return handler
+
+# 🧭 Dispatch one decoded telemetry record to its type handler (table lookup)
+def dispatch_telemetry_record(data: dict, src_id: int):
+    tlm_id = data.get("tlm_id")
+
+    if not isinstance(tlm_id, int):
+        raise ValueError(f"Invalid tlm_id: {tlm_id}")
+
+    handler = _resolve_handler(tlm_id)
+    if handler is None:
+        logger.warning(f"[TELEMETRY] Unknown telemetry type (tlm_id: {tlm_id}) from SRC: {src_id}")
+        return
+    handler(data, src_id)
+
+# 📦 Fan out every record of a bundle frame in one pass
+def handle_telemetry_bundle(payload, src_id: int, dst_id: int | None = None):
+    stored = 0
+    for tlm_byte, body in iter_tlm_bundle(payload):
+        try:
+            dispatch_telemetry_record(decode_telemetry_record(tlm_byte, body, src_id, dst_id), src_id)
+            stored += 1
+        except (ValueError, TypeError) as e:
+            # A bad record does not prevent the others from being stored
+            logger.warning(f"[TELEMETRY] Bundle record skipped (tlm_id: {tlm_byte}) from SRC: {src_id}: {e}")
+    logger.debug(f"[TELEMETRY] Bundle from SRC: {src_id} | RECORDS STORED: {stored}")
 
 # 🧠 Central Telemetry Handler
 def handle_telemetry(payload: bytes, frame_meta: dict, interface=None):
     """
     Processes 'T' (Telemetry) type frames and updates the telemetry cache.
+    Bundle frames (TLM_BUNDLE_ID) carry several records and are fanned out.
     """
     try:
         # 1️⃣ Parse frame metadata
         src_id = frame_meta.get("src_id")
+        dst_id = frame_meta.get("dst_id")
+
+        # 2️⃣ Bundle: every record goes to the cache in one pass
+        if payload and payload[0] == TLM_BUNDLE_ID:
+            handle_telemetry_bundle(payload, src_id, dst_id)
+            return
 
-        # 2️⃣ Deserialize telemetry payload
-        data = deserialize_telemetry(payload)
-        tlm_id = data.get("tlm_id")
-
-        if not isinstance(tlm_id, int):
-            raise ValueError(f"Invalid tlm_id: {tlm_id}")
-
-        # 3️⃣ Resolve telemetry data type
-        data_type = TELEMETRY_TYPE_MAP.get(tlm_id, f"unknown_{tlm_id}")
-
-        # 4️⃣ Dispatch by telemetry type
-        if data_type == "gps":
-            handle_gps_data(data, src_id, data_type)
-        elif data_type == "imu":
-            handle_imu_data(data, src_id, data_type)
-        elif data_type == "battery":
-            handle_battery_data(data, src_id, data_type)
-        elif data_type == "heartbeat":
-            handle_heartbeat_data(data, src_id, data_type)
-        else:
-            logger.warning(f"[TELEMETRY] Unknown telemetry type (tlm_id: {tlm_id}) from SRC: {src_id}")
+        # 3️⃣ Deserialize telemetry payload and dispatch
+        dispatch_telemetry_record(deserialize_telemetry(payload, src_id, dst_id), src_id)
 
     except ValueError as ve:
         logger.error(f"[TELEMETRY] Invalid telemetry format: {ve}")
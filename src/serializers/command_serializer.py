@@ -35,7 +35,7 @@ def deserialize_command(payload: bytes) -> dict:
         raise ValueError("Payload must be at least 1 byte")
 
     command_id = payload[0]
-    params = payload[1:] if len(payload) > 1 else b''
+    params = bytes(payload[1:]) if len(payload) > 1 else b''
 
     logger.debug(f"[COMMAND] DESERIALIZED | CMD_ID: {command_id} | PARAM_LEN: {len(params)}")
 
@@ -1,11 +1,16 @@
 # src/serializers/ftp_serializer.py
 """
 FTP payload serialize/deserialize:
- - START:  [0x00][name_len:2B][name...]
- - CHUNK:  [0x01][seq:3B][data...]
+ - START:  [0x00][name_len:2B][name...][ack_every:1B, opsiyonel]
+ - CHUNK:  [0x01 | ACK_REQUEST][seq:3B][data...]
  - END:    [0x02][total_chunks:3B]
+
+ack_every > 0 ise alıcı chunk başına ACK yerine her ack_every chunk'ta (veya
+ACK_REQUEST bayraklı chunk'ta) tek bir bitmap ACK gönderir. Bitmap:
+base = kesintisiz alınan chunk sayısı (seq < base hepsi alındı), bit i
+(bayt i // 8, bit i % 8, LSB önce) = seq base + 1 + i alındı.
 """
-from typing import Tuple
+from typing import Container, Tuple
 
 FTP_PHASE_IDS = {
     "START": 0x00,
@@ -13,12 +18,24 @@ FTP_PHASE_IDS = {
     "END":   0x02,
 }
 
-def serialize_ftp_start(filename: str) -> bytes:
+# CHUNK faz baytındaki bayrak: gönderici bu chunk için hemen bitmap ACK ister
+FTP_ACK_REQUEST = 0x80
+# Bir bitmap ACK'in kapsadığı en fazla bayt (base üzerindeki 256 chunk)
+MAX_BITMAP_BYTES = 32
+
+def serialize_ftp_start(filename: str, ack_every: int = 0) -> bytes:
     name_b = filename.encode()
-    return bytes([FTP_PHASE_IDS["START"]]) + len(name_b).to_bytes(2, "big") + name_b
+    payload = bytes([FTP_PHASE_IDS["START"]]) + len(name_b).to_bytes(2, "big") + name_b
+    # Eski alıcılar name_len sonrasını okumaz; ack_every=0 eski formatla aynıdır
+    return payload + bytes([ack_every]) if ack_every else payload
+
+def serialize_ftp_chunk(seq: int, data: bytes, ack_request: bool = False) -> bytes:
+    return serialize_ftp_chunk_prefix(seq, ack_request) + data
 
-def serialize_ftp_chunk(seq: int, data: bytes) -> bytes:
-    return bytes([FTP_PHASE_IDS["CHUNK"]]) + seq.to_bytes(3, "big") + data
+def serialize_ftp_chunk_prefix(seq: int, ack_request: bool = False) -> bytes:
+    """CHUNK payload'unun veri öncesi 4 baytı: [0x01 | ACK_REQUEST][seq:3B]."""
+    phase = FTP_PHASE_IDS["CHUNK"] | (FTP_ACK_REQUEST if ack_request else 0)
+    return bytes([phase]) + seq.to_bytes(3, "big")
 
 def serialize_ftp_end(total_chunks: int) -> bytes:
     return bytes([FTP_PHASE_IDS["END"]]) + total_chunks.to_bytes(3, "big")
@@ -27,15 +44,41 @@ def deserialize_ftp_start(payload: bytes) -> str:
     if payload[0] != FTP_PHASE_IDS["START"]:
         raise ValueError("Beklenmeyen faz, START değil")
     name_len = int.from_bytes(payload[1:3], "big")
-    return payload[3:3+name_len].decode()
+    return bytes(payload[3:3+name_len]).decode()
+
+def deserialize_ftp_start_ack_every(payload: bytes) -> int:
+    """START içindeki ack_every (yoksa 0: chunk başına ACK)."""
+    end = 3 + int.from_bytes(payload[1:3], "big")
+    return payload[end] if len(payload) > end else 0
 
 def deserialize_ftp_chunk(payload: bytes) -> Tuple[int, bytes]:
-    if payload[0] != FTP_PHASE_IDS["CHUNK"]:
+    if payload[0] & ~FTP_ACK_REQUEST != FTP_PHASE_IDS["CHUNK"]:
         raise ValueError("Beklenmeyen faz, CHUNK değil")
     seq = int.from_bytes(payload[1:4], "big")
-    return seq, payload[4:]
+    # Payload bir alım tamponu görünümü olabilir; veri saklanacağı için kopyalanır
+    return seq, bytes(payload[4:])
 
 def deserialize_ftp_end(payload: bytes) -> int:
     if payload[0] != FTP_PHASE_IDS["END"]:
         raise ValueError("Beklenmeyen faz, END değil")
     return int.from_bytes(payload[1:4], "big")
+
+def encode_chunk_bitmap(base: int, received: Container[int], highest: int) -> bytes:
+    """
+    base + 1 .. highest aralığında alınmış seq'lerden bitmap üretir (en fazla
+    MAX_BITMAP_BYTES; highest'a kadar gereken bayt sayısı kadar).
+    """
+    last = min(highest, base + MAX_BITMAP_BYTES * 8)
+    bitmap = bytearray((max(last - base, 0) + 7) // 8)
+    for seq in range(base + 1, last + 1):
+        if seq in received:
+            i = seq - base - 1
+            bitmap[i >> 3] |= 1 << (i & 7)
+    return bytes(bitmap)
+
+def bitmap_has_chunk(base: int, bitmap: bytes, seq: int) -> bool:
+    """seq'in (base, bitmap) ile alındı olarak bildirilip bildirilmediği."""
+    if seq < base:
+        return True
+    i = seq - base - 1
+    return 0 <= i < len(bitmap) * 8 and bool(bitmap[i >> 3] >> (i & 7) & 1)
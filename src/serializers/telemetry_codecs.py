@@ -0,0 +1,351 @@
+# src/serializers/telemetry_codecs.py
+"""
+Telemetry codec registry.
+
+Each telemetry type declares its schema once (field names, struct codes,
+units and scaling); the codec compiles it into `struct.Struct` objects at
+import time and generates a `__slots__` record class for decoded values:
+
+    GPS = register_codec(TelemetryCodec(0x01, "gps", (
+        Field("lat", "f", "deg"), Field("lon", "f", "deg"), Field("alt", "f", "m"),
+    )))
+
+    GPS.pack_payload(lat, lon, alt)         -> b"\\x01" + body  (one pack call)
+    GPS.pack_into(buf, offset, lat, ...)    -> writes [tlm_id][body], returns bytes written
+    GPS.decode(body)                        -> GpsRecord(lat=..., lon=..., alt=...)
+    GPS.decode_dict(body)                   -> {"tlm_id": 1, "lat": ..., ...}
+
+Fields are big-endian. A "<n>s" field carries a UTF-8 string padded with
+NUL bytes to n bytes (longer strings are truncated). A field with a scale
+is sent as value * scale (rounded for integer codes) and divided back on
+decode, e.g. Field("temp", "h", "degC", 100) carries 0.01 degC steps.
+
+The registry is the single source for everything else: the telemetry
+handler, builder and dispatcher derive cache writers, `build_tlm_<name>`
+and `send_tlm_<name>` from it (see docs/telemetry/extending_telemetry_format.md).
+"""
+import struct
+from typing import Any, Dict, Mapping, NamedTuple, Optional, Sequence, Tuple, Type, Union
+
+_INTEGER_CODES = frozenset("bBhHiIlLqQ")
+
+# Payload ID of a telemetry bundle (see telemetry_serializer); never a codec
+TLM_BUNDLE_ID = 0x10
+
+# Names used next to field values by builders, senders and the cache
+RESERVED_FIELD_NAMES = frozenset(("tlm_id", "timestamp", "interface", "dst", "src", "compact"))
+
+
+class Field(NamedTuple):
+    """
+    One field of a telemetry schema.
+
+    Attributes:
+        name (str): Field name (cache key and record attribute).
+        code (str): struct format code, e.g. "f", "h", "32s".
+        unit (str): Unit of the decoded value, for docs and logs.
+        scale (float): Wire value = value * scale (1 = sent as is).
+    """
+    name: str
+    code: str
+    unit: str = ""
+    scale: float = 1
+
+
+class TelemetryRecord:
+    """
+    Base class of the generated record classes (one per telemetry type).
+
+    Records hold decoded values in slots instead of a per-record dict;
+    use `as_dict()` where a mapping is needed.
+    """
+    __slots__ = ()
+    tlm_id: int = 0
+    fields: Tuple[str, ...] = ()
+
+    def as_tuple(self) -> Tuple[Any, ...]:
+        return tuple(getattr(self, name) for name in self.fields)
+
+    def as_dict(self) -> Dict[str, Any]:
+        result: Dict[str, Any] = {"tlm_id": self.tlm_id}
+        result.update(zip(self.fields, self.as_tuple()))
+        return result
+
+    def __eq__(self, other: object) -> bool:
+        return type(self) is type(other) and self.as_tuple() == other.as_tuple()
+
+    def __repr__(self) -> str:
+        values = ", ".join(f"{name}={getattr(self, name)!r}" for name in self.fields)
+        return f"{type(self).__name__}({values})"
+
+
+def make_record_class(class_name: str, tlm_id: int, fields: Sequence[str]) -> Type[TelemetryRecord]:
+    """
+    Create a `__slots__` record class for a telemetry schema.
+
+    Args:
+        class_name (str): Name of the class, e.g. "GpsRecord".
+        tlm_id (int): Telemetry type ID reported by the records.
+        fields (Sequence[str]): Field names, in wire order.
+
+    Returns:
+        type: TelemetryRecord subclass taking the field values positionally.
+    """
+    for name in fields:
+        if not name.isidentifier() or name.startswith("_") or name in RESERVED_FIELD_NAMES:
+            raise ValueError(f"Invalid telemetry field name: {name!r}")
+
+    # The initialiser is generated (as namedtuple does) so construction is
+    # plain slot assignments rather than a setattr loop.
+    args = ", ".join(fields)
+    body = "".join(f"\n    self.{name} = {name}" for name in fields) or "\n    pass"
+    namespace: Dict[str, Any] = {}
+    exec(f"def __init__(self, {args}):{body}", namespace)
+
+    return type(class_name, (TelemetryRecord,), {
+        "__slots__": tuple(fields),
+        "__init__": namespace["__init__"],
+        "tlm_id": tlm_id,
+        "fields": tuple(fields),
+    })
+
+
+class TelemetryCodec:
+    """
+    Precompiled encoder/decoder for one telemetry type.
+
+    Attributes:
+        tlm_id (int): Telemetry type ID (the payload's first byte).
+        name (str): Type name used as the cache key (e.g. "gps").
+        label (str): Name used in log messages (e.g. "GPS").
+        schema (Tuple[Field, ...]): Field definitions in wire order.
+        fields (Tuple[str, ...]): Field names in wire order.
+        body (struct.Struct): Layout of the record body.
+        payload (struct.Struct): Layout of tlm_id byte + body.
+        record_class (type): Generated TelemetryRecord subclass.
+    """
+
+    def __init__(
+        self,
+        tlm_id: int,
+        name: str,
+        schema: Sequence[Union[Field, Tuple]],
+        record_name: Optional[str] = None,
+        label: Optional[str] = None
+    ) -> None:
+        """
+        Args:
+            tlm_id (int): Telemetry type ID (0x00..0x7F; the high bit marks compact payloads).
+            name (str): Type name, e.g. "gps".
+            schema (Sequence[Field | tuple]): Fields in wire order; plain
+                (name, code[, unit[, scale]]) tuples are accepted.
+            record_name (str | None): Record class name; defaults to "<Name>Record".
+            label (str | None): Log name; defaults to name.upper().
+        """
+        if not 0 <= tlm_id < 0x80:
+            raise ValueError(f"Telemetry type ID out of range: {tlm_id}")
+        self.tlm_id = tlm_id
+        self.name = name
+        self.label = label or name.upper()
+        self.schema = tuple(Field(*spec) for spec in schema)
+        self.fields = tuple(field.name for field in self.schema)
+        codes = "".join(field.code for field in self.schema)
+        self.body = struct.Struct(">" + codes)
+        self.payload = struct.Struct(">B" + codes)
+        self.size = self.body.size
+        # Positions of string fields, converted between str and padded bytes
+        self._text = tuple(i for i, field in enumerate(self.schema) if field.code.endswith("s"))
+        # (position, scale, rounded) of scaled numeric fields
+        self._scaled = tuple(
+            (i, field.scale, field.code[-1] in _INTEGER_CODES)
+            for i, field in enumerate(self.schema) if field.scale != 1
+        )
+        self._convert = bool(self._text or self._scaled)
+        self._keys = ("tlm_id",) + self.fields
+        self.record_class = make_record_class(
+            record_name or f"{name.title().replace('_', '')}Record", tlm_id, self.fields
+        )
+
+    def _to_wire(self, params: Sequence[Any]) -> Sequence[Any]:
+        values = list(params)
+        for i in self._text:
+            values[i] = values[i].encode("utf-8")
+        for i, scale, rounded in self._scaled:
+            values[i] = round(values[i] * scale) if rounded else values[i] * scale
+        return values
+
+    def _bad_values(self, params: Sequence[Any], error: Exception) -> ValueError:
+        return ValueError(f"Bad {self.name} telemetry values {tuple(params)} for {self.fields}: {error}")
+
+    def _bad_length(self, data) -> ValueError:
+        return ValueError(f"Bad {self.name} telemetry length: {len(data)}B (expected {self.size}B)")
+
+    def pack(self, *params: Any) -> bytes:
+        """Serialize the record body (without the tlm_id byte)."""
+        try:
+            return self.body.pack(*(self._to_wire(params) if self._convert else params))
+        except (struct.error, IndexError) as e:
+            raise self._bad_values(params, e) from None
+
+    def pack_payload(self, *params: Any) -> bytes:
+        """Serialize tlm_id byte + body in a single pack call."""
+        try:
+            return self.payload.pack(self.tlm_id, *(self._to_wire(params) if self._convert else params))
+        except (struct.error, IndexError) as e:
+            raise self._bad_values(params, e) from None
+
+    def pack_into(self, buffer, offset: int, *params: Any) -> int:
+        """
+        Write tlm_id byte + body into a caller-provided buffer.
+
+        Args:
+            buffer (bytearray | memoryview): Writable buffer.
+            offset (int): Position of the tlm_id byte.
+            *params: Field values in schema order.
+
+        Returns:
+            int: Number of bytes written (1 + size).
+        """
+        try:
+            self.payload.pack_into(
+                buffer, offset, self.tlm_id, *(self._to_wire(params) if self._convert else params)
+            )
+        except (struct.error, IndexError) as e:
+            raise self._bad_values(params, e) from None
+        return self.payload.size
+
+    def unpack(self, data) -> Tuple[Any, ...]:
+        """Decode a record body into a tuple of field values."""
+        if len(data) != self.size:
+            raise self._bad_length(data)
+        values = self.body.unpack(data)
+        if not self._convert:
+            return values
+        values = list(values)
+        for i in self._text:
+            values[i] = values[i].decode("utf-8").rstrip("\x00")
+        for i, scale, _rounded in self._scaled:
+            values[i] = values[i] / scale
+        return tuple(values)
+
+    def decode(self, data) -> TelemetryRecord:
+        """Decode a record body into an instance of `record_class`."""
+        return self.record_class(*self.unpack(data))
+
+    def decode_dict(self, data) -> Dict[str, Any]:
+        """Decode a record body into {"tlm_id": ..., <field>: ...}."""
+        return dict(zip(self._keys, (self.tlm_id,) + self.unpack(data)))
+
+    def bind(self, values: Union[Sequence[Any], Mapping[str, Any]] = (), **named: Any) -> Tuple[Any, ...]:
+        """
+        Order field values by the schema.
+
+        Args:
+            values (Sequence | Mapping): Values in schema order, or a name -> value mapping.
+            **named: Values by field name (combined with a positional prefix).
+
+        Returns:
+            tuple: One value per field, in wire order.
+
+        Raises:
+            ValueError: On missing, duplicate or unknown fields.
+        """
+        if isinstance(values, Mapping):
+            named = {**values, **named}
+            values = ()
+        if not named:
+            if len(values) != len(self.fields):
+                raise ValueError(f"{self.label} telemetry takes {len(self.fields)} values {self.fields}, got {len(values)}")
+            return tuple(values)
+
+        unknown = set(named) - set(self.fields)
+        if unknown:
+            raise ValueError(f"Unknown {self.label} telemetry fields: {sorted(unknown)}")
+        bound = list(values)
+        for name in self.fields[len(bound):]:
+            if name not in named:
+                raise ValueError(f"Missing {self.label} telemetry field: {name}")
+            bound.append(named.pop(name))
+        if named:
+            raise ValueError(f"{self.label} telemetry fields given twice: {sorted(named)}")
+        return tuple(bound)
+
+    def describe(self, data: Mapping[str, Any]) -> str:
+        """Format decoded values with their units, for log messages."""
+        parts = []
+        for field in self.schema:
+            value = data[field.name]
+            text = f"{value:.6g}" if isinstance(value, float) else str(value)
+            parts.append(f"{field.name.upper()}: {text}{' ' + field.unit if field.unit else ''}")
+        return ", ".join(parts)
+
+
+# 🔹 Registry: telemetry type ID -> codec, and type name -> codec
+TELEMETRY_CODECS: Dict[int, TelemetryCodec] = {}
+TELEMETRY_CODECS_BY_NAME: Dict[str, TelemetryCodec] = {}
+
+
+def register_codec(codec: TelemetryCodec) -> TelemetryCodec:
+    """
+    Add a codec to the registry.
+
+    Args:
+        codec (TelemetryCodec): Codec whose tlm_id and name are not registered yet.
+
+    Returns:
+        TelemetryCodec: The same codec, for module-level assignment.
+    """
+    if codec.tlm_id in TELEMETRY_CODECS:
+        raise ValueError(f"Telemetry type ID already registered: {codec.tlm_id}")
+    if codec.tlm_id == TLM_BUNDLE_ID:
+        raise ValueError(f"Telemetry type ID {TLM_BUNDLE_ID} is reserved for bundles")
+    if codec.name in TELEMETRY_CODECS_BY_NAME:
+        raise ValueError(f"Telemetry type name already registered: {codec.name}")
+    TELEMETRY_CODECS[codec.tlm_id] = codec
+    TELEMETRY_CODECS_BY_NAME[codec.name] = codec
+    return codec
+
+
+def get_codec(tlm: Union[int, str]) -> TelemetryCodec:
+    """
+    Look up the codec of a telemetry type.
+
+    Args:
+        tlm (int | str): Telemetry type ID or type name (e.g. 0x01 or "gps").
+
+    Raises:
+        ValueError: If the type is not registered.
+    """
+    codec = TELEMETRY_CODECS_BY_NAME.get(tlm) if isinstance(tlm, str) else TELEMETRY_CODECS.get(tlm)
+    if codec is None:
+        raise ValueError(f"Unsupported telemetry type ID: {tlm}")
+    return codec
+
+
+GPS = register_codec(TelemetryCodec(0x01, "gps", (
+    Field("lat", "f", "deg"),
+    Field("lon", "f", "deg"),
+    Field("alt", "f", "m"),
+)))
+IMU = register_codec(TelemetryCodec(0x02, "imu", (
+    Field("roll", "f", "deg"),
+    Field("pitch", "f", "deg"),
+    Field("yaw", "f", "deg"),
+)))
+BATTERY = register_codec(TelemetryCodec(0x03, "battery", (
+    Field("voltage", "f", "V"),
+    Field("current", "f", "A"),
+    Field("level", "f", "%"),
+)))
+HEARTBEAT = register_codec(TelemetryCodec(0x04, "heartbeat", (
+    Field("mode", "32s"),
+    Field("health", "32s"),
+    Field("is_armed", "?"),
+    Field("gps_fix", "?"),
+    Field("sat_count", "B"),
+)))
+
+GpsRecord = GPS.record_class
+ImuRecord = IMU.record_class
+BatteryRecord = BATTERY.record_class
+HeartbeatRecord = HEARTBEAT.record_class
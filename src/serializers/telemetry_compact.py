@@ -0,0 +1,276 @@
+# src/serializers/telemetry_compact.py
+"""
+Compact telemetry encoding (optional, for constrained radios).
+
+A compact payload sets the high bit of tlm_id (COMPACT_FLAG); the low bits
+keep the normal telemetry ID, so receivers recognise the format per frame
+and legacy payloads keep working side by side.
+
+ - GPS (0x81):       [hdr][body]  hdr = kind<<6 | seq (4 bit)
+                       KEY:     lat, lon (int32, 1e-7 deg), alt (int32, mm)   12B
+                       DELTA16: dlat, dlon, dalt (int16, same units)           6B
+                       DELTA8:  dlat, dlon, dalt (int8,  same units)           3B
+                     Deltas are taken against the previous GPS value sent to the
+                     same destination (receivers track each source/destination
+                     pair); seq lets the receiver detect a lost frame and ignore
+                     deltas until the next KEY frame.
+ - IMU (0x82):       roll, pitch, yaw (int16, 0.02 deg)                       6B
+ - BATTERY (0x83):   voltage (uint16, mV), current (int16, 10 mA), level (uint8, 0.5 %)
+ - HEARTBEAT (0x84): mode, health (enum codes), flags (armed, gps_fix), sat_count  4B
+
+Values that cannot be represented (unknown mode string, out-of-range value)
+make the encoder return None; the caller then sends the legacy payload.
+"""
+import struct
+import threading
+from typing import Any, Dict, Optional, Sequence, Tuple
+
+COMPACT_FLAG = 0x80
+
+TLM_GPS = 0x01
+TLM_IMU = 0x02
+TLM_BATTERY = 0x03
+TLM_HEARTBEAT = 0x04
+
+# GPS kinds (hdr bits 7-6)
+GPS_KEY = 0
+GPS_DELTA16 = 1
+GPS_DELTA8 = 2
+
+# A KEY frame is forced at least this often per destination
+DEFAULT_KEYFRAME_INTERVAL = 10
+
+LATLON_SCALE = 10_000_000   # 1e-7 deg
+ALT_SCALE = 1000            # mm
+IMU_SCALE = 50              # 0.02 deg
+VOLT_SCALE = 1000           # mV
+CURR_SCALE = 100            # 10 mA
+LEVEL_SCALE = 2             # 0.5 %
+
+_GPS_KEY = struct.Struct(">Biii")
+_GPS_D16 = struct.Struct(">Bhhh")
+_GPS_D8 = struct.Struct(">Bbbb")
+_IMU = struct.Struct(">hhh")
+_BATTERY = struct.Struct(">HhB")
+_HEARTBEAT = struct.Struct(">BBBB")
+
+# Enum tables (code = index). Append only: codes are on the wire.
+MODE_NAMES: Tuple[str, ...] = (
+    "UNKNOWN", "STABILIZE", "ACRO", "ALT_HOLD", "AUTO", "GUIDED", "LOITER",
+    "RTL", "CIRCLE", "LAND", "DRIFT", "SPORT", "FLIP", "AUTOTUNE", "POSHOLD",
+    "BRAKE", "THROW", "GUIDED_NOGPS", "SMART_RTL", "MANUAL", "FBWA", "FBWB",
+    "CRUISE", "TAKEOFF", "QSTABILIZE", "QHOVER", "QLOITER", "QLAND", "QRTL",
+)
+HEALTH_NAMES: Tuple[str, ...] = ("UNKNOWN", "OK", "WARN", "ERROR", "CRITICAL")
+
+_MODE_CODES = {name: code for code, name in enumerate(MODE_NAMES)}
+_HEALTH_CODES = {name: code for code, name in enumerate(HEALTH_NAMES)}
+
+_I8 = (-128, 127)
+_I16 = (-32768, 32767)
+_I32 = (-2**31, 2**31 - 1)
+
+
+def is_compact(tlm_byte: int) -> bool:
+    """True if a tlm_id byte carries the compact encoding bit."""
+    return bool(tlm_byte & COMPACT_FLAG)
+
+
+def _fits(values: Sequence[int], bounds: Tuple[int, int]) -> bool:
+    lo, hi = bounds
+    return all(lo <= v <= hi for v in values)
+
+
+def _quantise_gps(lat: float, lon: float, alt: float) -> Tuple[int, int, int]:
+    return round(lat * LATLON_SCALE), round(lon * LATLON_SCALE), round(alt * ALT_SCALE)
+
+
+def _gps_fields(q: Sequence[int]) -> Dict[str, float]:
+    return {"lat": q[0] / LATLON_SCALE, "lon": q[1] / LATLON_SCALE, "alt": q[2] / ALT_SCALE}
+
+
+class CompactTelemetryEncoder:
+    """
+    Sender side: holds the last GPS value sent to each destination.
+    """
+
+    def __init__(self, keyframe_interval: int = DEFAULT_KEYFRAME_INTERVAL) -> None:
+        self.keyframe_interval = keyframe_interval
+        # dst -> [ref (lat, lon, alt), seq, frames since KEY]
+        self._gps: Dict[int, list] = {}
+        self._lock = threading.Lock()
+
+    def reset(self, dst: Optional[int] = None) -> None:
+        """Forget delta state (for one destination, or all); the next GPS frame is a KEY."""
+        with self._lock:
+            if dst is None:
+                self._gps.clear()
+            else:
+                self._gps.pop(dst, None)
+
+    def encode(self, tlm_id: int, params: Sequence[Any], dst: int = 0xFF) -> Optional[bytes]:
+        """
+        Compact payload for a telemetry record, or None if not representable.
+
+        Args:
+            tlm_id (int): Telemetry type ID (0x01..0x04).
+            params (Sequence[Any]): Same ordered parameters as serialize_telemetry.
+            dst (int): Destination ID the GPS delta state is kept for.
+
+        Returns:
+            bytes | None: [tlm_id | COMPACT_FLAG] + body, or None.
+        """
+        if tlm_id == TLM_GPS:
+            body = self._encode_gps(_quantise_gps(*params), dst)
+        elif tlm_id == TLM_IMU:
+            q = [round(v * IMU_SCALE) for v in params]
+            body = _IMU.pack(*q) if _fits(q, _I16) else None
+        elif tlm_id == TLM_BATTERY:
+            volt, curr, level = params
+            q = (round(volt * VOLT_SCALE), round(curr * CURR_SCALE), round(level * LEVEL_SCALE))
+            ok = 0 <= q[0] <= 0xFFFF and _fits(q[1:2], _I16) and 0 <= q[2] <= 0xFF
+            body = _BATTERY.pack(*q) if ok else None
+        elif tlm_id == TLM_HEARTBEAT:
+            mode, health, is_armed, gps_fix, sat_count = params
+            mode_code = _MODE_CODES.get(mode)
+            health_code = _HEALTH_CODES.get(health)
+            if mode_code is None or health_code is None or not 0 <= sat_count <= 0xFF:
+                body = None
+            else:
+                flags = (1 if is_armed else 0) | (2 if gps_fix else 0)
+                body = _HEARTBEAT.pack(mode_code, health_code, flags, sat_count)
+        else:
+            body = None
+
+        if body is None:
+            return None
+        return bytes((tlm_id | COMPACT_FLAG,)) + body
+
+    def _encode_gps(self, q: Tuple[int, int, int], dst: int) -> Optional[bytes]:
+        if not _fits(q, _I32):
+            return None
+        with self._lock:
+            state = self._gps.get(dst)
+            if state is None:
+                state = self._gps[dst] = [q, -1, self.keyframe_interval]
+            ref, seq, since_key = state
+            seq = (seq + 1) & 0x0F
+            delta = (q[0] - ref[0], q[1] - ref[1], q[2] - ref[2])
+
+            if since_key + 1 >= self.keyframe_interval:
+                body, since_key = _GPS_KEY.pack(GPS_KEY << 6 | seq, *q), 0
+            elif _fits(delta, _I8):
+                body, since_key = _GPS_D8.pack(GPS_DELTA8 << 6 | seq, *delta), since_key + 1
+            elif _fits(delta, _I16):
+                body, since_key = _GPS_D16.pack(GPS_DELTA16 << 6 | seq, *delta), since_key + 1
+            else:
+                body, since_key = _GPS_KEY.pack(GPS_KEY << 6 | seq, *q), 0
+
+            state[:] = [q, seq, since_key]
+        return body
+
+
+class CompactTelemetryDecoder:
+    """
+    Receiver side: holds the last GPS value received on each (source,
+    destination) stream. The encoder keeps one delta stream per destination,
+    so broadcast and unicast GPS from the same sender are tracked apart.
+    """
+
+    def __init__(self) -> None:
+        # (src, dst) -> (ref (lat, lon, alt), seq)
+        self._gps: Dict[Tuple[Optional[int], Optional[int]], Tuple[Tuple[int, int, int], int]] = {}
+        self._lock = threading.Lock()
+
+    def reset(self, src: Optional[int] = None) -> None:
+        """Forget delta state (for every stream of one source, or all)."""
+        with self._lock:
+            if src is None:
+                self._gps.clear()
+            else:
+                for key in [k for k in self._gps if k[0] == src]:
+                    del self._gps[key]
+
+    def decode(self, payload: bytes, src: Optional[int] = None, dst: Optional[int] = None) -> Dict[str, Any]:
+        """
+        Decode a compact payload into the same fields as the legacy format.
+
+        Args:
+            payload (bytes): [tlm_id | COMPACT_FLAG] + body.
+            src (int | None): Source ID of the frame.
+            dst (int | None): Destination ID of the frame; GPS delta state is
+                kept per (src, dst), matching the sender's per-destination state.
+
+        Returns:
+            dict: {"tlm_id": <plain id>, ...fields}.
+
+        Raises:
+            ValueError: Unknown type, bad length, or a GPS delta whose
+                reference was lost (wait for the next KEY frame).
+        """
+        return self.decode_record(payload[0], payload[1:], src, dst)
+
+    def decode_record(self, tlm_byte: int, body: bytes, src: Optional[int] = None,
+                      dst: Optional[int] = None) -> Dict[str, Any]:
+        """
+        Decode a compact record given its tlm_id byte and body separately
+        (as stored in a telemetry bundle); see decode().
+        """
+        tlm_id = tlm_byte & ~COMPACT_FLAG
+        try:
+            fields = self._decode_body(tlm_id, body, (src, dst))
+        except struct.error as e:
+            raise ValueError(f"Bad compact telemetry length (tlm_id: {tlm_id}): {e}")
+
+        result: Dict[str, Any] = {"tlm_id": tlm_id}
+        result.update(fields)
+        return result
+
+    def _decode_body(self, tlm_id: int, body: bytes, stream: Tuple) -> Dict[str, Any]:
+        if tlm_id == TLM_GPS:
+            fields = self._decode_gps(body, stream)
+        elif tlm_id == TLM_IMU:
+            roll, pitch, yaw = _IMU.unpack(body)
+            fields = {"roll": roll / IMU_SCALE, "pitch": pitch / IMU_SCALE, "yaw": yaw / IMU_SCALE}
+        elif tlm_id == TLM_BATTERY:
+            volt, curr, level = _BATTERY.unpack(body)
+            fields = {"voltage": volt / VOLT_SCALE, "current": curr / CURR_SCALE, "level": level / LEVEL_SCALE}
+        elif tlm_id == TLM_HEARTBEAT:
+            mode_code, health_code, flags, sat_count = _HEARTBEAT.unpack(body)
+            fields = {
+                "mode": MODE_NAMES[mode_code] if mode_code < len(MODE_NAMES) else MODE_NAMES[0],
+                "health": HEALTH_NAMES[health_code] if health_code < len(HEALTH_NAMES) else HEALTH_NAMES[0],
+                "is_armed": bool(flags & 1),
+                "gps_fix": bool(flags & 2),
+                "sat_count": sat_count,
+            }
+        else:
+            raise ValueError(f"Unsupported compact telemetry type ID: {tlm_id}")
+        return fields
+
+    def _decode_gps(self, body: bytes, stream: Tuple) -> Dict[str, float]:
+        hdr = body[0]
+        kind, seq = hdr >> 6, hdr & 0x0F
+
+        with self._lock:
+            if kind == GPS_KEY:
+                q = _GPS_KEY.unpack(body)[1:]
+            else:
+                if kind not in (GPS_DELTA16, GPS_DELTA8):
+                    raise ValueError(f"Unknown compact GPS kind: {kind}")
+                layout = _GPS_D16 if kind == GPS_DELTA16 else _GPS_D8
+                state = self._gps.get(stream)
+                if state is None or (state[1] + 1) & 0x0F != seq:
+                    # Previous frame lost: deltas are unusable until the next KEY
+                    self._gps.pop(stream, None)
+                    raise ValueError(f"Compact GPS delta without reference from SRC: {stream[0]} (DST: {stream[1]})")
+                ref = state[0]
+                delta = layout.unpack(body)[1:]
+                q = (ref[0] + delta[0], ref[1] + delta[1], ref[2] + delta[2])
+            self._gps[stream] = (q, seq)
+        return _gps_fields(q)
+
+
+# Shared per-process state used by serialize_telemetry / deserialize_telemetry
+compact_encoder = CompactTelemetryEncoder()
+compact_decoder = CompactTelemetryDecoder()
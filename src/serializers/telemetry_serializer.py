@@ -1,45 +1,22 @@
-import struct
+from typing import Iterator, Sequence, Tuple
+from src.serializers.telemetry_codecs import TELEMETRY_CODECS, TLM_BUNDLE_ID, TelemetryRecord, get_codec
+from src.serializers.telemetry_compact import COMPACT_FLAG, compact_encoder, compact_decoder
 from src.tools.log.logger import logger
 
-# 🔹 TELEMETRY_CODECS maps each telemetry type ID (tlm_id) to its
-# corresponding serialization and deserialization logic.
-# This allows modular handling of multiple telemetry types.
-
-TELEMETRY_CODECS = {
-    0x01: {  # GPS (latitude, longitude, altitude)
-        "serialize": lambda *p: struct.pack(">3f", *p),
-        "deserialize": lambda data: dict(zip(["lat", "lon", "alt"], struct.unpack(">3f", data)))
-    },
-    0x02: {  # IMU (roll, pitch, yaw)
-        "serialize": lambda *p: struct.pack(">3f", *p),
-        "deserialize": lambda data: dict(zip(["roll", "pitch", "yaw"], struct.unpack(">3f", data)))
-    },
-    0x03: {  # BATTERY (voltage, current, level)
-        "serialize": lambda *p: struct.pack(">3f", *p),
-        "deserialize": lambda data: dict(zip(["voltage", "current", "level"], struct.unpack(">3f", data)))
-    },
-    0x04: {  # HEARTBEAT (mode:str, health:str, is_armed:bool, gps_fix:bool, sat_count:int)
-        "serialize": lambda *p: (
-            p[0].encode("utf-8")[:32].ljust(32, b'\x00') +  # mode (32 bytes)
-            p[1].encode("utf-8")[:32].ljust(32, b'\x00') +  # health (32 bytes)
-            struct.pack(">??B", *p[2:])                    # is_armed, gps_fix, sat_count
-        ),
-        "deserialize": lambda data: {
-            "mode": data[:32].decode("utf-8").rstrip('\x00'),
-            "health": data[32:64].decode("utf-8").rstrip('\x00'),
-            **dict(zip(
-                ["is_armed", "gps_fix", "sat_count"],
-                struct.unpack(">??B", data[64:67])
-            ))
-        }
-    }
-}
-
-
-def serialize_telemetry(tlm_id: int, *params) -> bytes:
+# 🔹 Bundle telemetry ID (TLM_BUNDLE_ID): several telemetry records in one frame
+#    [0x10][count:1B] + count x [tlm_id:1B][len:1B][body:len B]
+
+# 🔹 TELEMETRY_CODECS maps each telemetry type ID (tlm_id) to its precompiled
+# codec (see telemetry_codecs); new types are added with register_codec().
+
+
+def serialize_telemetry(tlm_id: int, *params, compact: bool = False, dst: int = 0xFF) -> bytes:
     """
     Serializes telemetry data based on telemetry type ID.
 
+    With compact=True the compact encoding (see telemetry_compact) is used
+    when the values are representable; otherwise the legacy layout is sent.
+
     Parameters:
         tlm_id (int): Telemetry Type ID (e.g., 0x01 = GPS, 0x04 = HEARTBEAT)
         *params (tuple): Ordered parameters to serialize for the given type.
@@ -47,15 +24,23 @@ def serialize_telemetry(tlm_id: int, *params) -> bytes:
                          - IMU: (roll, pitch, yaw)
                          - BATTERY: (voltage, current, level)
                          - HEARTBEAT: (mode, health, is_armed, gps_fix, sat_count, timestamp)
+        compact (bool): Use the compact encoding if possible.
+        dst (int): Destination ID (compact GPS keeps delta state per destination).
 
     Returns:
         bytes: Serialized byte stream (1 byte tlm_id + payload)
     """
-    if tlm_id not in TELEMETRY_CODECS:
-        raise ValueError(f"Unsupported telemetry type ID: {tlm_id}")
+    codec = get_codec(tlm_id)
+
+    if compact:
+        full_frame = compact_encoder.encode(tlm_id, params, dst)
+        if full_frame is not None:
+            logger.debug(
+                f"[TELEMETRY] SERIALIZED (COMPACT) | TLM_ID: {tlm_id} | PARAMS: {params} | SIZE: {len(full_frame)}B"
+            )
+            return full_frame
 
-    payload = TELEMETRY_CODECS[tlm_id]["serialize"](*params)
-    full_frame = struct.pack(">B", tlm_id) + payload
+    full_frame = codec.pack_payload(*params)
 
     logger.debug(
         f"[TELEMETRY] SERIALIZED | TLM_ID: {tlm_id} | PARAMS: {params} | SIZE: {len(full_frame)}B"
@@ -63,29 +48,114 @@ def serialize_telemetry(tlm_id: int, *params) -> bytes:
     return full_frame
 
 
-def deserialize_telemetry(payload: bytes) -> dict:
+def deserialize_telemetry(payload: bytes, src_id: int | None = None, dst_id: int | None = None) -> dict:
     """
     Deserializes a telemetry byte stream into a structured dictionary.
 
+    Compact payloads (tlm_id high bit set) are decoded to the same fields;
+    'tlm_id' in the result is always the plain telemetry type ID.
+
     Parameters:
         payload (bytes): Byte stream containing telemetry type ID + binary payload.
+        src_id (int | None): Sender ID (compact GPS keeps delta state per source/destination).
+        dst_id (int | None): Frame destination ID (0xFF for broadcast).
 
     Returns:
         dict: Dictionary containing 'tlm_id' and all parsed telemetry fields.
               Example for GPS: {'tlm_id': 1, 'lat': ..., 'lon': ..., 'alt': ...}
     """
-    tlm_id = payload[0]
-    data = payload[1:]
-
-    if tlm_id not in TELEMETRY_CODECS:
-        raise ValueError(f"Unsupported telemetry type ID: {tlm_id}")
-
-    decoded = TELEMETRY_CODECS[tlm_id]["deserialize"](data)
+    result = decode_telemetry_record(payload[0], payload[1:], src_id, dst_id)
 
     logger.debug(
-        f"[TELEMETRY] DESERIALIZED | TLM_ID: {tlm_id} | FIELDS: {list(decoded.keys())} | SIZE: {len(payload)}B"
+        f"[TELEMETRY] DESERIALIZED | TLM_ID: {result['tlm_id']} | FIELDS: {list(result.keys())} | SIZE: {len(payload)}B"
     )
-
-    result = {"tlm_id": tlm_id}
-    result.update(decoded)
     return result
+
+
+def decode_telemetry_record(tlm_byte: int, data: bytes, src_id: int | None = None,
+                            dst_id: int | None = None) -> dict:
+    """
+    Decodes one telemetry record given its tlm_id byte and body.
+
+    Parameters:
+        tlm_byte (int): tlm_id byte as sent (compact bit included).
+        data (bytes): Record body (without the tlm_id byte).
+        src_id (int | None): Sender ID (compact GPS keeps delta state per source/destination).
+        dst_id (int | None): Frame destination ID (0xFF for broadcast).
+
+    Returns:
+        dict: {'tlm_id': <plain id>, ...fields}.
+    """
+    if tlm_byte & COMPACT_FLAG:
+        return compact_decoder.decode_record(tlm_byte, data, src_id, dst_id)
+
+    return get_codec(tlm_byte).decode_dict(data)
+
+
+def decode_telemetry(payload) -> TelemetryRecord:
+    """
+    Decodes a legacy telemetry payload into a slotted record object
+    (e.g. GpsRecord) instead of a dict.
+
+    Parameters:
+        payload (bytes | memoryview): Telemetry type ID + binary payload.
+
+    Returns:
+        TelemetryRecord: Record of the payload's telemetry type.
+    """
+    return get_codec(payload[0]).decode(payload[1:])
+
+
+def serialize_tlm_bundle(payloads: Sequence[bytes]) -> bytes:
+    """
+    Packs several serialized telemetry payloads into one bundle payload.
+
+    Parameters:
+        payloads (Sequence[bytes]): Outputs of serialize_telemetry (tlm_id + body).
+
+    Returns:
+        bytes: [TLM_BUNDLE_ID][count] + [tlm_id][len][body] per record.
+    """
+    if not 0 < len(payloads) <= 0xFF:
+        raise ValueError(f"Bundle must hold 1..255 records, got {len(payloads)}")
+
+    parts = [bytes((TLM_BUNDLE_ID, len(payloads)))]
+    for payload in payloads:
+        body_len = len(payload) - 1
+        if body_len > 0xFF:
+            raise ValueError(f"Telemetry record too long for bundle: {body_len}B (tlm_id: {payload[0]})")
+        parts.append(bytes((payload[0], body_len)))
+        parts.append(payload[1:])
+    bundle = b"".join(parts)
+
+    logger.debug(f"[TELEMETRY] SERIALIZED BUNDLE | RECORDS: {len(payloads)} | SIZE: {len(bundle)}B")
+    return bundle
+
+
+def iter_tlm_bundle(payload) -> Iterator[Tuple[int, memoryview]]:
+    """
+    Iterates over the records of a bundle payload without copying.
+
+    Parameters:
+        payload (bytes | memoryview): Bundle payload starting with TLM_BUNDLE_ID.
+
+    Yields:
+        Tuple[int, memoryview]: (tlm_id byte, record body) per record.
+
+    Raises:
+        ValueError: If the bundle is truncated or not a bundle.
+    """
+    view = payload if isinstance(payload, memoryview) else memoryview(payload)
+    if len(view) < 2 or view[0] != TLM_BUNDLE_ID:
+        raise ValueError("Not a telemetry bundle")
+
+    count, offset, total = view[1], 2, len(view)
+    for _ in range(count):
+        if offset + 2 > total:
+            raise ValueError("Truncated telemetry bundle header")
+        tlm_byte, body_len = view[offset], view[offset + 1]
+        start = offset + 2
+        offset = start + body_len
+        if offset > total:
+            raise ValueError(f"Truncated telemetry bundle record (tlm_id: {tlm_byte})")
+        yield tlm_byte, view[start:offset]
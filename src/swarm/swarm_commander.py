@@ -4,7 +4,7 @@ import time
 from src.serializers.swarm_serializer import serialize_swarm_command
 from src.core.frame_codec import build_mesh_frame
 from src.tools.comm.transmitter import send_frame
-from src.core.frame_codec import load_device_id
+from src.core.protocol_context import resolve_context
 
 def send_goto(uart, drone_id: int, lat: float, lon: float, alt: float, delay_sec: int = 5, task_id: int = 42):
     """
@@ -33,15 +33,16 @@ def send_goto(uart, drone_id: int, lat: float, lon: float, alt: float, delay_sec
         p3=alt
     )
 
-    # Cihaz ID'sini config.json'dan al
-    src_id = load_device_id()
+    # Cihaz ID'sini arayüzün protokol context'inden al (config bir kez okunur)
+    context = resolve_context(uart)
 
     # Frame'i oluştur ve gönder
     frame = build_mesh_frame(
         frame_type='S',
-        src_id=src_id,
+        src_id=context.device_id,
         dst_id=drone_id,
-        payload=payload
+        payload=payload,
+        context=context
     )
 
     send_frame(uart, frame)
@@ -9,7 +9,8 @@ encapsulating the serialized acknowledgment payload.
 
 from typing import Optional
 
-from src.core.frame_codec import build_mesh_frame, load_device_id
+from src.core.frame_codec import build_mesh_frame
+from src.core.protocol_context import ProtocolContext, get_protocol_context
 from src.serializers.ack_serializer import serialize_ack
 
 
@@ -18,7 +19,8 @@ def build_ack_frame(
     target_id: int,
     success: bool = True,
     status_code: int = 0,
-    src: Optional[int] = None
+    src: Optional[int] = None,
+    context: Optional[ProtocolContext] = None
 ) -> bytes:
     """
     Build an ACK or NACK mesh frame for a given command.
@@ -28,11 +30,13 @@ def build_ack_frame(
         target_id (int): Destination node ID for the ACK/NACK.
         success (bool, optional): True to build an ACK, False for a NACK. Defaults to True.
         status_code (int, optional): Status or error code (default: 0 for SUCCESS).
-        src (int | None, optional): Source device ID; if None, loaded via load_device_id().
+        src (int | None, optional): Source device ID; if None, taken from the protocol context.
+        context (ProtocolContext | None, optional): Protocol context of the link; the shared default if None.
 
     Returns:
         bytes: A type-'A' mesh frame containing the serialized ACK/NACK payload.
     """
-    source = src if src is not None else load_device_id()
+    ctx = context if context is not None else get_protocol_context()
+    source = src if src is not None else ctx.device_id
     payload = serialize_ack(command_id, status_code, is_ack=success)
-    return build_mesh_frame('A', source, target_id, payload)
+    return build_mesh_frame('A', source, target_id, payload, context=ctx)
@@ -7,8 +7,9 @@ Constructs and sends ACK/NACK frames for both general commands and FTP transfers
 and logs each transmission.
 """
 
+from src.core.protocol_context import resolve_context
 from src.tools.ack.ack_builder import build_ack_frame
-from src.tools.ack.ftp_ack_builder import build_ftp_ack_frame
+from src.tools.ack.ftp_ack_builder import build_ftp_ack_frame, build_ftp_bitmap_ack_frame
 from src.tools.comm.transmitter import send_frame
 from src.tools.log.logger import logger
 
@@ -39,7 +40,7 @@ def send_ack(
         status_code (int): Status code (default 0 for SUCCESS).
         src (int, optional): Source device ID; if None, loaded internally.
     """
-    frame = build_ack_frame(command_id, target_id, success, status_code, src)
+    frame = build_ack_frame(command_id, target_id, success, status_code, src, resolve_context(interface))
     send_frame(interface, frame)
 
     ack_type = "ACK" if success else "NACK"
@@ -73,7 +74,8 @@ def send_ftp_ack(
         phase=phase,
         success=success,
         status_code=status_code,
-        src=src
+        src=src,
+        context=resolve_context(interface)
     )
 
     logger.debug(f"[FTP ACK] RAW FRAME bytes={frame!r}")
@@ -84,3 +86,24 @@ def send_ftp_ack(
     logger.info(
         f"[FTP {ack_type}] SENT | PHASE: {phase} -> DST: {target_id} | STATUS: {status_code}"
     )
+
+
+def send_ftp_bitmap_ack(
+    interface,
+    target_id: int,
+    base: int,
+    bitmap: bytes,
+    src: int = None
+) -> None:
+    """
+    Build and send a bitmap ACK covering the chunks received so far.
+
+    Args:
+        interface: Communication interface.
+        target_id (int): Destination node ID.
+        base (int): Number of chunks received without a gap.
+        bitmap (bytes): Chunks received above base (see encode_chunk_bitmap).
+        src (int, optional): Source device ID; if None, loaded internally.
+    """
+    send_frame(interface, build_ftp_bitmap_ack_frame(target_id, base, bitmap, src, resolve_context(interface)))
+    logger.debug(f"[FTP ACK] BITMAP SENT -> DST: {target_id} | BASE: {base} | BITMAP: {bitmap.hex()}")
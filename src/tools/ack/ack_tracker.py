@@ -15,6 +15,11 @@ from typing import Dict, Tuple, Optional, Union
 # Value: {"status": int, "timestamp": float}
 _ack_buffer: Dict[Tuple[str, int], Dict[str, float]] = {}
 
+# Latest FTP bitmap ACK per peer:
+# Key: source_id of the bitmap ACK
+# Value: (base, bitmap)
+_bitmap_buffer: Dict[int, Tuple[int, bytes]] = {}
+
 
 def _current_time() -> float:
     """
@@ -86,6 +91,33 @@ def clear_all_acks() -> None:
     Clear all recorded ACK entries.
     """
     _ack_buffer.clear()
+    _bitmap_buffer.clear()
+
+
+def register_ftp_bitmap(src_id: int, base: int, bitmap: bytes) -> None:
+    """
+    Record the latest FTP bitmap ACK from a peer (replaces the previous one).
+
+    Args:
+        src_id (int): Device ID that sent the bitmap ACK.
+        base (int): Number of chunks received without a gap.
+        bitmap (bytes): Chunks received above base.
+    """
+    _bitmap_buffer[src_id] = (base, bitmap)
+
+
+def get_ftp_bitmap(src_id: int) -> Optional[Tuple[int, bytes]]:
+    """
+    Return the latest (base, bitmap) from a peer, or None if none was received.
+    """
+    return _bitmap_buffer.get(src_id)
+
+
+def clear_ftp_bitmap(src_id: int) -> None:
+    """
+    Forget the bitmap ACK state of a peer (e.g. before a new transfer).
+    """
+    _bitmap_buffer.pop(src_id, None)
 
 
 def get_all_acks() -> Dict[Tuple[str, int], Dict[str, float]]:
@@ -4,18 +4,21 @@
 FTP ACK Builder Module
 
 Constructs mesh frames to acknowledge (ACK) or negatively acknowledge (NACK)
-FTP file-transfer operations for START, CHUNK, and END phases.
+FTP file-transfer operations for START, CHUNK, and END phases, and the
+selective-repeat bitmap ACK that covers many chunks at once.
 """
 
 import struct
 from typing import Optional, Literal
-from src.core.frame_codec import build_mesh_frame, load_device_id
+from src.core.frame_codec import build_mesh_frame
+from src.core.protocol_context import ProtocolContext, get_protocol_context
 
 # FTP evrelerinin komut ID'leri
-COMMAND_IDS: dict[Literal["START", "CHUNK", "END"], int] = {
-    "START": 0x10,
-    "CHUNK": 0x11,
-    "END":   0x12,
+COMMAND_IDS: dict[Literal["START", "CHUNK", "END", "BITMAP"], int] = {
+    "START":  0x10,
+    "CHUNK":  0x11,
+    "END":    0x12,
+    "BITMAP": 0x13,
 }
 
 def build_ftp_ack_frame(
@@ -23,7 +26,8 @@ def build_ftp_ack_frame(
     phase: Literal["START", "CHUNK", "END"],
     success: bool = True,
     status_code: int = 0,
-    src: Optional[int] = None
+    src: Optional[int] = None,
+    context: Optional[ProtocolContext] = None
 ) -> bytes:
     """
     Build an ACK or NACK mesh frame for FTP transfers.
@@ -35,12 +39,14 @@ def build_ftp_ack_frame(
         status_code (int, optional):
             - For START/END: must be 0.
             - For CHUNK: the chunk sequence number (can now be >255).
-        src (int | None, optional): Source device ID; if None, loaded via load_device_id().
+        src (int | None, optional): Source device ID; if None, taken from the protocol context.
+        context (ProtocolContext | None, optional): Protocol context of the link; the shared default if None.
 
     Returns:
         bytes: A type-'A' mesh frame containing the ACK/NACK payload.
     """
-    source = src if src is not None else load_device_id()
+    ctx = context if context is not None else get_protocol_context()
+    source = src if src is not None else ctx.device_id
     ack_code = 0xAA if success else 0x55
     try:
         cmd_id = COMMAND_IDS[phase]
@@ -49,4 +55,32 @@ def build_ftp_ack_frame(
 
     # payload: [ACK_CODE(1B), COMMAND_ID(1B), STATUS_CODE(4B)]
     payload = struct.pack(">BBI", ack_code, cmd_id, status_code)
-    return build_mesh_frame('A', source, target_id, payload)
+    return build_mesh_frame('A', source, target_id, payload, context=ctx)
+
+
+def build_ftp_bitmap_ack_frame(
+    target_id: int,
+    base: int,
+    bitmap: bytes,
+    src: Optional[int] = None,
+    context: Optional[ProtocolContext] = None
+) -> bytes:
+    """
+    Build a bitmap ACK acknowledging every chunk below `base` plus the chunks
+    flagged in `bitmap` (see ftp_serializer.encode_chunk_bitmap).
+
+    Args:
+        target_id (int): Destination node ID (the sender of the file).
+        base (int): Number of chunks received without a gap.
+        bitmap (bytes): Bit i set = chunk base + 1 + i received.
+        src (int | None, optional): Source device ID; if None, taken from the protocol context.
+        context (ProtocolContext | None, optional): Protocol context of the link; the shared default if None.
+
+    Returns:
+        bytes: A type-'A' mesh frame.
+    """
+    ctx = context if context is not None else get_protocol_context()
+    source = src if src is not None else ctx.device_id
+    # payload: [ACK_CODE(1B), COMMAND_ID(1B), BASE(4B), BITMAP(0-32B)]
+    payload = struct.pack(">BBI", 0xAA, COMMAND_IDS["BITMAP"], base) + bitmap
+    return build_mesh_frame('A', source, target_id, payload, context=ctx)
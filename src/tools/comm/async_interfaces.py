@@ -0,0 +1,373 @@
+# src/tools/comm/async_interfaces.py
+
+"""
+Asyncio Communication Interfaces
+
+Event-loop native counterparts of the thread-based interfaces in
+`interfaces.py`. A single asyncio loop can service many links without a
+receive thread per link:
+
+  - AsyncUDPInterface:  `asyncio.DatagramProtocol` on the mesh UDP socket.
+  - AsyncUARTInterface: serial port file descriptor watched with
+                        `loop.add_reader`; ports without a descriptor
+                        (e.g. "loop://", Windows) fall back to blocking reads
+                        in the default executor.
+  - AsyncMockInterface: in-memory loopback for tests.
+
+Received frames are queued per interface (a BoundedFrameQueue honouring the
+transport's `rx_queue_size` / `rx_drop_policy`, see rx_queue.py) and consumed
+with `await iface.recv()` or `async for frame in iface`; iteration ends after
+`stop()`. `send_nowait()` is the synchronous path used by frame handlers
+through `transmitter.send_frame`.
+"""
+
+import asyncio
+import json
+from typing import Dict, List, Optional
+
+from serial import SerialException, serial_for_url
+
+from src.core.frame_codec import split_mesh_frames
+from src.core.protocol_context import ProtocolContext, get_protocol_context
+from src.tools.comm.deframer import StreamDeframer, DEFAULT_MAX_PAYLOAD
+from src.tools.comm.rx_queue import BoundedFrameQueue, DEFAULT_QUEUE_SIZE, DEFAULT_DROP_POLICY
+from src.tools.comm.udp_handler import open_udp_socket
+from src.tools.log.logger import logger
+
+DEFAULT_RX_QUEUE_SIZE = DEFAULT_QUEUE_SIZE
+
+
+class AsyncCommInterface:
+    """
+    Base class for asyncio interfaces.
+
+    Subclasses open their transport in `start()`, push every received frame
+    through `_deliver()` and call `_close_rx()` when the transport is gone.
+
+    Attributes:
+        context (ProtocolContext | None): Protocol context for this link.
+        rx_queue (BoundedFrameQueue): Received frames awaiting recv().
+    """
+
+    context = None
+
+    def __init__(
+        self,
+        context: Optional[ProtocolContext] = None,
+        rx_queue_size: int = DEFAULT_RX_QUEUE_SIZE,
+        rx_drop_policy: str = DEFAULT_DROP_POLICY,
+        name: str = "ASYNC"
+    ) -> None:
+        """
+        Args:
+            context (ProtocolContext | None): Protocol context for this link.
+            rx_queue_size (int): Maximum number of received frames buffered.
+            rx_drop_policy (str): Overflow policy, one of rx_queue.DROP_POLICIES.
+            name (str): Label used in log messages.
+
+        Raises:
+            ValueError: If rx_queue_size or rx_drop_policy is invalid.
+        """
+        self.context = context
+        self.rx_queue = BoundedFrameQueue(rx_queue_size, rx_drop_policy, name=name)
+        self._closed = False
+        # Set when a frame arrives or the receive stream ends
+        self._wakeup = asyncio.Event()
+
+    async def start(self) -> None:
+        """Open the transport and begin receiving."""
+        pass
+
+    async def stop(self) -> None:
+        """Close the transport; pending iterations end once the queue drains."""
+        self._close_rx()
+
+    def send_nowait(self, data: bytes) -> None:
+        """
+        Queue raw bytes for transmission without awaiting.
+
+        Args:
+            data (bytes): The frame(s) to send.
+        """
+        raise NotImplementedError()
+
+    async def send(self, data: bytes) -> None:
+        """
+        Transmit raw bytes over the interface.
+
+        Args:
+            data (bytes): The frame(s) to send.
+        """
+        self.send_nowait(data)
+
+    async def recv(self) -> Optional[bytes]:
+        """
+        Wait for the next received frame.
+
+        Returns:
+            bytes | None: The frame, or None once the interface is stopped.
+        """
+        while True:
+            frame = self.rx_queue.get_nowait()
+            if frame is not None:
+                return frame
+            if self._closed:
+                return None
+            self._wakeup.clear()
+            await self._wakeup.wait()
+
+    def read_many(self, max_frames: Optional[int] = None) -> List[bytes]:
+        """
+        Drain the frames already received, without waiting.
+
+        Args:
+            max_frames (int | None): Upper bound on frames returned; None for all.
+
+        Returns:
+            List[bytes]: Received frames in arrival order (empty if none).
+        """
+        return self.rx_queue.drain(max_frames)
+
+    def rx_stats(self) -> Dict[str, object]:
+        """
+        Receive queue depth and dropped-frame counters (see CommInterface.rx_stats).
+
+        Returns:
+            dict: policy, maxsize, depth, dropped_total and dropped (per type).
+        """
+        return self.rx_queue.stats()
+
+    @property
+    def dropped_frames(self) -> int:
+        """Frames discarded because the receive queue was full."""
+        return self.rx_queue.dropped_total
+
+    @property
+    def dropped(self) -> Dict[str, int]:
+        """Discarded frames per frame type."""
+        return dict(self.rx_queue.dropped)
+
+    def __aiter__(self) -> "AsyncCommInterface":
+        return self
+
+    async def __anext__(self) -> bytes:
+        frame = await self.recv()
+        if frame is None:
+            raise StopAsyncIteration
+        return frame
+
+    def _deliver(self, frame: bytes) -> None:
+        """Queue one received frame; a full queue applies the drop policy."""
+        if self._closed:
+            return
+        self.rx_queue.put(frame)
+        self._wakeup.set()
+
+    def _close_rx(self) -> None:
+        """End the receive stream; consumers get the queued frames, then None."""
+        self._closed = True
+        self._wakeup.set()
+
+
+class _MeshDatagramProtocol(asyncio.DatagramProtocol):
+    """Splits incoming datagrams into frames for an AsyncUDPInterface."""
+
+    def __init__(self, owner: "AsyncUDPInterface") -> None:
+        self.owner = owner
+
+    def datagram_received(self, data: bytes, addr) -> None:
+        for frame in split_mesh_frames(data, context=self.owner.context):
+            self.owner._deliver(bytes(frame))
+
+    def error_received(self, exc: Exception) -> None:
+        logger.error(f"[ASYNC UDP] Receive error: {exc}")
+
+    def connection_lost(self, exc: Optional[Exception]) -> None:
+        self.owner._close_rx()
+
+
+class AsyncUDPInterface(AsyncCommInterface):
+    """
+    UDP mesh link driven by the asyncio event loop.
+    """
+
+    def __init__(self, config_path: str = "config.json", context: Optional[ProtocolContext] = None) -> None:
+        """
+        Args:
+            config_path (str): Configuration file with the `udp` section.
+            context (ProtocolContext | None): Protocol context; loaded from config_path if None.
+        """
+        with open(config_path, "r", encoding="utf-8") as f:
+            udp_cfg = json.load(f)["udp"]
+        super().__init__(
+            context if context is not None else get_protocol_context(config_path),
+            udp_cfg.get("rx_queue_size", DEFAULT_RX_QUEUE_SIZE),
+            udp_cfg.get("rx_drop_policy", DEFAULT_DROP_POLICY),
+            name="ASYNC UDP"
+        )
+        self.local_ip = udp_cfg["local_ip"]
+        self.local_port = udp_cfg["local_port"]
+        self.remote_ip = udp_cfg["remote_ip"]
+        self.remote_port = udp_cfg["remote_port"]
+        self.transport: Optional[asyncio.DatagramTransport] = None
+
+    async def start(self) -> None:
+        """Bind the mesh socket and attach it to the running loop."""
+        if self.transport is not None:
+            return
+        sock = open_udp_socket(self.local_ip, self.local_port, self.remote_ip)
+        loop = asyncio.get_running_loop()
+        self.transport, _ = await loop.create_datagram_endpoint(
+            lambda: _MeshDatagramProtocol(self), sock=sock
+        )
+
+    async def stop(self) -> None:
+        """Close the socket."""
+        if self.transport is not None:
+            self.transport.close()
+            self.transport = None
+        self._close_rx()
+
+    def send_nowait(self, data: bytes) -> None:
+        """Send a datagram to the configured remote address."""
+        self.transport.sendto(data, (self.remote_ip, self.remote_port))
+
+
+class AsyncUARTInterface(AsyncCommInterface):
+    """
+    Serial mesh link driven by the asyncio event loop.
+
+    Bytes are deframed on the loop as they arrive. Writes go straight to the
+    port; at radio baud rates the OS transmit buffer absorbs a frame without
+    blocking the loop.
+    """
+
+    def __init__(self, config_path: str = "config.json", context: Optional[ProtocolContext] = None) -> None:
+        """
+        Args:
+            config_path (str): Configuration file with the `uart` section.
+            context (ProtocolContext | None): Protocol context; loaded from config_path if None.
+        """
+        with open(config_path, "r", encoding="utf-8") as f:
+            uart_cfg = json.load(f)["uart"]
+        super().__init__(
+            context if context is not None else get_protocol_context(config_path),
+            uart_cfg.get("rx_queue_size", DEFAULT_RX_QUEUE_SIZE),
+            uart_cfg.get("rx_drop_policy", DEFAULT_DROP_POLICY),
+            name="ASYNC UART"
+        )
+        self.port = uart_cfg["port"]
+        self.baudrate = uart_cfg["baudrate"]
+        self.timeout = uart_cfg.get("timeout") or 0.1
+        self.deframer = StreamDeframer(self.context, uart_cfg.get("max_payload", DEFAULT_MAX_PAYLOAD))
+        self.ser = None
+        self._fd: Optional[int] = None
+        self._reader_task: Optional[asyncio.Task] = None
+        self._reading = False
+
+    async def start(self) -> None:
+        """Open the port and watch it with add_reader, or an executor reader as fallback."""
+        if self.ser is not None:
+            return
+        loop = asyncio.get_running_loop()
+        self.ser = serial_for_url(self.port, self.baudrate, timeout=0)
+        try:
+            fd = self.ser.fileno()
+            loop.add_reader(fd, self._on_readable)
+            self._fd = fd
+        except (AttributeError, OSError, NotImplementedError):
+            # No pollable descriptor: block in a worker thread instead
+            self.ser.timeout = self.timeout
+            self._reading = True
+            self._reader_task = loop.create_task(self._executor_reader())
+
+    async def stop(self) -> None:
+        """Stop watching the port and close it."""
+        if self.ser is None:
+            self._close_rx()
+            return
+        if self._fd is not None:
+            asyncio.get_running_loop().remove_reader(self._fd)
+            self._fd = None
+        if self._reader_task is not None:
+            # Let the pending executor read return before closing the port
+            self._reading = False
+            cancel_read = getattr(self.ser, "cancel_read", None)
+            if cancel_read is not None:
+                cancel_read()
+            await self._reader_task
+            self._reader_task = None
+        self.ser.close()
+        self.ser = None
+        self._close_rx()
+
+    def send_nowait(self, data: bytes) -> None:
+        """Write the frame(s) to the serial port."""
+        try:
+            self.ser.write(data)
+        except SerialException as e:
+            logger.error(f"[ASYNC UART] Write error: {e}")
+
+    def _feed(self, data: bytes) -> None:
+        for frame in self.deframer.feed(data):
+            self._deliver(frame)
+
+    def _on_readable(self) -> None:
+        try:
+            data = self.ser.read(self.ser.in_waiting or 1)
+        except SerialException as e:
+            logger.error(f"[ASYNC UART] Read error: {e}")
+            return
+        if data:
+            self._feed(data)
+
+    def _blocking_read(self) -> bytes:
+        # Runs in the executor: wait for the first byte, then take the rest
+        first = self.ser.read(1)
+        if not first:
+            return b""
+        waiting = self.ser.in_waiting
+        return first + self.ser.read(waiting) if waiting else first
+
+    async def _executor_reader(self) -> None:
+        loop = asyncio.get_running_loop()
+        while self._reading:
+            try:
+                data = await loop.run_in_executor(None, self._blocking_read)
+            except SerialException as e:
+                if self._reading:
+                    logger.error(f"[ASYNC UART] Read error: {e}")
+                    await asyncio.sleep(self.timeout)
+                continue
+            if data and self._reading:
+                self._feed(data)
+
+
+class AsyncMockInterface(AsyncCommInterface):
+    """
+    In-memory async interface that records sent frames and loops them back.
+    """
+
+    def __init__(self, context: Optional[ProtocolContext] = None) -> None:
+        """
+        Args:
+            context (ProtocolContext | None): Protocol context; shared default if None.
+        """
+        super().__init__(context if context is not None else get_protocol_context())
+        # Frames that have been sent
+        self.outbox: List[bytes] = []
+
+    def send_nowait(self, data: bytes) -> None:
+        """Record the data and loop its frames back for reading."""
+        self.outbox.append(data)
+        self.inject_frame(data)
+
+    def inject_frame(self, data: bytes) -> None:
+        """
+        Make frame(s) available to readers as if they had been received.
+
+        Args:
+            data (bytes): One frame or several concatenated frames.
+        """
+        for frame in split_mesh_frames(data, context=self.context):
+            self._deliver(bytes(frame))
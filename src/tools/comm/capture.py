@@ -0,0 +1,160 @@
+# src/tools/comm/capture.py
+
+"""
+Link Capture
+
+Records the raw bytes a transport receives and sends, with monotonic
+timestamps, to a pcap-like file that `replay.ReplayEngine` can play back.
+
+File layout (little-endian):
+
+    header   magic "LYNKCAP\\0", version u8, link type u8, reserved u16,
+             wall-clock start f64 (UNIX seconds), monotonic start u64 (ns)
+    record   time since start u64 (ns), direction u8, length u32, bytes
+
+Link types:
+  - LINK_STREAM   (UART): records are raw serial reads/writes; frame
+                  boundaries are recovered by the deframer on replay.
+  - LINK_DATAGRAM (UDP):  records are whole datagrams (possibly several
+                  frames each).
+
+Capturing is enabled per transport with the `capture` section of the
+`uart` / `udp` config, or at run time with the handler's start_capture().
+"""
+
+import struct
+import threading
+import time
+from pathlib import Path
+from typing import BinaryIO, Iterator, NamedTuple, Optional, Union
+
+CAPTURE_MAGIC = b"LYNKCAP\x00"
+CAPTURE_VERSION = 1
+
+LINK_STREAM = 0
+LINK_DATAGRAM = 1
+
+DIR_RX = 0
+DIR_TX = 1
+
+_HEADER = struct.Struct("<8sBBHdQ")
+_RECORD = struct.Struct("<QBI")
+
+
+class CaptureRecord(NamedTuple):
+    """One captured read or write."""
+    time_ns: int        # since the start of the capture
+    direction: int      # DIR_RX or DIR_TX
+    data: bytes
+
+
+class CaptureWriter:
+    """
+    Appends captured bytes to a capture file; safe to share between the RX
+    thread and senders.
+
+    Attributes:
+        path (Path): Capture file.
+        link_type (int): LINK_STREAM or LINK_DATAGRAM.
+        records (int): Records written.
+    """
+
+    def __init__(self, path: Union[str, Path], link_type: int) -> None:
+        """
+        Args:
+            path (str | Path): File to create (parent directories are created).
+            link_type (int): LINK_STREAM for UART, LINK_DATAGRAM for UDP.
+        """
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.link_type = link_type
+        self.records = 0
+        self._start_ns = time.monotonic_ns()
+        self._lock = threading.Lock()
+        self._file: Optional[BinaryIO] = open(self.path, "wb")
+        self._file.write(_HEADER.pack(CAPTURE_MAGIC, CAPTURE_VERSION, link_type, 0, time.time(), self._start_ns))
+
+    def write(self, direction: int, data) -> None:
+        """
+        Append one read (DIR_RX) or write (DIR_TX).
+
+        Args:
+            direction (int): DIR_RX or DIR_TX.
+            data (bytes | memoryview): Raw bytes as read from / written to the link.
+        """
+        elapsed = time.monotonic_ns() - self._start_ns
+        with self._lock:
+            if self._file is None:
+                return
+            self._file.write(_RECORD.pack(elapsed, direction, len(data)))
+            self._file.write(data)
+            self.records += 1
+
+    def write_rx(self, data) -> None:
+        """Append received bytes."""
+        self.write(DIR_RX, data)
+
+    def write_tx(self, data) -> None:
+        """Append sent bytes."""
+        self.write(DIR_TX, data)
+
+    def flush(self) -> None:
+        """Write buffered records to disk."""
+        with self._lock:
+            if self._file is not None:
+                self._file.flush()
+
+    def close(self) -> None:
+        """Close the file; later writes are ignored."""
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+
+
+class CaptureReader:
+    """
+    Reads a capture file.
+
+    Attributes:
+        link_type (int): LINK_STREAM or LINK_DATAGRAM.
+        started_at (float): Wall-clock time the capture started (UNIX seconds).
+    """
+
+    def __init__(self, path: Union[str, Path]) -> None:
+        """
+        Args:
+            path (str | Path): Capture file.
+
+        Raises:
+            ValueError: If the file is not a capture or has an unknown version.
+        """
+        self.path = Path(path)
+        with open(self.path, "rb") as f:
+            header = f.read(_HEADER.size)
+        if len(header) < _HEADER.size:
+            raise ValueError(f"Not a LYNK capture (truncated header): {self.path}")
+        magic, version, link_type, _reserved, started_at, _start_ns = _HEADER.unpack(header)
+        if magic != CAPTURE_MAGIC:
+            raise ValueError(f"Not a LYNK capture: {self.path}")
+        if version != CAPTURE_VERSION:
+            raise ValueError(f"Unsupported capture version {version}: {self.path}")
+        self.link_type = link_type
+        self.started_at = started_at
+
+    def __iter__(self) -> Iterator[CaptureRecord]:
+        """
+        Yield records in file order; a record cut short (e.g. by a crash
+        during capture) ends the iteration.
+        """
+        with open(self.path, "rb") as f:
+            f.seek(_HEADER.size)
+            while True:
+                head = f.read(_RECORD.size)
+                if len(head) < _RECORD.size:
+                    return
+                time_ns, direction, length = _RECORD.unpack(head)
+                data = f.read(length)
+                if len(data) < length:
+                    return
+                yield CaptureRecord(time_ns, direction, data)
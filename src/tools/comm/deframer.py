@@ -0,0 +1,212 @@
+# src/tools/comm/deframer.py
+
+"""
+Stream Deframer
+
+Byte-level state machine that recovers mesh frames from a byte stream
+(UART, or any transport that can split/merge frames arbitrarily):
+
+    HUNT_SYNC -> SYNC_2 -> HEADER -> PAYLOAD -> CRC -> (frame) -> HUNT_SYNC
+
+Every received chunk is consumed exactly once: the partial frame is kept in a
+preallocated frame buffer between calls, the CRC is updated incrementally as
+payload bytes arrive, and `feed()` returns every frame completed by a chunk.
+On a bad version, oversize length or CRC mismatch the deframer resynchronises
+on the next start byte inside the rejected candidate, iteratively (no
+recursion), so noise cannot exhaust the stack.
+"""
+
+from typing import Dict, List, Optional
+
+from src.core.crc import CRC_INIT, update as crc_update
+from src.core.protocol_context import (
+    ProtocolContext,
+    HEADER_LEN,
+    CRC_LEN,
+    get_protocol_context,
+)
+
+# Deframer states
+HUNT_SYNC = 0
+SYNC_2 = 1
+HEADER = 2
+PAYLOAD = 3
+CRC = 4
+
+# Largest payload accepted by default; longer length fields are treated as noise
+DEFAULT_MAX_PAYLOAD = 4096
+
+
+class StreamDeframer:
+    """
+    Incremental mesh frame extractor for byte streams.
+
+    Attributes:
+        stats (dict): Counters: frames, crc_errors, version_errors,
+            length_errors, discarded_bytes.
+    """
+
+    def __init__(
+        self,
+        context: Optional[ProtocolContext] = None,
+        max_payload: int = DEFAULT_MAX_PAYLOAD
+    ) -> None:
+        """
+        Args:
+            context (ProtocolContext | None): Protocol context; shared default if None.
+            max_payload (int): Largest payload length accepted (bytes).
+        """
+        self.context = context if context is not None else get_protocol_context()
+        self.max_payload = max_payload
+        self._frame = bytearray(HEADER_LEN + max_payload + CRC_LEN)
+        self._state = HUNT_SYNC
+        self._fill = 0
+        self._payload_end = 0
+        self._crc = CRC_INIT
+        self.stats: Dict[str, int] = {
+            "frames": 0,
+            "crc_errors": 0,
+            "version_errors": 0,
+            "length_errors": 0,
+            "discarded_bytes": 0,
+        }
+
+    @property
+    def state(self) -> int:
+        """Current state (HUNT_SYNC, SYNC_2, HEADER, PAYLOAD or CRC)."""
+        return self._state
+
+    def reset(self) -> None:
+        """Drop any partial frame and hunt for the next sync."""
+        self._state = HUNT_SYNC
+        self._fill = 0
+
+    def feed(self, chunk) -> List[bytes]:
+        """
+        Consume a chunk of received bytes.
+
+        Args:
+            chunk (bytes | bytearray | memoryview): Newly received data.
+
+        Returns:
+            List[bytes]: All frames completed by this chunk, in order.
+        """
+        frames: List[bytes] = []
+        work = [bytes(chunk) if not isinstance(chunk, bytes) else chunk]
+
+        while work:
+            data = work.pop()
+            replay, remaining = self._consume(data, frames)
+            if remaining:
+                work.append(remaining)
+            if replay:
+                work.append(replay)
+
+        return frames
+
+    def _reject(self, counter: str, data: bytes, pos: int):
+        """
+        Abandon the current candidate frame and prepare resynchronisation.
+
+        Returns the candidate bytes after its first start byte that may hide a
+        real frame start, and the unconsumed rest of the current input.
+        """
+        self.stats[counter] += 1
+        frame = self._frame
+        fill = self._fill
+        idx = frame.find(self.context.start_byte, 1, fill)
+        self.stats["discarded_bytes"] += (idx if idx >= 0 else fill)
+        replay = bytes(frame[idx:fill]) if idx >= 0 else b""
+        self.reset()
+        return replay, data[pos:]
+
+    def _consume(self, data: bytes, frames: List[bytes]):
+        """
+        Run the state machine over `data`.
+
+        Returns:
+            (replay, remaining): Both empty when `data` was fully consumed;
+            otherwise a candidate was rejected and both must be fed again,
+            `replay` first.
+        """
+        ctx = self.context
+        frame = self._frame
+        view = memoryview(data)
+        n = len(data)
+        pos = 0
+
+        while pos < n:
+            state = self._state
+
+            if state == HUNT_SYNC:
+                idx = data.find(ctx.start_byte, pos)
+                if idx < 0:
+                    self.stats["discarded_bytes"] += n - pos
+                    return b"", b""
+                self.stats["discarded_bytes"] += idx - pos
+                frame[0] = ctx.start_byte
+                self._fill = 1
+                self._state = SYNC_2
+                pos = idx + 1
+
+            elif state == SYNC_2:
+                byte = data[pos]
+                pos += 1
+                if byte == ctx.start_byte_2:
+                    frame[1] = byte
+                    self._fill = 2
+                    self._state = HEADER
+                elif byte != ctx.start_byte:
+                    # A repeated first start byte keeps us in SYNC_2
+                    self.stats["discarded_bytes"] += 2
+                    self._state = HUNT_SYNC
+                else:
+                    self.stats["discarded_bytes"] += 1
+
+            elif state == HEADER:
+                take = min(HEADER_LEN - self._fill, n - pos)
+                frame[self._fill:self._fill + take] = view[pos:pos + take]
+                self._fill += take
+                pos += take
+                if self._fill < HEADER_LEN:
+                    continue
+
+                if frame[2] != ctx.version:
+                    return self._reject("version_errors", data, pos)
+                payload_len = (frame[6] << 8) | frame[7]
+                if payload_len > self.max_payload:
+                    return self._reject("length_errors", data, pos)
+
+                self._payload_end = HEADER_LEN + payload_len
+                self._crc = crc_update(CRC_INIT, memoryview(frame)[:HEADER_LEN])
+                self._state = PAYLOAD if payload_len else CRC
+
+            elif state == PAYLOAD:
+                take = min(self._payload_end - self._fill, n - pos)
+                piece = view[pos:pos + take]
+                frame[self._fill:self._fill + take] = piece
+                self._crc = crc_update(self._crc, piece)
+                self._fill += take
+                pos += take
+                if self._fill == self._payload_end:
+                    self._state = CRC
+
+            else:  # CRC
+                frame_len = self._payload_end + CRC_LEN
+                take = min(frame_len - self._fill, n - pos)
+                frame[self._fill:self._fill + take] = view[pos:pos + take]
+                self._fill += take
+                pos += take
+                if self._fill < frame_len:
+                    continue
+
+                end = self._payload_end
+                if ((frame[end] << 8) | frame[end + 1]) != self._crc:
+                    return self._reject("crc_errors", data, pos)
+
+                frames.append(bytes(frame[:frame_len]))
+                self.stats["frames"] += 1
+                self._state = HUNT_SYNC
+                self._fill = 0
+
+        return b"", b""
@@ -11,8 +11,16 @@ import json
 from pathlib import Path
 from typing import Any, Dict, Literal, Union
 
+from src.core.protocol_context import get_protocol_context
+from src.tools.comm.async_interfaces import (
+    AsyncCommInterface,
+    AsyncMockInterface,
+    AsyncUARTInterface,
+    AsyncUDPInterface,
+)
 from src.tools.comm.interfaces import UARTInterface, UDPInterface
 from src.tools.comm.mock_handler import MockUARTHandler
+from src.tools.comm.tx_scheduler import TxScheduler, DEFAULT_MAX_QUEUE
 from src.tools.comm.uart_handler import UARTHandler
 from src.tools.comm.udp_handler import UDPHandler
 from src.tools.log.logger import logger
@@ -28,6 +36,10 @@ def create_interface(config_path: Union[str, Path] = "config.json"):
       - MOCK_UART
       - UDP
 
+    The returned interface carries the `ProtocolContext` of `config_path`,
+    loaded once and shared by every interface created from the same file.
+    If 'tx_scheduler.enabled' is set, a started `TxScheduler` is attached.
+
     Args:
         config_path (str | Path): Path to the JSON configuration file.
 
@@ -46,23 +58,84 @@ def create_interface(config_path: Union[str, Path] = "config.json"):
         .get("comm_type", "UART") \
         .upper()
 
+    context = get_protocol_context(str(config_path))
+
     if comm_type == "UART":
         logger.info("[FACTORY] Initializing UART interface...")
         handler = UARTHandler(config_path)
         handler.start()
-        return UARTInterface(handler)
+        interface = UARTInterface(handler, context)
 
-    if comm_type == "MOCK_UART":
+    elif comm_type == "MOCK_UART":
         logger.info("[FACTORY] Initializing MOCK UART interface...")
         handler = MockUARTHandler()
         handler.start()
-        return UARTInterface(handler)
+        interface = UARTInterface(handler, context)
 
-    if comm_type == "UDP":
+    elif comm_type == "UDP":
         logger.info("[FACTORY] Initializing UDP interface...")
         handler = UDPHandler(config_path)
         handler.start()
-        return UDPInterface(handler)
+        interface = UDPInterface(handler, context)
+
+    else:
+        # Unsupported comm_type
+        raise ValueError(f"Unsupported comm_type in '{config_path}': {comm_type}")
+
+    _attach_tx_scheduler(interface, cfg, comm_type)
+    return interface
+
+
+def _attach_tx_scheduler(interface, cfg: Dict[str, Any], comm_type: str) -> None:
+    """
+    Attach and start a TxScheduler when 'tx_scheduler.enabled' is true.
+
+    The scheduler waits on the interface's LinkPacer (uart/udp 'pacing'),
+    if any, before picking the next frame.
+    """
+    sched_cfg = cfg.get("tx_scheduler", {})
+    if not sched_cfg.get("enabled", False):
+        return
+
+    scheduler = TxScheduler(interface, max_queue=sched_cfg.get("max_queue", DEFAULT_MAX_QUEUE))
+    scheduler.start()
+    interface.tx_scheduler = scheduler
+    paced = "paced" if scheduler.pacer is not None else "unpaced"
+    logger.info(f"[FACTORY] TX scheduler enabled ({comm_type}, {paced})")
+
+
+async def create_async_interface(config_path: Union[str, Path] = "config.json") -> AsyncCommInterface:
+    """
+    Asyncio counterpart of `create_interface`: build and start the async
+    interface selected by 'interface.comm_type' on the running event loop.
+
+    Args:
+        config_path (str | Path): Path to the JSON configuration file.
+
+    Returns:
+        AsyncCommInterface: Started AsyncUARTInterface, AsyncUDPInterface
+        or AsyncMockInterface.
+
+    Raises:
+        ValueError: If 'comm_type' is missing or unsupported.
+    """
+    with open(config_path, "r", encoding="utf-8") as f:
+        cfg: Dict[str, Any] = json.load(f)
+
+    comm_type = cfg.get("interface", {}).get("comm_type", "UART").upper()
+    context = get_protocol_context(str(config_path))
+
+    if comm_type == "UART":
+        logger.info("[FACTORY] Initializing async UART interface...")
+        interface: AsyncCommInterface = AsyncUARTInterface(str(config_path), context)
+    elif comm_type == "MOCK_UART":
+        logger.info("[FACTORY] Initializing async MOCK UART interface...")
+        interface = AsyncMockInterface(context)
+    elif comm_type == "UDP":
+        logger.info("[FACTORY] Initializing async UDP interface...")
+        interface = AsyncUDPInterface(str(config_path), context)
+    else:
+        raise ValueError(f"Unsupported comm_type in '{config_path}': {comm_type}")
 
-    # Unsupported comm_type
-    raise ValueError(f"Unsupported comm_type in '{config_path}': {comm_type}")
+    await interface.start()
+    return interface
@@ -7,12 +7,25 @@ Defines a common API for communication handlers and provides concrete
 wrappers for UART and UDP transports.
 """
 
+from typing import Dict, Iterator, List, Optional
+
+
 class CommInterface:
     """
     Base class for communication interfaces. Concrete implementations must
     support starting, stopping, sending, and reading raw byte data.
+
+    An interface may carry a `ProtocolContext` in `context`; frame parsing and
+    routing for that interface then use it instead of the shared default.
+
+    An interface may also carry a `TxScheduler` in `tx_scheduler`; frames sent
+    through `transmitter.send_frame` are then queued by priority and written
+    by the scheduler. `stop()` of the concrete wrappers drains and stops it.
     """
 
+    context = None
+    tx_scheduler = None
+
     def start(self):
         """
         Initialize the transport (e.g., open UART port or bind UDP socket).
@@ -43,25 +56,105 @@ class CommInterface:
         """
         raise NotImplementedError()
 
+    def read_many(self, max_frames: Optional[int] = None) -> List[bytes]:
+        """
+        Drain every complete frame currently available.
+
+        Args:
+            max_frames (int | None): Upper bound on frames returned; None for all.
+
+        Returns:
+            List[bytes]: Received frames in arrival order (empty if none).
+        """
+        frames: List[bytes] = []
+        while max_frames is None or len(frames) < max_frames:
+            raw = self.read()
+            if not raw:
+                break
+            frames.append(raw)
+        return frames
+
+    def iter_frames(self, max_frames: Optional[int] = None) -> Iterator[bytes]:
+        """
+        Iterate over the frames currently available (see read_many).
+
+        Args:
+            max_frames (int | None): Upper bound on frames yielded; None for all.
+
+        Yields:
+            bytes: Received frames in arrival order.
+        """
+        yield from self.read_many(max_frames)
+
+    def rx_stats(self) -> Dict[str, object]:
+        """
+        Receive queue depth and dropped-frame counters.
+
+        Returns:
+            dict: policy, maxsize, depth, dropped_total and dropped (per frame
+            type); empty if the transport keeps no bounded queue.
+        """
+        return {}
+
+    @property
+    def pacer(self):
+        """LinkPacer limiting writes on this link, or None if unpaced."""
+        return None
+
+    def link_stats(self) -> Dict[str, object]:
+        """
+        Link airtime budget and current utilisation.
+
+        Returns:
+            dict: LinkPacer.stats(), or empty if the link is unpaced.
+        """
+        pacer = self.pacer
+        return pacer.stats() if pacer is not None else {}
+
+    def start_capture(self, path: str):
+        """
+        Record raw received and sent bytes to a capture file (see capture.py).
+
+        Args:
+            path (str): Capture file to create.
+
+        Returns:
+            CaptureWriter: The open capture.
+
+        Raises:
+            NotImplementedError: If the transport cannot capture.
+        """
+        raise NotImplementedError(f"{type(self).__name__} does not support capture")
+
+    def stop_capture(self):
+        """
+        Close the capture started by start_capture (no-op if none).
+        """
+        pass
+
 
 class UARTInterface(CommInterface):
     """
     Wraps a UART handler to conform to CommInterface.
     """
 
-    def __init__(self, uart_handler):
+    def __init__(self, uart_handler, context=None):
         """
         Args:
             uart_handler: Instance providing start(), stop(), send(), read().
+            context (ProtocolContext | None): Protocol context for this link.
         """
         self.uart = uart_handler
+        self.context = context
 
     def start(self):
         """Start the UART handler."""
         self.uart.start()
 
     def stop(self):
-        """Stop the UART handler."""
+        """Stop the TX scheduler (if any) and the UART handler."""
+        if self.tx_scheduler is not None:
+            self.tx_scheduler.stop()
         self.uart.stop()
 
     def send(self, data: bytes):
@@ -72,25 +165,56 @@ class UARTInterface(CommInterface):
         """Read data from UART."""
         return self.uart.read()
 
+    def read_many(self, max_frames: Optional[int] = None) -> List[bytes]:
+        """Read all pending frames from UART."""
+        return self.uart.read_many(max_frames)
+
+    def rx_stats(self) -> Dict[str, object]:
+        """Receive queue counters of the UART handler."""
+        stats = getattr(self.uart, "rx_stats", None)
+        return stats() if stats is not None else {}
+
+    @property
+    def pacer(self):
+        """LinkPacer of the UART handler, if pacing is enabled."""
+        return getattr(self.uart, "pacer", None)
+
+    def start_capture(self, path: str):
+        """Record raw UART traffic to path."""
+        start = getattr(self.uart, "start_capture", None)
+        if start is None:
+            return super().start_capture(path)
+        return start(path)
+
+    def stop_capture(self):
+        """Close the UART capture, if any."""
+        stop = getattr(self.uart, "stop_capture", None)
+        if stop is not None:
+            stop()
+
 
 class UDPInterface(CommInterface):
     """
     Wraps a UDP handler to conform to CommInterface.
     """
 
-    def __init__(self, udp_handler):
+    def __init__(self, udp_handler, context=None):
         """
         Args:
             udp_handler: Instance providing start(), stop(), send(), read().
+            context (ProtocolContext | None): Protocol context for this link.
         """
         self.udp = udp_handler
+        self.context = context
 
     def start(self):
         """Start the UDP handler."""
         self.udp.start()
 
     def stop(self):
-        """Stop the UDP handler."""
+        """Stop the TX scheduler (if any) and the UDP handler."""
+        if self.tx_scheduler is not None:
+            self.tx_scheduler.stop()
         self.udp.stop()
 
     def send(self, data: bytes):
@@ -99,4 +223,30 @@ class UDPInterface(CommInterface):
 
     def read(self) -> bytes:
         """Read data from UDP."""
-        return self.udp.read()
\ No newline at end of file
+        return self.udp.read()
+
+    def read_many(self, max_frames: Optional[int] = None) -> List[bytes]:
+        """Read all pending frames from UDP."""
+        return self.udp.read_many(max_frames)
+
+    def rx_stats(self) -> Dict[str, object]:
+        """Receive queue counters of the UDP handler."""
+        return self.udp.rx_stats()
+
+    @property
+    def pacer(self):
+        """LinkPacer of the UDP handler, if pacing is enabled."""
+        return self.udp.pacer
+
+    def start_capture(self, path: str):
+        """Record raw UDP traffic to path."""
+        start = getattr(self.udp, "start_capture", None)
+        if start is None:
+            return super().start_capture(path)
+        return start(path)
+
+    def stop_capture(self):
+        """Close the UDP capture, if any."""
+        stop = getattr(self.udp, "stop_capture", None)
+        if stop is not None:
+            stop()
@@ -0,0 +1,217 @@
+# src/tools/comm/link_pacer.py
+
+"""
+Link Pacer
+
+Airtime accounting and token-bucket pacing for bandwidth-limited links
+(UART telemetry radios in particular).
+
+The airtime of a write is derived from the link rate:
+
+    airtime = (nbytes * (1 + overhead_ratio) + overhead_bytes) / rate_bytes
+
+where a UART's `rate_bytes` is `baudrate / bits_per_byte` (10 for 8N1) and
+the overhead terms model radio framing/FEC. The bucket holds airtime
+seconds: it refills at `max_utilisation` seconds per second and holds at
+most `burst` seconds. A write may take the bucket below zero; the next
+write then waits until the debt is repaid, so a large FTP chunk is followed
+by a pause of its own airtime instead of being stacked into the radio's
+buffer.
+"""
+
+import threading
+import time
+from collections import deque
+from typing import Any, Deque, Dict, Optional, Tuple
+
+DEFAULT_BITS_PER_BYTE = 10       # 8N1: start + 8 data + stop
+DEFAULT_MAX_UTILISATION = 0.9
+DEFAULT_BURST_MS = 100
+UTILISATION_WINDOW = 1.0         # seconds
+
+
+class LinkPacer:
+    """
+    Token bucket over link airtime, shared by everything writing to one link.
+
+    Attributes:
+        rate_bytes (float): Raw link rate in bytes per second.
+        overhead_bytes (int): Fixed extra bytes on air per write.
+        overhead_ratio (float): Proportional extra bytes on air (e.g. 0.25 for FEC).
+        max_utilisation (float): Fraction of airtime writes may use (0..1].
+        burst (float): Airtime (s) that may be sent back-to-back from idle.
+    """
+
+    def __init__(
+        self,
+        rate_bytes: float,
+        overhead_bytes: int = 0,
+        overhead_ratio: float = 0.0,
+        max_utilisation: float = DEFAULT_MAX_UTILISATION,
+        burst_ms: float = DEFAULT_BURST_MS,
+        clock=time.monotonic,
+        sleep=time.sleep
+    ) -> None:
+        """
+        Args:
+            rate_bytes (float): Link rate in bytes per second (> 0).
+            overhead_bytes (int): Fixed radio overhead per write, in bytes.
+            overhead_ratio (float): Proportional radio overhead.
+            max_utilisation (float): Target share of airtime, 0 < u <= 1.
+            burst_ms (float): Bucket capacity in milliseconds of airtime.
+            clock: Monotonic time source (seconds).
+            sleep: Sleep function used while waiting for tokens.
+
+        Raises:
+            ValueError: If the rate or utilisation is out of range.
+        """
+        if rate_bytes <= 0:
+            raise ValueError(f"Link rate must be positive: {rate_bytes}")
+        if not 0 < max_utilisation <= 1:
+            raise ValueError(f"max_utilisation must be in (0, 1]: {max_utilisation}")
+        self.rate_bytes = float(rate_bytes)
+        self.overhead_bytes = overhead_bytes
+        self.overhead_ratio = overhead_ratio
+        self.max_utilisation = max_utilisation
+        self.burst = burst_ms / 1000.0
+        self._clock = clock
+        self._sleep = sleep
+        self._lock = threading.Lock()
+        self._tokens = self.burst
+        self._last = clock()
+        # (start time, airtime) of recent writes, for utilisation
+        self._recent: Deque[Tuple[float, float]] = deque()
+        self.frames = 0
+        self.bytes = 0
+        self.wait_total = 0.0
+
+    @classmethod
+    def for_uart(
+        cls,
+        baudrate: int,
+        bits_per_byte: int = DEFAULT_BITS_PER_BYTE,
+        **kwargs: Any
+    ) -> "LinkPacer":
+        """
+        Build a pacer for a serial link.
+
+        Args:
+            baudrate (int): Serial baud rate (bits per second on the wire).
+            bits_per_byte (int): Wire bits per data byte (10 for 8N1).
+            **kwargs: Passed to LinkPacer (overheads, utilisation, burst).
+
+        Returns:
+            LinkPacer: Pacer with rate_bytes = baudrate / bits_per_byte.
+        """
+        return cls(baudrate / bits_per_byte, **kwargs)
+
+    @classmethod
+    def from_config(cls, pacing_cfg: Dict[str, Any], baudrate: Optional[int] = None) -> Optional["LinkPacer"]:
+        """
+        Build a pacer from a `pacing` config section.
+
+        Args:
+            pacing_cfg (dict): Keys: enabled, rate_bps (optional when baudrate
+                is given), bits_per_byte, overhead_bytes, overhead_ratio,
+                max_utilisation, burst_ms.
+            baudrate (int | None): Serial baud rate the rate defaults to.
+
+        Returns:
+            LinkPacer | None: None if pacing is disabled or no rate is known.
+        """
+        if not pacing_cfg.get("enabled", False):
+            return None
+        bits_per_byte = pacing_cfg.get("bits_per_byte", DEFAULT_BITS_PER_BYTE)
+        rate_bps = pacing_cfg.get("rate_bps") or baudrate
+        if not rate_bps:
+            return None
+        return cls(
+            rate_bps / bits_per_byte,
+            overhead_bytes=pacing_cfg.get("overhead_bytes", 0),
+            overhead_ratio=pacing_cfg.get("overhead_ratio", 0.0),
+            max_utilisation=pacing_cfg.get("max_utilisation", DEFAULT_MAX_UTILISATION),
+            burst_ms=pacing_cfg.get("burst_ms", DEFAULT_BURST_MS),
+        )
+
+    def airtime(self, nbytes: int) -> float:
+        """
+        Time the link needs to carry a write of `nbytes`.
+
+        Args:
+            nbytes (int): Bytes written.
+
+        Returns:
+            float: Airtime in seconds, radio overhead included.
+        """
+        return (nbytes * (1.0 + self.overhead_ratio) + self.overhead_bytes) / self.rate_bytes
+
+    def _refill(self, now: float) -> None:
+        self._tokens = min(self.burst, self._tokens + (now - self._last) * self.max_utilisation)
+        self._last = now
+
+    def ready_in(self) -> float:
+        """
+        Seconds until a write may start without waiting (0 if now).
+        """
+        with self._lock:
+            self._refill(self._clock())
+            return -self._tokens / self.max_utilisation if self._tokens < 0 else 0.0
+
+    def acquire(self, nbytes: int) -> float:
+        """
+        Wait until the link budget allows a write, then charge its airtime.
+
+        Args:
+            nbytes (int): Bytes about to be written.
+
+        Returns:
+            float: Seconds waited.
+        """
+        cost = self.airtime(nbytes)
+        with self._lock:
+            now = self._clock()
+            self._refill(now)
+            wait = -self._tokens / self.max_utilisation if self._tokens < 0 else 0.0
+            self._tokens -= cost
+            self._prune(now)
+            self._recent.append((now + wait, cost))
+            self.frames += 1
+            self.bytes += nbytes
+            self.wait_total += wait
+        if wait > 0:
+            self._sleep(wait)
+        return wait
+
+    def _prune(self, now: float) -> None:
+        horizon = now - UTILISATION_WINDOW
+        recent = self._recent
+        while recent and recent[0][0] < horizon:
+            recent.popleft()
+
+    def utilisation(self) -> float:
+        """
+        Share of airtime used by writes started in the last UTILISATION_WINDOW
+        seconds (can exceed max_utilisation right after a burst).
+        """
+        with self._lock:
+            now = self._clock()
+            self._prune(now)
+            busy = sum(cost for start, cost in self._recent if start <= now)
+        return busy / UTILISATION_WINDOW
+
+    def stats(self) -> Dict[str, float]:
+        """
+        Snapshot of pacing counters.
+
+        Returns:
+            dict: rate_bytes, max_utilisation, utilisation, frames, bytes,
+            wait_total (seconds spent waiting for tokens).
+        """
+        return {
+            "rate_bytes": self.rate_bytes,
+            "max_utilisation": self.max_utilisation,
+            "utilisation": self.utilisation(),
+            "frames": self.frames,
+            "bytes": self.bytes,
+            "wait_total": self.wait_total,
+        }
@@ -9,6 +9,8 @@ and providing them back via a read buffer.
 
 from typing import List, Optional
 
+from src.core.frame_codec import split_mesh_frames
+
 
 class MockUARTHandler:
     """
@@ -55,9 +57,32 @@ class MockUARTHandler:
         """
         Read the next available frame, if any.
 
+        A batched write (several frames in one send) is split so that each
+        call still returns a single frame.
+
         Returns:
             bytes or None: The next frame, or None if the buffer is empty.
         """
-        if self.buffer:
-            return self.buffer.pop(0)
-        return None
+        if not self.buffer:
+            return None
+        data = self.buffer.pop(0)
+        # Copy out of the batch buffer: callers get bytes, not views of it
+        frames = [bytes(frame) for frame in split_mesh_frames(data)]
+        if len(frames) > 1:
+            self.buffer[0:0] = frames[1:]
+        return frames[0]
+
+    def read_many(self, max_frames: Optional[int] = None) -> List[bytes]:
+        """
+        Read every available frame (up to max_frames).
+
+        Args:
+            max_frames (int | None): Upper bound on frames returned; None for all.
+
+        Returns:
+            List[bytes]: Frames in the order they were sent or injected.
+        """
+        frames: List[bytes] = []
+        while self.buffer and (max_frames is None or len(frames) < max_frames):
+            frames.append(self.read())
+        return frames
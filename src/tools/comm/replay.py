@@ -0,0 +1,218 @@
+# src/tools/comm/replay.py
+
+"""
+Capture Replay
+
+Feeds a capture file (see capture.py) back through the receive pipeline:
+raw bytes -> deframer (UART) or datagram split (UDP) -> decode_mesh_frame
+-> route_frame, in capture order, on the calling thread. Used to reproduce
+field incidents and to benchmark the receive path on real traffic.
+
+Speed:
+  - 1.0   real time (records are released at their captured offsets)
+  - N     N times faster (0.5 = half speed)
+  - 0     as fast as possible (MAX_SPEED)
+
+Only received bytes are replayed by default; pass directions=(DIR_RX, DIR_TX)
+to include what the node itself sent. Frames the handlers send in reply
+(ACKs, FTP chunks) go to a ReplaySink and are kept in `sink.sent`, so a
+replay never transmits on a live link unless an interface is given.
+
+Usage:
+    python -m src.tools.comm.replay <capture> [--speed N] [--config PATH] [--no-route]
+"""
+
+import argparse
+import time
+from pathlib import Path
+from typing import Callable, Dict, Iterable, List, Optional, Union
+
+from src.core.frame_codec import decode_mesh_frame, split_mesh_frames
+from src.core.protocol_context import ProtocolContext, get_protocol_context
+from src.tools.comm.capture import CaptureReader, DIR_RX, LINK_STREAM
+from src.tools.comm.deframer import StreamDeframer, DEFAULT_MAX_PAYLOAD
+from src.tools.comm.interfaces import CommInterface
+
+MAX_SPEED = 0
+
+
+class ReplaySink(CommInterface):
+    """
+    Interface handed to the handlers during a replay: keeps sent frames
+    instead of transmitting them.
+
+    Attributes:
+        sent (List[bytes]): Frames sent by the handlers, in order.
+    """
+
+    def __init__(self, context: Optional[ProtocolContext] = None) -> None:
+        self.context = context
+        self.sent: List[bytes] = []
+
+    def send(self, data: bytes) -> None:
+        self.sent.append(bytes(data))
+
+    def read(self) -> Optional[bytes]:
+        return None
+
+
+class ReplayEngine:
+    """
+    Replays one capture file.
+
+    Attributes:
+        reader (CaptureReader): Source capture.
+        interface (CommInterface): Interface passed to route_frame.
+        stats (dict): Counters of the last run() (see run()).
+    """
+
+    def __init__(
+        self,
+        path: Union[str, Path],
+        interface: Optional[CommInterface] = None,
+        context: Optional[ProtocolContext] = None,
+        speed: float = 1.0,
+        directions: Iterable[int] = (DIR_RX,),
+        route: bool = True,
+        max_payload: int = DEFAULT_MAX_PAYLOAD,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ) -> None:
+        """
+        Args:
+            path (str | Path): Capture file.
+            interface (CommInterface | None): Interface the handlers reply on;
+                a new ReplaySink if None.
+            context (ProtocolContext | None): Protocol context of the captured
+                link; the interface's, else the shared default, if None.
+            speed (float): Playback rate; MAX_SPEED (0) for no pacing.
+            directions (Iterable[int]): Record directions to replay.
+            route (bool): False to stop after decoding (pipeline benchmark).
+            max_payload (int): Deframer payload limit for stream captures.
+            clock (Callable[[], float]): Monotonic clock in seconds.
+            sleep (Callable[[float], None]): Sleep function used for pacing.
+
+        Raises:
+            ValueError: If speed is negative or the file is not a capture.
+        """
+        if speed < 0:
+            raise ValueError(f"Replay speed must be >= 0: {speed}")
+        self.reader = CaptureReader(path)
+        if context is None:
+            context = getattr(interface, "context", None) or get_protocol_context()
+        self.context = context
+        self.interface = interface if interface is not None else ReplaySink(context)
+        self.speed = speed
+        self.directions = frozenset(directions)
+        self.route = route
+        self.max_payload = max_payload
+        self._clock = clock
+        self._sleep = sleep
+        self.stats: Dict[str, float] = {}
+
+    @property
+    def sink(self) -> Optional[ReplaySink]:
+        """The ReplaySink collecting replies, or None if replaying onto an interface."""
+        return self.interface if isinstance(self.interface, ReplaySink) else None
+
+    def _frames(self, data: bytes, deframer: Optional[StreamDeframer]):
+        if deframer is not None:
+            return deframer.feed(data)
+        return split_mesh_frames(data, context=self.context)
+
+    def _deframers(self) -> Dict[int, StreamDeframer]:
+        # Stream captures: RX and TX are separate byte streams whose writes may
+        # interleave mid-frame, so each direction gets its own deframer
+        if self.reader.link_type != LINK_STREAM:
+            return {}
+        return {direction: StreamDeframer(self.context, self.max_payload) for direction in self.directions}
+
+    def run(self) -> Dict[str, float]:
+        """
+        Replay the whole capture.
+
+        Returns:
+            dict: records, bytes, frames, routed, errors (frames that failed to
+            decode), elapsed (seconds), frames_per_s; for stream captures also
+            the deframer counters (crc_errors, discarded_bytes, ...) summed
+            over the replayed directions.
+        """
+        # Imported here: the router pulls in every handler module
+        from src.core.frame_router import route_frame
+
+        context, interface, route = self.context, self.interface, self.route
+        deframers = self._deframers()
+        records = nbytes = frames = routed = errors = 0
+        started = self._clock()
+        first_ns = None
+
+        for record in self.reader:
+            if record.direction not in self.directions:
+                continue
+            if self.speed != MAX_SPEED:
+                if first_ns is None:
+                    first_ns = record.time_ns
+                due = started + (record.time_ns - first_ns) / 1e9 / self.speed
+                delay = due - self._clock()
+                if delay > 0:
+                    self._sleep(delay)
+
+            records += 1
+            nbytes += len(record.data)
+            for raw in self._frames(record.data, deframers.get(record.direction)):
+                frames += 1
+                try:
+                    frame = decode_mesh_frame(raw, context=context)
+                except ValueError:
+                    errors += 1
+                    continue
+                if route:
+                    route_frame(frame, interface)
+                    routed += 1
+
+        elapsed = self._clock() - started
+        self.stats = {
+            "records": records,
+            "bytes": nbytes,
+            "frames": frames,
+            "routed": routed,
+            "errors": errors,
+            "elapsed": elapsed,
+            "frames_per_s": frames / elapsed if elapsed > 0 else float("inf"),
+        }
+        for deframer in deframers.values():
+            for key, value in deframer.stats.items():
+                if key != "frames":
+                    self.stats[key] = self.stats.get(key, 0) + value
+        return self.stats
+
+
+def replay_capture(path: Union[str, Path], interface: Optional[CommInterface] = None, **options) -> Dict[str, float]:
+    """
+    Replay a capture once (see ReplayEngine for the options).
+
+    Returns:
+        dict: ReplayEngine.run() counters.
+    """
+    return ReplayEngine(path, interface, **options).run()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Replay a LYNK link capture through the receive pipeline.")
+    parser.add_argument("capture", help="capture file (.lcap)")
+    parser.add_argument("--speed", type=float, default=1.0, help="playback rate; 0 = as fast as possible")
+    parser.add_argument("--config", default="config.json", help="config providing the protocol settings")
+    parser.add_argument("--no-route", action="store_true", help="decode only, do not call the handlers")
+    args = parser.parse_args()
+
+    engine = ReplayEngine(args.capture, context=get_protocol_context(args.config),
+                          speed=args.speed, route=not args.no_route)
+    stats = engine.run()
+    for key, value in stats.items():
+        print(f"{key:<16}{value:>14.3f}" if isinstance(value, float) else f"{key:<16}{value:>14}")
+    if engine.sink is not None and engine.sink.sent:
+        print(f"{'replies':<16}{len(engine.sink.sent):>14}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,238 @@
+# src/tools/comm/rx_queue.py
+
+"""
+Bounded Receive Queue
+
+Thread-safe frame queue between a transport's receive thread and the reader.
+When the queue is full a put never blocks the receive thread; instead one
+frame is discarded according to the configured policy:
+
+  - "drop_oldest":  evict the oldest queued frame (fresh data wins).
+  - "drop_newest":  discard the incoming frame.
+  - "drop_by_type": evict the oldest frame of the least important type, so
+                    commands and ACKs are kept over swarm/FTP traffic, and
+                    those over telemetry. An incoming frame that is less
+                    important than everything queued is discarded instead.
+
+Frames are delivered in arrival order under every policy. Dropped frames are
+counted per frame type and reported by `stats()`.
+"""
+
+import threading
+from collections import deque
+from itertools import count
+from typing import Deque, Dict, List, Optional, Tuple
+
+from src.tools.log.logger import logger
+
+DROP_OLDEST = "drop_oldest"
+DROP_NEWEST = "drop_newest"
+DROP_BY_TYPE = "drop_by_type"
+DROP_POLICIES = (DROP_OLDEST, DROP_NEWEST, DROP_BY_TYPE)
+
+DEFAULT_QUEUE_SIZE = 256
+DEFAULT_DROP_POLICY = DROP_BY_TYPE
+
+# Frame type byte offset: start_byte, start_byte_2, version, frame_type
+FRAME_TYPE_OFFSET = 3
+
+# Keep priority per frame type (higher is kept longer); unknown types rank lowest
+TYPE_PRIORITY: Dict[str, int] = {
+    'T': 0,
+    'F': 1,
+    'S': 1,
+    'C': 2,
+    'A': 2,
+}
+_LEVELS = max(TYPE_PRIORITY.values()) + 1
+
+# Warn on the first drop and then once per this many drops
+DROP_LOG_INTERVAL = 100
+
+
+def frame_type_of(frame) -> str:
+    """
+    Return the frame type character of a raw frame ('?' if too short).
+
+    Args:
+        frame (bytes | memoryview): Raw mesh frame.
+
+    Returns:
+        str: Frame type, e.g. 'T' or 'C'.
+    """
+    return chr(frame[FRAME_TYPE_OFFSET]) if len(frame) > FRAME_TYPE_OFFSET else '?'
+
+
+class BoundedFrameQueue:
+    """
+    Bounded FIFO of raw frames with an overflow drop policy.
+
+    Attributes:
+        maxsize (int): Maximum number of queued frames.
+        policy (str): One of DROP_POLICIES.
+        dropped (dict): Dropped frame count per frame type.
+        dropped_total (int): Total dropped frames.
+    """
+
+    def __init__(
+        self,
+        maxsize: int = DEFAULT_QUEUE_SIZE,
+        policy: str = DEFAULT_DROP_POLICY,
+        name: str = "RX"
+    ) -> None:
+        """
+        Args:
+            maxsize (int): Maximum number of queued frames (> 0).
+            policy (str): Overflow policy, one of DROP_POLICIES.
+            name (str): Label used in log messages (e.g. "UART").
+
+        Raises:
+            ValueError: If maxsize or policy is invalid.
+        """
+        if maxsize <= 0:
+            raise ValueError(f"Queue size must be positive: {maxsize}")
+        if policy not in DROP_POLICIES:
+            raise ValueError(f"Unsupported drop policy: {policy} (options: {DROP_POLICIES})")
+        self.maxsize = maxsize
+        self.policy = policy
+        self.name = name
+        self.dropped: Dict[str, int] = {}
+        self.dropped_total = 0
+        # One FIFO per keep-priority level; entries carry an arrival sequence
+        self._levels: List[Deque[Tuple[int, bytes]]] = [deque() for _ in range(_LEVELS)]
+        self._seq = count()
+        self._size = 0
+        self._not_empty = threading.Condition(threading.Lock())
+
+    def __len__(self) -> int:
+        return self._size
+
+    def put(self, frame: bytes) -> bool:
+        """
+        Queue a frame without blocking, applying the drop policy when full.
+
+        Args:
+            frame (bytes): Raw mesh frame.
+
+        Returns:
+            bool: True if nothing was dropped, False if a frame was discarded.
+        """
+        ftype = frame_type_of(frame)
+        level = TYPE_PRIORITY.get(ftype, 0)
+        dropped: Optional[str] = None
+        accepted = True
+
+        with self._not_empty:
+            if self._size >= self.maxsize:
+                dropped = self._evict(level)
+                if dropped is None:
+                    # Incoming frame is the one discarded
+                    dropped = ftype
+                    accepted = False
+            if accepted:
+                self._levels[level].append((next(self._seq), frame))
+                self._size += 1
+                self._not_empty.notify()
+
+        if dropped is not None:
+            self._count_drop(dropped)
+            return False
+        return True
+
+    def _evict(self, level: int) -> Optional[str]:
+        """
+        Remove one queued frame per policy to make room for an incoming frame
+        of keep-priority `level`.
+
+        Returns:
+            str | None: Type of the evicted frame, or None if the incoming
+            frame should be discarded instead.
+        """
+        if self.policy == DROP_NEWEST:
+            return None
+
+        if self.policy == DROP_OLDEST:
+            lvl = self._oldest_level()
+        else:
+            lvl = next(i for i, q in enumerate(self._levels) if q)
+            if level < lvl:
+                return None
+
+        _seq, evicted = self._levels[lvl].popleft()
+        self._size -= 1
+        return frame_type_of(evicted)
+
+    def _oldest_level(self) -> int:
+        best, best_seq = -1, None
+        for i, q in enumerate(self._levels):
+            if q and (best_seq is None or q[0][0] < best_seq):
+                best, best_seq = i, q[0][0]
+        return best
+
+    def _pop(self) -> bytes:
+        _seq, frame = self._levels[self._oldest_level()].popleft()
+        self._size -= 1
+        return frame
+
+    def _count_drop(self, ftype: str) -> None:
+        with self._not_empty:
+            self.dropped[ftype] = self.dropped.get(ftype, 0) + 1
+            self.dropped_total += 1
+            total = self.dropped_total
+        if total % DROP_LOG_INTERVAL == 1:
+            logger.warning(
+                f"[{self.name}] RX queue full ({self.policy}), dropped '{ftype}' frame "
+                f"(total dropped: {total})"
+            )
+
+    def get_nowait(self) -> Optional[bytes]:
+        """
+        Return the oldest queued frame, or None if the queue is empty.
+        """
+        with self._not_empty:
+            return self._pop() if self._size else None
+
+    def get(self, timeout: Optional[float] = None) -> Optional[bytes]:
+        """
+        Wait for a frame.
+
+        Args:
+            timeout (float | None): Maximum wait in seconds; None waits forever.
+
+        Returns:
+            bytes | None: Oldest queued frame, or None on timeout.
+        """
+        with self._not_empty:
+            if not self._not_empty.wait_for(lambda: self._size, timeout):
+                return None
+            return self._pop()
+
+    def drain(self, max_frames: Optional[int] = None) -> List[bytes]:
+        """
+        Remove and return queued frames in arrival order.
+
+        Args:
+            max_frames (int | None): Upper bound on frames returned; None for all.
+
+        Returns:
+            List[bytes]: Frames (empty if none).
+        """
+        with self._not_empty:
+            n = self._size if max_frames is None else min(max_frames, self._size)
+            return [self._pop() for _ in range(n)]
+
+    def stats(self) -> Dict[str, object]:
+        """
+        Snapshot of queue depth and drop counters.
+
+        Returns:
+            dict: policy, maxsize, depth, dropped_total and dropped (per type).
+        """
+        with self._not_empty:
+            return {
+                "policy": self.policy,
+                "maxsize": self.maxsize,
+                "depth": self._size,
+                "dropped_total": self.dropped_total,
+                "dropped": dict(self.dropped),
+            }
@@ -8,15 +8,26 @@ def send_frame(interface, frame: bytes) -> None:
     """
     Send a raw frame over the specified communication interface.
 
+    If the interface has a TxScheduler attached (`interface.tx_scheduler`),
+    the frame is queued by priority and written by the scheduler's thread.
+
     Args:
-        interface: CommInterface instance (e.g., UARTInterface, UDPInterface).
+        interface: CommInterface instance (e.g., UARTInterface, UDPInterface),
+            or an AsyncCommInterface, which is sent to via send_nowait().
         frame (bytes): Byte sequence to transmit.
 
     Returns:
         None
     """
+    scheduler = getattr(interface, "tx_scheduler", None)
+    if scheduler is not None:
+        if scheduler.submit(frame):
+            logger.debug(f"[TRANSMITTER] QUEUED | Frame size: {len(frame)} bytes")
+        return
+
     try:
-        interface.send(frame)
+        send = getattr(interface, "send_nowait", None) or interface.send
+        send(frame)
         logger.debug(f"[TRANSMITTER] SENT | Frame size: {len(frame)} bytes")
     except Exception as e:
         logger.error(f"[TRANSMITTER] FAILED TO SEND | Error: {e}")
@@ -0,0 +1,179 @@
+# src/tools/comm/tx_scheduler.py
+
+"""
+Priority Transmit Scheduler
+
+Sits under `transmitter.send_frame`: frames are queued per priority class
+and written by one writer thread per interface, so a bulk transfer cannot
+delay a safety-critical command or ACK behind it.
+
+Priority classes (highest first), taken from the frame type byte:
+
+    ACK 'A'  >  command 'C'  >  swarm 'S'  >  telemetry 'T'  >  FTP 'F'
+
+Frames of the same class keep their submission order. On a paced link
+(see `link_pacer.LinkPacer`) the writer picks the next frame only when the
+pacer's token bucket allows a write, so urgent frames overtake queued bulk
+traffic instead of queueing behind it in the radio. The transport itself
+charges each write's airtime.
+
+ACK and command frames are always accepted; lower classes block the
+producer while the queue is full (backpressure), up to `submit_timeout`.
+"""
+
+import heapq
+import threading
+from itertools import count
+from typing import Dict, List, Optional, Tuple
+
+from src.tools.comm.rx_queue import frame_type_of
+from src.tools.log.logger import logger
+
+# Lower value = sent first; unknown types share the lowest class
+TX_PRIORITY: Dict[str, int] = {
+    'A': 0,
+    'C': 1,
+    'S': 2,
+    'T': 3,
+    'F': 4,
+}
+LOWEST_PRIORITY = max(TX_PRIORITY.values())
+# Classes up to this one bypass the queue limit
+CRITICAL_PRIORITY = TX_PRIORITY['C']
+
+DEFAULT_MAX_QUEUE = 256
+DEFAULT_SUBMIT_TIMEOUT = 1.0
+
+
+class TxScheduler:
+    """
+    Priority queue plus writer thread for one communication interface.
+
+    Attributes:
+        interface: Interface whose `send()` performs the actual write.
+        pacer (LinkPacer | None): Link budget the writer waits for; None for unpaced.
+        sent (dict): Frames written per frame type.
+        dropped (dict): Frames refused per frame type (queue full on timeout).
+    """
+
+    def __init__(
+        self,
+        interface,
+        pacer=None,
+        max_queue: int = DEFAULT_MAX_QUEUE,
+        submit_timeout: float = DEFAULT_SUBMIT_TIMEOUT
+    ) -> None:
+        """
+        Args:
+            interface: Communication interface to write to.
+            pacer (LinkPacer | None): Pacer of the link; defaults to `interface.pacer`.
+            max_queue (int): Queue limit for swarm/telemetry/FTP frames.
+            submit_timeout (float): Longest time a producer waits for queue room.
+        """
+        self.interface = interface
+        self.pacer = pacer if pacer is not None else getattr(interface, "pacer", None)
+        self.max_queue = max_queue
+        self.submit_timeout = submit_timeout
+        self.sent: Dict[str, int] = {}
+        self.dropped: Dict[str, int] = {}
+        self._heap: List[Tuple[int, int, bytes]] = []
+        self._seq = count()
+        self._cond = threading.Condition(threading.Lock())
+        self._running = False
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> None:
+        """Start the writer thread."""
+        if self._running:
+            return
+        self._running = True
+        self._thread = threading.Thread(target=self._writer, name="tx-scheduler", daemon=True)
+        self._thread.start()
+
+    def stop(self, drain: bool = True, timeout: Optional[float] = None) -> None:
+        """
+        Stop the writer thread.
+
+        Args:
+            drain (bool): Write the frames still queued before stopping.
+            timeout (float | None): Longest time to wait for the writer.
+        """
+        with self._cond:
+            self._running = False
+            if not drain:
+                self._heap.clear()
+            self._cond.notify_all()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+
+    def submit(self, frame: bytes) -> bool:
+        """
+        Queue a frame (or a batch of frames of one type) for transmission.
+
+        Args:
+            frame (bytes): Raw frame(s); the first frame's type sets the priority.
+
+        Returns:
+            bool: False if the frame was refused because the queue stayed full.
+        """
+        ftype = frame_type_of(frame)
+        prio = TX_PRIORITY.get(ftype, LOWEST_PRIORITY)
+
+        with self._cond:
+            if prio > CRITICAL_PRIORITY and len(self._heap) >= self.max_queue:
+                has_room = self._cond.wait_for(
+                    lambda: len(self._heap) < self.max_queue, self.submit_timeout
+                )
+                if not has_room:
+                    self.dropped[ftype] = self.dropped.get(ftype, 0) + 1
+                    logger.warning(f"[TX] Queue full, '{ftype}' frame dropped")
+                    return False
+            heapq.heappush(self._heap, (prio, next(self._seq), frame))
+            self._cond.notify_all()
+        return True
+
+    def pending(self) -> int:
+        """Number of frames waiting to be written."""
+        return len(self._heap)
+
+    def stats(self) -> Dict[str, object]:
+        """
+        Snapshot of the scheduler counters.
+
+        Returns:
+            dict: depth, utilisation (None if unpaced), sent and dropped (per frame type).
+        """
+        utilisation = self.pacer.utilisation() if self.pacer is not None else None
+        with self._cond:
+            return {
+                "depth": len(self._heap),
+                "utilisation": utilisation,
+                "sent": dict(self.sent),
+                "dropped": dict(self.dropped),
+            }
+
+    def _writer(self) -> None:
+        while True:
+            with self._cond:
+                while not self._heap and self._running:
+                    self._cond.wait()
+                if not self._heap:
+                    return
+                delay = self.pacer.ready_in() if self.pacer is not None else 0.0
+                if delay > 0:
+                    # Link busy: wait, then pick whatever is most urgent by then
+                    self._cond.wait(delay)
+                    continue
+                _prio, _seq, frame = heapq.heappop(self._heap)
+                self._cond.notify_all()
+
+            try:
+                self.interface.send(frame)
+            except Exception as e:
+                logger.error(f"[TX] Write failed: {e}")
+                continue
+
+            ftype = frame_type_of(frame)
+            with self._cond:
+                self.sent[ftype] = self.sent.get(ftype, 0) + 1
@@ -1,64 +1,128 @@
 # src/tools/comm/uart_handler.py
 
-from serial import SerialException, Serial
+from serial import SerialException, serial_for_url
 import threading
 import time
 import json
-import struct
-from queue import Queue
-import crcmod
+from src.core.protocol_context import get_protocol_context
+from src.tools.comm.capture import CaptureWriter, LINK_STREAM
+from src.tools.comm.link_pacer import LinkPacer
+from src.tools.comm.deframer import StreamDeframer, DEFAULT_MAX_PAYLOAD
+from src.tools.comm.rx_queue import BoundedFrameQueue, DEFAULT_QUEUE_SIZE, DEFAULT_DROP_POLICY
 from src.tools.log.logger import logger
 
-# CRC-16-CCITT-FALSE
-CRC_FUNC = crcmod.predefined.mkPredefinedCrcFun('crc-ccitt-false')
-
-class IncompleteFrame(Exception):
-    pass
-
-class BadFrame(Exception):
-    pass
+# RX modları:
+#   "blocking": seri port zaman aşımıyla bloklayarak okur, veri gelince uyanır
+#   "polling" : eski davranış; in_waiting kontrolü + 10 ms uyku
+RX_MODES = ("blocking", "polling")
+# uart.capture.path verilmezse ham trafiğin yazılacağı dosya
+DEFAULT_CAPTURE_PATH = "logs/capture/uart.lcap"
 
 class UARTHandler:
     def __init__(self, config_path="config.json"):
         self._load_config(config_path)
-        self.ser = Serial(self.port, self.baudrate, timeout=self.timeout)
-        self.rx_queue = Queue()
+        # serial_for_url hem cihaz yollarını hem de "loop://" gibi URL'leri destekler
+        self.ser = serial_for_url(self.port, self.baudrate, timeout=self.timeout)
+        # RX thread'inde çözülmüş frame'ler (sınırlı kuyruk, taşmada rx_drop_policy uygulanır)
+        self.rx_queue = BoundedFrameQueue(self.rx_queue_size, self.rx_drop_policy, name="UART")
         self.running = False
         self.thread = None
-        self._rx_buffer = bytearray()
+        # Bayt akışından frame çıkaran durum makinesi (yalnızca RX thread'i kullanır)
+        self.context = get_protocol_context(config_path)
+        self.deframer = StreamDeframer(self.context, self.max_payload)
+        # Baud hızından hesaplanan airtime ile token-bucket yazma hızı sınırı (uart.pacing)
+        self.pacer = LinkPacer.from_config(self.pacing_cfg, self.baudrate)
+        # Ham RX/TX baytlarının kaydı (uart.capture veya start_capture ile açılır)
+        self.capture = None
+        if self.capture_cfg.get("enabled", False):
+            self.start_capture(self.capture_cfg.get("path", DEFAULT_CAPTURE_PATH))
 
     def _load_config(self, path):
         with open(path, "r") as f:
             cfg = json.load(f)
-            proto = cfg.get("protocol", {})
-            self.start_byte    = proto["start_byte"]
-            self.start_byte_2  = proto["start_byte_2"]
-            self.version       = proto["version"]
-            self.port          = cfg["uart"]["port"]
-            self.baudrate      = cfg["uart"]["baudrate"]
-            self.timeout       = cfg["uart"]["timeout"]
+            uart_cfg = cfg["uart"]
+            self.port          = uart_cfg["port"]
+            self.baudrate      = uart_cfg["baudrate"]
+            self.timeout       = uart_cfg["timeout"]
+            self.max_payload   = uart_cfg.get("max_payload", DEFAULT_MAX_PAYLOAD)
+            self.rx_mode       = uart_cfg.get("rx_mode", "blocking")
+            self.rx_queue_size = uart_cfg.get("rx_queue_size", DEFAULT_QUEUE_SIZE)
+            self.rx_drop_policy = uart_cfg.get("rx_drop_policy", DEFAULT_DROP_POLICY)
+            self.pacing_cfg    = uart_cfg.get("pacing", {})
+            self.capture_cfg   = uart_cfg.get("capture", {})
+        if self.rx_mode not in RX_MODES:
+            raise ValueError(f"Unsupported uart.rx_mode: {self.rx_mode} (options: {RX_MODES})")
+        if self.rx_mode == "blocking" and not self.timeout:
+            # Zaman aşımsız bloklama stop() çağrısını geciktirmesin
+            self.timeout = 0.1
 
     def start(self):
         if not self.ser.is_open:
             self.ser.open()
         self.running = True
-        self.thread = threading.Thread(target=self._rx_worker, daemon=True)
+        worker = self._rx_worker_blocking if self.rx_mode == "blocking" else self._rx_worker
+        self.thread = threading.Thread(target=worker, daemon=True)
         self.thread.start()
 
     def stop(self):
         self.running = False
         if self.thread:
+            # Bekleyen bloklu okumayı hemen sonlandır (destekleniyorsa)
+            cancel_read = getattr(self.ser, "cancel_read", None)
+            if cancel_read is not None and self.ser.is_open:
+                cancel_read()
             self.thread.join()
         if self.ser.is_open:
             self.ser.close()
+        self.stop_capture()
+
+    def start_capture(self, path=DEFAULT_CAPTURE_PATH) -> CaptureWriter:
+        """Ham RX/TX baytlarını path'e kaydetmeye başlar (açık kayıt varsa kapatılır)."""
+        self.stop_capture()
+        self.capture = CaptureWriter(path, LINK_STREAM)
+        logger.info(f"[UART] Capture started: {path}")
+        return self.capture
+
+    def stop_capture(self) -> None:
+        """Açık kaydı kapatır."""
+        capture, self.capture = self.capture, None
+        if capture is not None:
+            capture.close()
+            logger.info(f"[UART] Capture stopped: {capture.path} ({capture.records} records)")
+
+    def _deliver(self, data: bytes) -> None:
+        # Kayıt açıksa baytlar deframer'dan önce, okunduğu parçalar halinde yazılır
+        capture = self.capture
+        if capture is not None:
+            capture.write_rx(data)
+        # Gelen baytları RX thread'inde çöz, tamamlanan frame'leri kuyruğa bırak
+        for frame in self.deframer.feed(data):
+            self.rx_queue.put(frame)
 
     def _rx_worker(self):
+        # Polling modu: gecikme ölçümü için eski davranış korunur
         while self.running:
             if self.ser.in_waiting:
                 data = self.ser.read(self.ser.in_waiting)
-                self.rx_queue.put(data)
+                self._deliver(data)
             time.sleep(0.01)
-        
+
+    def _rx_worker_blocking(self):
+        # İlk bayt gelene kadar (en fazla timeout) blokla, sonra bekleyen her şeyi al
+        while self.running:
+            try:
+                first = self.ser.read(1)
+                if not first:
+                    continue
+                waiting = self.ser.in_waiting
+                data = first + self.ser.read(waiting) if waiting else first
+            except SerialException as e:
+                if self.running:
+                    logger.error(f"UART read error: {e}")
+                    time.sleep(self.timeout)
+                continue
+            self._deliver(data)
+
     def send(self, data: bytes) -> bool:
         if not self.ser.is_open:
             try:
@@ -66,6 +130,12 @@ class UARTHandler:
             except SerialException as e:
                 logger.error(f"UART port is not open: {e}")
                 return False
+        if self.pacer is not None:
+            # Radyo tamponunu taşırmamak için önceki yazmaların airtime'ı kadar bekle
+            self.pacer.acquire(len(data))
+        capture = self.capture
+        if capture is not None:
+            capture.write_tx(data)
         try:
             self.ser.write(data)
             return True
@@ -74,60 +144,17 @@ class UARTHandler:
             return False
 
     def read(self) -> bytes | None:
-        # 1) Gelen tüm chunk'ları buffer'a ekle
-        while not self.rx_queue.empty():
-            self._rx_buffer.extend(self.rx_queue.get())
+        # RX thread'inin çözdüğü sıradaki frame (yoksa None)
+        return self.rx_queue.get_nowait()
 
-        # 2) Buffer'dan bir frame çıkarmayı dene
-        try:
-            frame, remaining = self._extract_frame(self._rx_buffer)
-            self._rx_buffer = remaining
-            return frame
-        except IncompleteFrame:
-            return None
-        except BadFrame:
-            return None
-
-    def _extract_frame(self, buf: bytearray):
-        SYNC = bytes([self.start_byte, self.start_byte_2])
-        # Header: 2 sync + 1 ver + 1 type + 1 src + 1 dst + 2 len
-        HEADER_LEN = 2 + 1 + 1 + 1 + 1 + 2
-
-        # 1) Sync arama
-        idx = buf.find(SYNC)
-        if idx < 0:
-            # Sync yoksa buffer'ı sıfırla
-            return None, bytearray()
-
-        # 2) Header tam mı?
-        if len(buf) < idx + HEADER_LEN:
-            raise IncompleteFrame()
-
-        # 3) Versiyon kontrol
-        ver = buf[idx+2]
-        if ver != self.version:
-            # Hatalı versiyon—sync'ten 1 bayt kaydır
-            buf.pop(idx)
-            return self._extract_frame(buf)
-
-        # 4) Payload uzunluğunu oku
-        payload_len = struct.unpack_from(">H", buf, idx+6)[0]
-        total_len = HEADER_LEN + payload_len + 2  # +2 CRC
-
-        if len(buf) < idx + total_len:
-            raise IncompleteFrame()
-
-        # 5) Frame parçasını al
-        frame = bytes(buf[idx:idx+total_len])
-
-        # 6) CRC kontrol
-        crc_received = struct.unpack_from(">H", frame, HEADER_LEN + payload_len)[0]
-        crc_calc = CRC_FUNC(frame[:HEADER_LEN + payload_len])
-        if crc_received != crc_calc:
-            # CRC hatalı—sync'ten 1 bayt kaydır
-            buf.pop(idx)
-            raise BadFrame()
-
-        # 7) Kalan buffer
-        remaining = buf[idx+total_len:]
-        return frame, remaining
+    def read_many(self, max_frames: int | None = None) -> list[bytes]:
+        """Hazır olan tüm frame'leri (en fazla max_frames) tek çağrıda döner."""
+        return self.rx_queue.drain(max_frames)
+
+    def wait_frame(self, timeout: float | None = None) -> bytes | None:
+        """Bir frame gelene kadar (en fazla timeout saniye) bekler."""
+        return self.rx_queue.get(timeout)
+
+    def rx_stats(self) -> dict:
+        """RX kuyruğu doluluğu ve frame tipine göre düşürülen frame sayıları."""
+        return self.rx_queue.stats()
@@ -1,44 +1,89 @@
 # src/tools/comm/udp_handler.py
 
+import ipaddress
+import selectors
 import socket
 import struct
 import threading
-import time
 import json
-from queue import Queue
 
-class UDPHandler:
-    def __init__(self, config_path="config.json"):
-        self._load_config(config_path)
-        # terminal_byte ve parsing buffer’ı kaldırıldı
-        self.rx_queue = Queue()
-        self.running = False
-        self.thread = None
+from src.core.frame_codec import split_mesh_frames
+from src.core.protocol_context import get_protocol_context
+from src.tools.comm.capture import CaptureWriter, LINK_DATAGRAM
+from src.tools.comm.link_pacer import LinkPacer
+from src.tools.comm.rx_queue import BoundedFrameQueue, DEFAULT_QUEUE_SIZE, DEFAULT_DROP_POLICY
+from src.tools.log.logger import logger
+
+# Bir uyanışta en fazla okunacak datagram sayısı (recvmmsg benzeri toplu alım)
+DEFAULT_RX_BATCH = 32
+# Tek bir datagram için alım tamponu boyutu (UDP üst sınırı)
+RX_BUFFER_SIZE = 65535
+# selector bekleme süresi; stop() en geç bu kadar sürede fark edilir
+DEFAULT_RX_TIMEOUT = 0.1
+# udp.capture.path verilmezse ham trafiğin yazılacağı dosya
+DEFAULT_CAPTURE_PATH = "logs/capture/udp.lcap"
 
-        # ●●● SOCKET OLUŞTURMA ●●●
-        self.sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM, socket.IPPROTO_UDP)
 
-        # ●●● REUSEADDR ●●●
-        self.sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+def open_udp_socket(local_ip: str, local_port: int, remote_ip: str) -> socket.socket:
+    """
+    Mesh trafiği için local_port'a bind edilmiş, bloklamayan bir UDP soketi açar.
+    remote_ip multicast ise gruba local_ip arayüzü üzerinden katılır.
+    """
+    # ●●● SOCKET OLUŞTURMA ●●●
+    sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM, socket.IPPROTO_UDP)
 
-        # ●●● BIND İŞLEMİ ●●●
-        self.sock.bind(("", self.local_port))
-        self.sock.setsockopt(
+    # ●●● REUSEADDR ●●●
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+
+    # ●●● BIND İŞLEMİ ●●●
+    sock.bind(("", local_port))
+
+    if ipaddress.ip_address(remote_ip).is_multicast:
+        sock.setsockopt(
             socket.IPPROTO_IP,
             socket.IP_MULTICAST_IF,
-            socket.inet_aton(self.local_ip)
+            socket.inet_aton(local_ip)
         )
 
         # ●●● MULTICAST GRUBUNA KATILIM ●●●
         mreq = struct.pack(
             "4s4s",
-            socket.inet_aton(self.remote_ip),
-            socket.inet_aton(self.local_ip)
+            socket.inet_aton(remote_ip),
+            socket.inet_aton(local_ip)
         )
-        self.sock.setsockopt(socket.IPPROTO_IP, socket.IP_ADD_MEMBERSHIP, mreq)
-        self.sock.setsockopt(socket.IPPROTO_IP, socket.IP_MULTICAST_LOOP, 0)
+        sock.setsockopt(socket.IPPROTO_IP, socket.IP_ADD_MEMBERSHIP, mreq)
+        sock.setsockopt(socket.IPPROTO_IP, socket.IP_MULTICAST_LOOP, 0)
+
+    sock.setblocking(False)
+    return sock
+
+
+class UDPHandler:
+    def __init__(self, config_path="config.json"):
+        self._load_config(config_path)
+        # terminal_byte ve parsing buffer’ı kaldırıldı
+        # Datagramlardan ayrılmış frame'ler (sınırlı kuyruk, taşmada rx_drop_policy uygulanır)
+        self.rx_queue = BoundedFrameQueue(self.rx_queue_size, self.rx_drop_policy, name="UDP")
+        self.context = get_protocol_context(config_path)
+        # İsteğe bağlı bant genişliği sınırı (udp.pacing, rate_bps gerekir)
+        self.pacer = LinkPacer.from_config(self.pacing_cfg)
+        # Ham datagramların kaydı (udp.capture veya start_capture ile açılır)
+        self.capture = None
+        if self.capture_cfg.get("enabled", False):
+            self.start_capture(self.capture_cfg.get("path", DEFAULT_CAPTURE_PATH))
+        self.running = False
+        self.thread = None
 
-        self.sock.setblocking(False)
+        # ●●● SOCKET OLUŞTURMA ●●●
+        self.sock = open_udp_socket(self.local_ip, self.local_port, self.remote_ip)
+
+        # ●●● ALIM TAMPON HAVUZU ●●●
+        # Her uyanışta hazır datagramlar bu tamponlara recv_into ile okunur
+        self._rx_buffers = [bytearray(RX_BUFFER_SIZE) for _ in range(self.rx_batch)]
+        self._rx_views = [memoryview(buf) for buf in self._rx_buffers]
+        self._selector = selectors.DefaultSelector()
+        self._selector.register(self.sock, selectors.EVENT_READ)
+        self.rx_datagrams = 0
 
     def _load_config(self, path):
         with open(path, "r") as f:
@@ -47,6 +92,12 @@ class UDPHandler:
         self.local_port  = udp_cfg["local_port"]
         self.remote_ip   = udp_cfg["remote_ip"]
         self.remote_port = udp_cfg["remote_port"]
+        self.rx_batch    = udp_cfg.get("rx_batch", DEFAULT_RX_BATCH)
+        self.rx_timeout  = udp_cfg.get("rx_timeout", DEFAULT_RX_TIMEOUT)
+        self.rx_queue_size  = udp_cfg.get("rx_queue_size", DEFAULT_QUEUE_SIZE)
+        self.rx_drop_policy = udp_cfg.get("rx_drop_policy", DEFAULT_DROP_POLICY)
+        self.pacing_cfg     = udp_cfg.get("pacing", {})
+        self.capture_cfg    = udp_cfg.get("capture", {})
 
     def start(self):
         """Alıcı döngüsünü başlatır."""
@@ -61,33 +112,88 @@ class UDPHandler:
         self.running = False
         if self.thread:
             self.thread.join()
+        self._selector.close()
         self.sock.close()
+        self.stop_capture()
+
+    def start_capture(self, path=DEFAULT_CAPTURE_PATH) -> CaptureWriter:
+        """Gelen ve giden datagramları path'e kaydetmeye başlar (açık kayıt varsa kapatılır)."""
+        self.stop_capture()
+        self.capture = CaptureWriter(path, LINK_DATAGRAM)
+        logger.info(f"[UDP] Capture started: {path}")
+        return self.capture
+
+    def stop_capture(self) -> None:
+        """Açık kaydı kapatır."""
+        capture, self.capture = self.capture, None
+        if capture is not None:
+            capture.close()
+            logger.info(f"[UDP] Capture stopped: {capture.path} ({capture.records} records)")
 
     def _rx_worker(self):
         """
-        Gelen ham UDP datalarını kuyruğa ekler.
-        Frame ayrımı ve CRC kontrolü parse_mesh_frame'de yapılacak.
+        Soket okunabilir olana kadar selector üzerinde bekler, uyanınca
+        hazır olan tüm datagramları (en fazla rx_batch) tampon havuzuna alır.
+        Frame ayrımı ve CRC kontrolü okuma tarafında yapılır.
         """
         while self.running:
+            if not self._selector.select(self.rx_timeout):
+                continue
+            count = self._drain()
+            self.rx_datagrams += count
+
+    def _drain(self) -> int:
+        """Hazır datagramları recv_into ile okuyup kuyruğa bırakır; okunan sayıyı döner."""
+        received = []
+        for view in self._rx_views:
             try:
-                data, _addr = self.sock.recvfrom(2048)
-                if data:
-                    # Doğrudan ham veriyi kuyruğa bırak
-                    self.rx_queue.put(data)
+                nbytes = self.sock.recv_into(view)
             except BlockingIOError:
-                pass
-            time.sleep(0.01)
+                break
+            except OSError as e:
+                if self.running:
+                    logger.error(f"[UDP] Receive error: {e}")
+                break
+            if nbytes:
+                received.append((view, nbytes))
+
+        capture = self.capture
+        if capture is not None:
+            for view, nbytes in received:
+                capture.write_rx(view[:nbytes])
+
+        # Tamponlar bir sonraki uyanışta yeniden kullanılacağı için frame'lerin kopyası alınır;
+        # toplu gönderilmiş (FrameBatchEncoder) datagramlar burada frame'lere ayrılır
+        for view, nbytes in received:
+            for frame in split_mesh_frames(view[:nbytes], context=self.context):
+                self.rx_queue.put(bytes(frame))
+        return len(received)
 
     def read(self) -> bytes | None:
         """
-        Kuyruktan bir ham UDP paketi döner.
-        Üst katmanda parse_mesh_frame ile işlenecek.
+        Kuyruktan bir ham frame döner.
+        Üst katmanda decode_mesh_frame ile işlenecek.
         """
-        return self.rx_queue.get() if not self.rx_queue.empty() else None
+        return self.rx_queue.get_nowait()
+
+    def read_many(self, max_frames: int | None = None) -> list[bytes]:
+        """
+        Kuyruktaki tüm frame'leri (en fazla max_frames) döner.
+        """
+        return self.rx_queue.drain(max_frames)
+
+    def rx_stats(self) -> dict:
+        """RX kuyruğu doluluğu ve frame tipine göre düşürülen frame sayıları."""
+        return self.rx_queue.stats()
 
     def send(self, data: bytes):
         """
         build_mesh_frame ile hazırlanmış çerçeveyi direkt gönderir.
         CRC zaten içinde, ekstra bayta gerek yok.
         """
+        if self.pacer is not None:
+            self.pacer.acquire(len(data))
+        capture = self.capture
+        if capture is not None:
+            capture.write_tx(data)
         self.sock.sendto(data, (self.remote_ip, self.remote_port))
@@ -11,7 +11,8 @@ its parameters before wrapping them in a mesh frame.
 import struct
 from typing import Any, List, Optional
 
-from src.core.frame_codec import build_mesh_frame, load_device_id
+from src.core.frame_codec import build_mesh_frame
+from src.core.protocol_context import ProtocolContext, get_protocol_context
 from src.serializers.command_serializer import serialize_command
 
 
@@ -19,7 +20,8 @@ def build_cmd_frame(
     cmd_id: int,
     params: bytes = b'',
     dst: int = 0xFF,
-    src: Optional[int] = None
+    src: Optional[int] = None,
+    context: Optional[ProtocolContext] = None
 ) -> bytes:
     """
     Build a generic command mesh frame.
@@ -28,19 +30,22 @@ def build_cmd_frame(
         cmd_id (int): Command identifier.
         params (bytes, optional): Serialized command parameters (default: empty).
         dst (int, optional): Destination device ID (default: 0xFF for broadcast).
-        src (int | None, optional): Source device ID; if None, loaded from config.
+        src (int | None, optional): Source device ID; if None, taken from the protocol context.
+        context (ProtocolContext | None, optional): Protocol context of the link; the shared default if None.
 
     Returns:
         bytes: Complete mesh frame ready for transmission.
     """
-    source = src if src is not None else load_device_id()
+    ctx = context if context is not None else get_protocol_context()
+    source = src if src is not None else ctx.device_id
     payload = serialize_command(cmd_id, params)
-    return build_mesh_frame('C', source, dst, payload)
+    return build_mesh_frame('C', source, dst, payload, context=ctx)
 
 
 def build_cmd_reboot(
     dst: int,
-    src: Optional[int] = None
+    src: Optional[int] = None,
+    context: Optional[ProtocolContext] = None
 ) -> bytes:
     """
     Build a REBOOT command frame (no parameters).
@@ -48,17 +53,19 @@ def build_cmd_reboot(
     Args:
         dst (int): Destination device ID.
         src (int | None, optional): Source device ID.
+        context (ProtocolContext | None, optional): Protocol context of the link.
 
     Returns:
         bytes: Mesh frame for reboot command.
     """
-    return build_cmd_frame(0x01, dst=dst, src=src)
+    return build_cmd_frame(0x01, dst=dst, src=src, context=context)
 
 
 def build_cmd_set_mode(
     mode: int,
     dst: int,
-    src: Optional[int] = None
+    src: Optional[int] = None,
+    context: Optional[ProtocolContext] = None
 ) -> bytes:
     """
     Build a SET_MODE command frame.
@@ -67,12 +74,13 @@ def build_cmd_set_mode(
         mode (int): Mode identifier.
         dst (int): Destination device ID.
         src (int | None, optional): Source device ID.
+        context (ProtocolContext | None, optional): Protocol context of the link.
 
     Returns:
         bytes: Mesh frame for set-mode command.
     """
     params = struct.pack(">B", mode)
-    return build_cmd_frame(0x02, params, dst, src)
+    return build_cmd_frame(0x02, params, dst, src, context)
 
 
 def build_cmd_takeoff(
@@ -81,7 +89,8 @@ def build_cmd_takeoff(
     target_lon: Optional[float] = None,
     target_alt: Optional[float] = None,
     dst: int = 0xFF,
-    src: Optional[int] = None
+    src: Optional[int] = None,
+    context: Optional[ProtocolContext] = None
 ) -> bytes:
     """
     Build a TAKEOFF command frame. Includes optional target coordinates.
@@ -93,6 +102,7 @@ def build_cmd_takeoff(
         target_alt (float | None): Target altitude (optional).
         dst (int, optional): Destination device ID.
         src (int | None, optional): Source device ID.
+        context (ProtocolContext | None, optional): Protocol context of the link.
 
     Returns:
         bytes: Mesh frame for takeoff command.
@@ -103,14 +113,15 @@ def build_cmd_takeoff(
     else:
         # only takeoff altitude
         params = struct.pack(">f", takeoff_alt)
-    return build_cmd_frame(0x03, params, dst, src)
+    return build_cmd_frame(0x03, params, dst, src, context)
 
 
 def build_cmd_landing(
     target_lat: Optional[float] = None,
     target_lon: Optional[float] = None,
     dst: int = 0xFF,
-    src: Optional[int] = None
+    src: Optional[int] = None,
+    context: Optional[ProtocolContext] = None
 ) -> bytes:
     """
     Build a LANDING command frame with optional landing coordinates.
@@ -120,6 +131,7 @@ def build_cmd_landing(
         target_lon (float | None): Landing longitude (optional).
         dst (int, optional): Destination device ID.
         src (int | None, optional): Source device ID.
+        context (ProtocolContext | None, optional): Protocol context of the link.
 
     Returns:
         bytes: Mesh frame for landing command.
@@ -128,7 +140,7 @@ def build_cmd_landing(
         params = struct.pack(">ff", target_lat, target_lon)
     else:
         params = b''
-    return build_cmd_frame(0x04, params, dst, src)
+    return build_cmd_frame(0x04, params, dst, src, context)
 
 
 def build_cmd_gimbal(
@@ -136,7 +148,8 @@ def build_cmd_gimbal(
     pitch: float,
     roll: float,
     dst: int = 0xFF,
-    src: Optional[int] = None
+    src: Optional[int] = None,
+    context: Optional[ProtocolContext] = None
 ) -> bytes:
     """
     Build a GIMBAL command frame to orient camera gimbal.
@@ -147,12 +160,13 @@ def build_cmd_gimbal(
         roll (float): Roll angle in degrees.
         dst (int, optional): Destination device ID.
         src (int | None, optional): Source device ID.
+        context (ProtocolContext | None, optional): Protocol context of the link.
 
     Returns:
         bytes: Mesh frame for gimbal command.
     """
     params = struct.pack(">fff", yaw, pitch, roll)
-    return build_cmd_frame(0x05, params, dst, src)
+    return build_cmd_frame(0x05, params, dst, src, context)
 
 
 def build_cmd_goto(
@@ -160,7 +174,8 @@ def build_cmd_goto(
     target_lon: float,
     target_alt: float,
     dst: int = 0xFF,
-    src: Optional[int] = None
+    src: Optional[int] = None,
+    context: Optional[ProtocolContext] = None
 ) -> bytes:
     """
     Build a GOTO command frame with target waypoint.
@@ -171,19 +186,21 @@ def build_cmd_goto(
         target_alt (float): Target altitude.
         dst (int, optional): Destination device ID.
         src (int | None, optional): Source device ID.
+        context (ProtocolContext | None, optional): Protocol context of the link.
 
     Returns:
         bytes: Mesh frame for goto command.
     """
     params = struct.pack(">fff", target_lat, target_lon, target_alt)
-    return build_cmd_frame(0x06, params, dst, src)
+    return build_cmd_frame(0x06, params, dst, src, context)
 
 
 def build_cmd_simple_follow_me(
     target_id: int,
     altitude: Optional[float] = None,
     dst: int = 0xFF,
-    src: Optional[int] = None
+    src: Optional[int] = None,
+    context: Optional[ProtocolContext] = None
 ) -> bytes:
     """
     Build a SIMPLE_FOLLOW_ME command frame.
@@ -193,6 +210,7 @@ def build_cmd_simple_follow_me(
         altitude (float | None): Follow altitude (optional).
         dst (int, optional): Destination device ID.
         src (int | None, optional): Source device ID.
+        context (ProtocolContext | None, optional): Protocol context of the link.
 
     Returns:
         bytes: Mesh frame for follow-me command.
@@ -201,13 +219,14 @@ def build_cmd_simple_follow_me(
         params = struct.pack(">If", target_id, altitude)
     else:
         params = struct.pack(">I", target_id)
-    return build_cmd_frame(0x07, params, dst, src)
+    return build_cmd_frame(0x07, params, dst, src, context)
 
 
 def build_cmd_waypoints(
     waypoints: List[tuple[float, float, float]],
     dst: int = 0xFF,
-    src: Optional[int] = None
+    src: Optional[int] = None,
+    context: Optional[ProtocolContext] = None
 ) -> bytes:
     """
     Build a WAYPOINTS command frame containing multiple waypoints.
@@ -216,6 +235,7 @@ def build_cmd_waypoints(
         waypoints (List[tuple[float, float, float]]): Sequence of (lat, lon, alt).
         dst (int, optional): Destination device ID.
         src (int | None, optional): Source device ID.
+        context (ProtocolContext | None, optional): Protocol context of the link.
 
     Returns:
         bytes: Mesh frame for waypoints command.
@@ -224,4 +244,4 @@ def build_cmd_waypoints(
         struct.pack(">fff", lat, lon, alt)
         for lat, lon, alt in waypoints
     )
-    return build_cmd_frame(0x09, params, dst, src)
+    return build_cmd_frame(0x09, params, dst, src, context)
@@ -9,6 +9,7 @@ over a communication interface, while logging each action.
 
 from typing import Any, List, Optional, Protocol
 
+from src.core.protocol_context import resolve_context
 from src.tools.command.command_builder import (
     build_cmd_reboot,
     build_cmd_set_mode,
@@ -43,7 +44,7 @@ def cmd_reboot(
         dst (int): Destination device ID.
         src (int | None): Optional source device ID.
     """
-    frame = build_cmd_reboot(dst, src)
+    frame = build_cmd_reboot(dst, src, resolve_context(interface))
     send_frame(interface, frame)
     logger.info(f"[COMMAND] SENT | REBOOT -> DST: {dst}")
 
@@ -63,7 +64,7 @@ def cmd_set_mode(
         dst (int): Destination device ID.
         src (int | None): Optional source device ID.
     """
-    frame = build_cmd_set_mode(mode, dst, src)
+    frame = build_cmd_set_mode(mode, dst, src, resolve_context(interface))
     send_frame(interface, frame)
     logger.info(f"[COMMAND] SENT | SET_MODE({mode}) -> DST: {dst}")
 
@@ -90,7 +91,7 @@ def cmd_takeoff(
         src (int | None, optional): Source device ID.
     """
     frame = build_cmd_takeoff(
-        takeoff_alt, target_lat, target_lon, target_alt, dst, src
+        takeoff_alt, target_lat, target_lon, target_alt, dst, src, resolve_context(interface)
     )
     send_frame(interface, frame)
     logger.info(f"[COMMAND] SENT | TAKEOFF({takeoff_alt}) -> DST: {dst}")
@@ -113,7 +114,7 @@ def cmd_landing(
         dst (int, optional): Destination device ID.
         src (int | None, optional): Source device ID.
     """
-    frame = build_cmd_landing(target_lat, target_lon, dst, src)
+    frame = build_cmd_landing(target_lat, target_lon, dst, src, resolve_context(interface))
     send_frame(interface, frame)
     logger.info(f"[COMMAND] SENT | LANDING -> DST: {dst}")
 
@@ -137,7 +138,7 @@ def cmd_gimbal(
         dst (int, optional): Destination device ID.
         src (int | None, optional): Source device ID.
     """
-    frame = build_cmd_gimbal(yaw, pitch, roll, dst, src)
+    frame = build_cmd_gimbal(yaw, pitch, roll, dst, src, resolve_context(interface))
     send_frame(interface, frame)
     logger.info(
         f"[COMMAND] SENT | GIMBAL(yaw={yaw:.1f}, pitch={pitch:.1f}, roll={roll:.1f}) -> DST: {dst}"
@@ -163,7 +164,7 @@ def cmd_goto(
         dst (int, optional): Destination device ID.
         src (int | None, optional): Source device ID.
     """
-    frame = build_cmd_goto(target_lat, target_lon, target_alt, dst, src)
+    frame = build_cmd_goto(target_lat, target_lon, target_alt, dst, src, resolve_context(interface))
     send_frame(interface, frame)
     logger.info(
         f"[COMMAND] SENT | GOTO(lat={target_lat:.5f}, lon={target_lon:.5f}, alt={target_alt}) -> DST: {dst}"
@@ -187,7 +188,7 @@ def cmd_simple_follow_me(
         dst (int, optional): Destination device ID.
         src (int | None, optional): Source device ID.
     """
-    frame = build_cmd_simple_follow_me(target_id, altitude, dst, src)
+    frame = build_cmd_simple_follow_me(target_id, altitude, dst, src, resolve_context(interface))
     send_frame(interface, frame)
     logger.info(
         f"[COMMAND] SENT | FOLLOW_ME(target={target_id}, alt={altitude}) -> DST: {dst}"
@@ -209,6 +210,6 @@ def cmd_waypoints(
         dst (int, optional): Destination device ID.
         src (int | None, optional): Source device ID.
     """
-    frame = build_cmd_waypoints(waypoints, dst, src)
+    frame = build_cmd_waypoints(waypoints, dst, src, resolve_context(interface))
     send_frame(interface, frame)
     logger.info(f"[COMMAND] SENT | WAYPOINTS(count={len(waypoints)}) -> DST: {dst}")
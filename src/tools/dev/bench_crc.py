@@ -0,0 +1,85 @@
+# src/tools/dev/bench_crc.py
+
+"""
+CRC Benchmark
+
+Compares the CRC-16-CCITT-FALSE backends available in this environment
+(crcmod, LYNK slice-by-8 fallback, plain byte-wise table loop) on
+typical frame sizes, plus incremental vs. concatenate-then-CRC for an
+FTP chunk frame.
+
+Usage:
+    python -m src.tools.dev.bench_crc
+"""
+
+import os
+import timeit
+from typing import Callable, Dict
+
+from src.core import crc as crc_engine
+
+FRAME_SIZES = (16, 75, 1544)   # short telemetry, heartbeat, FTP chunk (header + 1536B)
+TARGET_SECONDS = 0.2
+
+
+def _update_bytewise(crc: int, data: bytes) -> int:
+    """Classic one-table, byte-at-a-time loop, for reference."""
+    t0 = crc_engine._TABLES[0]
+    for b in data:
+        crc = ((crc << 8) & 0xFFFF) ^ t0[(crc >> 8) ^ b]
+    return crc
+
+
+def _backends() -> Dict[str, Callable[[int, bytes], int]]:
+    """Collect every CRC backend that can run here."""
+    backends: Dict[str, Callable[[int, bytes], int]] = {
+        "python-bytewise": _update_bytewise,
+        "python-slice8": crc_engine.update_python,
+    }
+    try:
+        import crcmod.predefined
+        fast = crcmod.predefined.mkPredefinedCrcFun('crc-ccitt-false')
+        backends["crcmod"] = lambda crc, data: fast(data, crc)
+    except ImportError:
+        pass
+    return backends
+
+
+def _rate(fn: Callable[[], object], nbytes: int) -> float:
+    """Return throughput in MB/s for repeated calls of fn."""
+    timer = timeit.Timer(fn)
+    loops, elapsed = timer.autorange()
+    while elapsed < TARGET_SECONDS:
+        loops *= 2
+        elapsed = timer.timeit(loops)
+    return nbytes * loops / elapsed / 1e6
+
+
+def main() -> None:
+    print(f"Active backend: {crc_engine.BACKEND}\n")
+    backends = _backends()
+
+    for size in FRAME_SIZES:
+        data = os.urandom(size)
+        expected = crc_engine.crc16(data)
+        print(f"--- {size} bytes ---")
+        for name, fn in backends.items():
+            if fn(crc_engine.CRC_INIT, data) != expected:
+                print(f"  {name:<18} WRONG RESULT, skipped")
+                continue
+            rate = _rate(lambda: fn(crc_engine.CRC_INIT, data), size)
+            print(f"  {name:<18} {rate:10.2f} MB/s")
+
+    header, payload = os.urandom(12), os.urandom(1536)
+    concat = _rate(lambda: crc_engine.crc16(header + payload), len(header) + len(payload))
+    incremental = _rate(
+        lambda: crc_engine.update(crc_engine.update(crc_engine.CRC_INIT, header), payload),
+        len(header) + len(payload)
+    )
+    print("\n--- FTP chunk frame (8B header + 4B chunk prefix + 1536B data) ---")
+    print(f"  concatenate + crc  {concat:10.2f} MB/s")
+    print(f"  incremental update {incremental:10.2f} MB/s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+# src/tools/dev/bench_telemetry_codecs.py
+
+"""
+Telemetry Codec Benchmark
+
+Compares the precompiled codecs in `telemetry_codecs` with the previous
+lambda-based TELEMETRY_CODECS (format strings parsed per call, key list
+rebuilt per decode, tlm_id byte concatenated to the body).
+
+Usage:
+    python -m src.tools.dev.bench_telemetry_codecs
+"""
+
+import struct
+import timeit
+from typing import Callable
+
+from src.serializers.telemetry_codecs import GPS, HEARTBEAT
+
+TARGET_SECONDS = 0.2
+
+GPS_PARAMS = (37.000123, 35.000456, 120.5)
+HEARTBEAT_PARAMS = ("GUIDED", "OK", True, True, 12)
+
+
+# Previous implementation, kept here for reference
+def _legacy_gps_serialize(tlm_id: int, *p) -> bytes:
+    return struct.pack(">B", tlm_id) + struct.pack(">3f", *p)
+
+
+def _legacy_gps_deserialize(data: bytes) -> dict:
+    result = {"tlm_id": 0x01}
+    result.update(dict(zip(["lat", "lon", "alt"], struct.unpack(">3f", data))))
+    return result
+
+
+def _legacy_heartbeat_serialize(tlm_id: int, *p) -> bytes:
+    return struct.pack(">B", tlm_id) + (
+        p[0].encode("utf-8")[:32].ljust(32, b'\x00') +
+        p[1].encode("utf-8")[:32].ljust(32, b'\x00') +
+        struct.pack(">??B", *p[2:])
+    )
+
+
+def _legacy_heartbeat_deserialize(data: bytes) -> dict:
+    result = {"tlm_id": 0x04}
+    result.update({
+        "mode": bytes(data[:32]).decode("utf-8").rstrip('\x00'),
+        "health": bytes(data[32:64]).decode("utf-8").rstrip('\x00'),
+        **dict(zip(["is_armed", "gps_fix", "sat_count"], struct.unpack(">??B", data[64:67])))
+    })
+    return result
+
+
+def _rate(fn: Callable[[], object]) -> float:
+    """Return calls per second for repeated calls of fn."""
+    timer = timeit.Timer(fn)
+    loops, elapsed = timer.autorange()
+    while elapsed < TARGET_SECONDS:
+        loops *= 2
+        elapsed = timer.timeit(loops)
+    return loops / elapsed
+
+
+def _row(label: str, legacy: float, new: float) -> None:
+    print(f"  {label:<26} {legacy / 1e3:9.0f}k/s  {new / 1e3:9.0f}k/s  x{new / legacy:4.2f}")
+
+
+def _bench(name: str, codec, params, legacy_ser, legacy_de) -> None:
+    payload = codec.pack_payload(*params)
+    body = payload[1:]
+    assert payload == legacy_ser(codec.tlm_id, *params)
+    assert codec.decode_dict(body) == legacy_de(body)
+    buf = bytearray(256)
+
+    print(f"--- {name} ({len(payload)}B payload) ---        legacy        codec")
+    _row("serialize", _rate(lambda: legacy_ser(codec.tlm_id, *params)), _rate(lambda: codec.pack_payload(*params)))
+    _row("serialize (pack_into)", _rate(lambda: legacy_ser(codec.tlm_id, *params)),
+         _rate(lambda: codec.pack_into(buf, 0, *params)))
+    _row("deserialize -> dict", _rate(lambda: legacy_de(body)), _rate(lambda: codec.decode_dict(body)))
+    _row("deserialize -> record", _rate(lambda: legacy_de(body)), _rate(lambda: codec.decode(body)))
+
+
+def main() -> None:
+    _bench("GPS", GPS, GPS_PARAMS, _legacy_gps_serialize, _legacy_gps_deserialize)
+    _bench("HEARTBEAT", HEARTBEAT, HEARTBEAT_PARAMS, _legacy_heartbeat_serialize, _legacy_heartbeat_deserialize)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+# src/tools/dev/bench_uart_rx.py
+
+"""
+UART Receive Latency Benchmark
+
+Measures the time from writing a frame to the serial port until the decoded
+frame is available to the reader, for the "blocking" and "polling" RX modes
+of UARTHandler. Uses pyserial's "loop://" port, so no hardware is needed.
+
+Usage:
+    python -m src.tools.dev.bench_uart_rx [frames]
+"""
+
+import json
+import os
+import statistics
+import sys
+import tempfile
+import time
+
+from src.core.frame_codec import build_mesh_frame
+from src.tools.comm.uart_handler import UARTHandler, RX_MODES
+
+DEFAULT_FRAMES = 200
+SEND_INTERVAL = 0.005
+
+
+def _write_config(directory: str, rx_mode: str) -> str:
+    """Create a loopback config for the given RX mode and return its path."""
+    cfg = {
+        "vehicle": {"id": 1},
+        "protocol": {"start_byte": 84, "start_byte_2": 199, "version": 1},
+        "uart": {"port": "loop://", "baudrate": 57600, "timeout": 0.1, "rx_mode": rx_mode}
+    }
+    path = os.path.join(directory, f"config_{rx_mode}.json")
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(cfg, f)
+    return path
+
+
+def measure(rx_mode: str, frames: int) -> list[float]:
+    """Return per-frame write-to-read latencies in milliseconds."""
+    with tempfile.TemporaryDirectory() as tmp:
+        handler = UARTHandler(_write_config(tmp, rx_mode))
+        handler.start()
+        frame = build_mesh_frame('T', 1, 2, b"\x01" * 13)
+        latencies = []
+        try:
+            for _ in range(frames):
+                sent = time.perf_counter()
+                handler.send(frame)
+                if handler.wait_frame(timeout=1.0) is None:
+                    raise RuntimeError(f"{rx_mode}: frame lost")
+                latencies.append((time.perf_counter() - sent) * 1000.0)
+                time.sleep(SEND_INTERVAL)
+        finally:
+            handler.stop()
+        return latencies
+
+
+def main() -> None:
+    frames = int(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_FRAMES
+    print(f"UART RX latency over loop://, {frames} frames\n")
+    print(f"{'mode':<10}{'mean ms':>10}{'p50 ms':>10}{'p99 ms':>10}{'max ms':>10}")
+    for mode in RX_MODES:
+        lat = sorted(measure(mode, frames))
+        p99 = lat[min(len(lat) - 1, int(len(lat) * 0.99))]
+        print(f"{mode:<10}{statistics.mean(lat):>10.3f}{statistics.median(lat):>10.3f}"
+              f"{p99:>10.3f}{lat[-1]:>10.3f}")
+
+
+if __name__ == "__main__":
+    main()
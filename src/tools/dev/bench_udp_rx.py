@@ -0,0 +1,131 @@
+# src/tools/dev/bench_udp_rx.py
+
+"""
+UDP Receive Throughput Benchmark
+
+Floods a UDPHandler bound on 127.0.0.1 with mesh frames from a plain socket
+and reports the datagram rate the receive thread achieved, next to a baseline
+that reproduces the legacy non-blocking recvfrom + 10 ms sleep loop.
+
+Usage:
+    python -m src.tools.dev.bench_udp_rx [datagrams]
+"""
+
+import json
+import os
+import socket
+import sys
+import tempfile
+import threading
+import time
+
+from src.core.frame_codec import build_mesh_frame
+from src.tools.comm.udp_handler import UDPHandler
+
+DEFAULT_DATAGRAMS = 20000
+RX_PORT = 47001
+TX_PORT = 47002
+DRAIN_TIMEOUT = 2.0
+
+
+def _write_config(directory: str, queue_size: int) -> str:
+    """Create a unicast loopback config whose RX queue holds every frame, and return its path."""
+    cfg = {
+        "vehicle": {"id": 1},
+        "protocol": {"start_byte": 84, "start_byte_2": 199, "version": 1},
+        "udp": {
+            "local_ip": "127.0.0.1", "local_port": RX_PORT,
+            "remote_ip": "127.0.0.1", "remote_port": TX_PORT,
+            "rx_queue_size": queue_size
+        }
+    }
+    path = os.path.join(directory, "config.json")
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(cfg, f)
+    return path
+
+
+def _flood(count: int, frame: bytes, pace_every: int = 64) -> None:
+    """Send `count` datagrams to RX_PORT, yielding briefly to avoid overrunning the socket buffer."""
+    tx = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    try:
+        for i in range(count):
+            tx.sendto(frame, ("127.0.0.1", RX_PORT))
+            if i % pace_every == pace_every - 1:
+                time.sleep(0)
+    finally:
+        tx.close()
+
+
+def _run(received, count: int, frame: bytes) -> tuple[int, float]:
+    """Flood, wait until the receiver stops making progress, return (received, seconds)."""
+    start = time.perf_counter()
+    _flood(count, frame)
+    last, last_change = received(), time.perf_counter()
+    while received() < count:
+        time.sleep(0.01)
+        now_count = received()
+        if now_count != last:
+            last, last_change = now_count, time.perf_counter()
+        elif time.perf_counter() - last_change > DRAIN_TIMEOUT:
+            break
+    return received(), last_change - start
+
+
+def bench_handler(config_path: str, count: int, frame: bytes) -> tuple[int, float]:
+    """Measure the selector-based UDPHandler receive thread."""
+    handler = UDPHandler(config_path)
+    handler.start()
+    try:
+        return _run(lambda: len(handler.rx_queue), count, frame)
+    finally:
+        handler.stop()
+
+
+def bench_legacy(count: int, frame: bytes) -> tuple[int, float]:
+    """Measure the legacy loop: one non-blocking recvfrom per 10 ms sleep."""
+    sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    sock.bind(("", RX_PORT))
+    sock.setblocking(False)
+    got = [0]
+    running = [True]
+
+    def worker():
+        while running[0]:
+            try:
+                if sock.recvfrom(2048)[0]:
+                    got[0] += 1
+            except BlockingIOError:
+                pass
+            time.sleep(0.01)
+
+    thread = threading.Thread(target=worker, daemon=True)
+    thread.start()
+    try:
+        # Legacy loop tops out near 100 datagrams/s; keep the run short
+        return _run(lambda: got[0], min(count, 200), frame)
+    finally:
+        running[0] = False
+        thread.join()
+        sock.close()
+
+
+def main() -> None:
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_DATAGRAMS
+    frame = build_mesh_frame('T', 2, 1, b"\x01" * 13)
+    with tempfile.TemporaryDirectory() as tmp:
+        config_path = _write_config(tmp, count)
+        print(f"UDP RX over 127.0.0.1:{RX_PORT}, {len(frame)}-byte frames\n")
+        print(f"{'receiver':<12}{'sent':>8}{'received':>10}{'seconds':>10}{'dgram/s':>12}")
+        for name, result, sent in (
+            ("selectors", bench_handler(config_path, count, frame), count),
+            ("legacy", bench_legacy(count, frame), min(count, 200)),
+        ):
+            got, seconds = result
+            rate = got / seconds if seconds > 0 else float("inf")
+            print(f"{name:<12}{sent:>8}{got:>10}{seconds:>10.3f}{rate:>12.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -5,26 +5,36 @@ FTP Builder Module
 
 Implements a reliable, FTP‐like file transfer over the mesh network:
   1) START frame (filename)
-  2) CHUNK frames (with retries and ACK tracking)
+  2) CHUNK frames, pipelined: up to a window of chunks in flight, per-chunk
+     or bitmap (selective-repeat) ACK tracking, retransmission of timed-out,
+     NACKed or missing chunks only, and an AIMD window (see ftp_window)
   3) END frame (total chunk count)
+
+The file is streamed: chunks are read on demand into one reusable buffer
+(ChunkReader), so memory use does not grow with the file size.
 """
 
 import os
 import math
 import time
 import json
+from collections import deque
 from pathlib import Path
-from typing import Any, Protocol
+from typing import Any, BinaryIO, Protocol
 
-from src.core.frame_codec import build_mesh_frame, parse_mesh_frame
+from src.core.frame_codec import build_mesh_frame, build_mesh_frame_from_parts, decode_mesh_frame
 from src.core.frame_router import route_frame
+from src.core.protocol_context import resolve_context
 from src.serializers.ftp_serializer import (
+    bitmap_has_chunk,
     serialize_ftp_start,
-    serialize_ftp_chunk,
+    serialize_ftp_chunk_prefix,
     serialize_ftp_end
 )
+from src.tools.comm.transmitter import send_frame
 from src.tools.log.logger import logger
-from src.tools.ack.ack_tracker import clear_ack, get_ack_status
+from src.tools.ack.ack_tracker import clear_ack, clear_ftp_bitmap, get_ack_status, get_ftp_bitmap
+from src.tools.ftp.ftp_window import CongestionWindow, RttEstimator
 
 # === Load FTP settings from project root config.json ===
 CONFIG_PATH: Path = Path(__file__).parents[3] / "config.json"
@@ -35,14 +45,209 @@ _ftp_cfg = _CONFIG["file_transfer"]
 PKT_SIZE: int    = _ftp_cfg["packet_size"]
 TIMEOUT_MS: int  = _ftp_cfg["timeout_ms"]
 MAX_RETRIES: int = _ftp_cfg["max_retries"]
+WINDOW_SIZE: int = _ftp_cfg.get("window_size", 8)
+MAX_WINDOW: int  = _ftp_cfg.get("max_window", 64)
+ACK_EVERY: int   = _ftp_cfg.get("ack_every", 0)
+
+# Lower bound of the adaptive chunk timeout (TIMEOUT_MS is the upper bound)
+MIN_RTO_SECS = 0.05
+# Sleep between ACK polls while the window is full and nothing arrived
+POLL_INTERVAL = 0.002
 
 
 class SendableInterface(Protocol):
     """
-    Protocol for interfaces that support send() and read() or uart.read().
+    Protocol for interfaces that support send() and read_many().
     """
     def send(self, frame: bytes) -> None: ...
-    def read(self) -> bytes | None: ...
+    def read_many(self, max_frames: int | None = None) -> list[bytes]: ...
+
+
+class ChunkReader:
+    """
+    Reads fixed-size chunks of an open binary file into a single reusable
+    buffer; retransmissions read their chunk again instead of keeping it.
+
+    Attributes:
+        chunk_size (int): Bytes per chunk (the last one may be shorter).
+        size (int): File size in bytes.
+        total_chunks (int): Number of chunks.
+    """
+
+    def __init__(self, f: BinaryIO, chunk_size: int) -> None:
+        """
+        Args:
+            f (BinaryIO): Seekable file opened for binary reading.
+            chunk_size (int): Bytes per chunk.
+        """
+        self._file = f
+        self.chunk_size = chunk_size
+        self.size = f.seek(0, os.SEEK_END)
+        self.total_chunks = math.ceil(self.size / chunk_size)
+        self._buffer = bytearray(chunk_size)
+        self._view = memoryview(self._buffer)
+        self._pos = -1    # file position after the last read, to skip seeks on sequential reads
+
+    def read(self, seq: int) -> memoryview:
+        """
+        Read one chunk.
+
+        The returned view aliases the shared buffer and is only valid until
+        the next read(); frame builders copy it into the frame.
+
+        Args:
+            seq (int): Chunk sequence number.
+
+        Returns:
+            memoryview: Chunk data.
+        """
+        offset = seq * self.chunk_size
+        length = max(0, min(self.chunk_size, self.size - offset))
+        if offset != self._pos:
+            self._file.seek(offset)
+        filled = 0
+        while filled < length:
+            n = self._file.readinto(self._view[filled:length])
+            if not n:
+                raise RuntimeError(f"[FTP] File shrank while sending (chunk {seq})")
+            filled += n
+        self._pos = offset + filled
+        return self._view[:filled]
+
+
+def _process_incoming(interface: SendableInterface, context) -> None:
+    """
+    Decode and route every frame currently pending on the interface.
+    """
+    for raw in interface.read_many():
+        try:
+            frm = decode_mesh_frame(raw, context=context)
+        except ValueError as e:
+            logger.warning(f"[FTP] Dropped invalid frame: {e}")
+            continue
+        route_frame(frm, interface)
+
+
+def _send_chunks(
+    interface: SendableInterface,
+    reader: ChunkReader,
+    src: int,
+    dst: int,
+    context,
+    ack_every: int = 0
+) -> list[int]:
+    """
+    Send every chunk with up to `window.limit` chunks awaiting ACK.
+
+    Retransmissions go ahead of new chunks. A chunk counts as lost when it
+    is NACKed or not ACKed within the RTT-based timeout; a loss halves the
+    window and a timeout doubles the RTO, each at most once per window, and
+    each ACK grows the window by 1/window.
+
+    With ack_every > 0 the receiver answers with bitmap ACKs instead of one
+    ACK per chunk. The chunk that fills the window, retransmissions and the
+    last chunk then carry ACK_REQUEST so the window never waits for the
+    ack_every-th chunk, and a chunk missing from a bitmap that acknowledges
+    a later-sent chunk is retransmitted at once (the link keeps order).
+
+    Returns:
+        list[int]: Sequence numbers given up after MAX_RETRIES attempts.
+    """
+    total_chunks = reader.total_chunks
+    window = CongestionWindow(WINDOW_SIZE, maximum=MAX_WINDOW)
+    timeout_secs = TIMEOUT_MS / 1000.0
+    rtt = RttEstimator(timeout_secs, min_rto=min(MIN_RTO_SECS, timeout_secs), max_rto=timeout_secs)
+    in_flight: dict[int, tuple[float, int, int]] = {}   # seq -> (sent_at, attempt, send order)
+    retransmit: deque[tuple[int, int]] = deque()        # (seq, attempt)
+    failed: list[int] = []
+    next_seq = 0
+    sends = 0
+    resent = 0
+    last_bitmap = None
+    started = time.monotonic()
+    clear_ftp_bitmap(dst)
+
+    def transmit(seq: int, attempt: int) -> None:
+        nonlocal sends
+        ack_request = bool(ack_every) and (
+            attempt > 1 or seq == total_chunks - 1 or len(in_flight) + 1 >= window.limit
+        )
+        clear_ack(f"FTP_CHUNK_{seq}", dst)
+        send_frame(interface, build_mesh_frame_from_parts(
+            'F', src, dst,
+            (serialize_ftp_chunk_prefix(seq, ack_request), reader.read(seq)),
+            context=context
+        ))
+        in_flight[seq] = (time.monotonic(), attempt, sends)
+        sends += 1
+        logger.debug(f"[FTP] CHUNK {seq} sent (attempt {attempt}, window={window.limit})")
+
+    while next_seq < total_chunks or in_flight or retransmit:
+        busy = False
+        while retransmit and len(in_flight) < window.limit:
+            transmit(*retransmit.popleft())
+            resent += 1
+            busy = True
+        while next_seq < total_chunks and len(in_flight) < window.limit:
+            transmit(next_seq, 1)
+            next_seq += 1
+            busy = True
+
+        _process_incoming(interface, context)
+        now = time.monotonic()
+
+        # Chunks acknowledged by a new bitmap, and the latest-sent among them
+        bitmap_acked: set[int] = set()
+        newest = -1
+        bitmap = get_ftp_bitmap(dst)
+        if bitmap is not None and bitmap != last_bitmap:
+            last_bitmap = bitmap
+            base, bits = bitmap
+            for seq, (_, _, order) in in_flight.items():
+                if bitmap_has_chunk(base, bits, seq):
+                    bitmap_acked.add(seq)
+                    newest = max(newest, order)
+
+        for seq, (sent_at, attempt, order) in list(in_flight.items()):
+            chunk_key = f"FTP_CHUNK_{seq}"
+            status = 0 if seq in bitmap_acked else get_ack_status(chunk_key, dst)
+            if status == 0:
+                clear_ack(chunk_key, dst)
+                del in_flight[seq]
+                if attempt == 1:
+                    rtt.sample(now - sent_at)
+                window.on_ack()
+                busy = True
+                continue
+            timed_out = now - sent_at >= rtt.rto
+            if status is None and order > newest and not timed_out:
+                continue
+
+            # NACKed (or expired), missing from a bitmap, or timed out: schedule only this chunk again
+            clear_ack(chunk_key, dst)
+            del in_flight[seq]
+            window.on_loss(seq, next_seq)
+            if status is None and order > newest:
+                rtt.on_timeout(order, sends)
+            busy = True
+            if attempt >= MAX_RETRIES:
+                failed.append(seq)
+                logger.error(f"[FTP] CHUNK {seq} failed after {MAX_RETRIES} attempts")
+            else:
+                retransmit.append((seq, attempt + 1))
+                reason = f"status={status}" if status is not None else (
+                    "timeout" if order > newest else "missing from bitmap")
+                logger.warning(f"[FTP] CHUNK {seq} failed ({reason}), retrying")
+
+        if not busy:
+            time.sleep(POLL_INTERVAL)
+
+    elapsed = time.monotonic() - started
+    logger.info(
+        f"[FTP] {total_chunks} chunks sent in {elapsed:.2f}s | retransmissions={resent} "
+        f"| window={window.limit} | rto={rtt.rto * 1000:.0f}ms | ack_every={ack_every}"
+    )
+    return failed
 
 
 def send_ftp_file(
@@ -57,95 +262,71 @@ def send_ftp_file(
     Raises:
         RuntimeError: If any step fails after MAX_RETRIES or timeout.
     """
-    # Read file
+    # Open file; chunks are read from it on demand (see ChunkReader)
     try:
-        with open(filepath, "rb") as f:
-            data = f.read()
+        f = open(filepath, "rb", buffering=0)
     except Exception as e:
         raise RuntimeError(f"[FTP] {e}")
 
-    total_chunks = math.ceil(len(data) / PKT_SIZE)
-    timeout_secs = TIMEOUT_MS / 1000.0
-    filename = os.path.basename(filepath)
-
-    # --- 1) START frame with retries ---
-    start_key = "FTP_START"
-    clear_ack(start_key, dst)
-    start_frame = build_mesh_frame('F', src, dst, payload=serialize_ftp_start(filename))
-    ack_received = False
-
-    for attempt in range(1, MAX_RETRIES + 1):
-        interface.send(start_frame)
-        logger.info(f"[FTP] START sent (attempt {attempt}) | filename={filename}")
-
-        start_t = time.time()
-        while time.time() - start_t < timeout_secs:
-            raw = interface.read() if not hasattr(interface, 'uart') else interface.uart.read()
-            if raw:
-                frm = parse_mesh_frame(raw)
-                route_frame(frm, interface)
-                if get_ack_status(start_key, dst) == 0:
-                    ack_received = True
-                    break
-            time.sleep(0.01)
-
-        if ack_received:
-            clear_ack(start_key, dst)
-            logger.debug("[FTP] START ACK received")
-            break
+    with f:
+        context = resolve_context(interface)
+        reader = ChunkReader(f, PKT_SIZE)
+        total_chunks = reader.total_chunks
+        timeout_secs = TIMEOUT_MS / 1000.0
+        filename = os.path.basename(filepath)
 
+        # --- 1) START frame with retries ---
+        start_key = "FTP_START"
         clear_ack(start_key, dst)
-        logger.warning(f"[FTP] START not ACKed on attempt {attempt}, retrying")
-    else:
-        logger.error(f"[FTP] START not ACKed within timeout")
-
-    # --- 2) CHUNK frames ---
-    for seq in range(total_chunks):
-        chunk_key = f"FTP_CHUNK_{seq}"
-        clear_ack(chunk_key, dst)
+        clear_ack("FTP_ACK_EVERY", dst)
+        start_frame = build_mesh_frame('F', src, dst, payload=serialize_ftp_start(filename, ACK_EVERY), context=context)
+        ack_received = False
+
         for attempt in range(1, MAX_RETRIES + 1):
-            interface.send(build_mesh_frame('F', src, dst, payload=serialize_ftp_chunk(seq, data[seq*PKT_SIZE:(seq+1)*PKT_SIZE])))
-            logger.debug(f"[FTP] CHUNK {seq} sent (attempt {attempt})")
+            send_frame(interface, start_frame)
+            logger.info(f"[FTP] START sent (attempt {attempt}) | filename={filename}")
+
             start_t = time.time()
-            status = None
             while time.time() - start_t < timeout_secs:
-                raw = interface.read() if not hasattr(interface, 'uart') else interface.uart.read()
-                if raw:
-                    frm = parse_mesh_frame(raw)
-                    route_frame(frm, interface)
-                status = get_ack_status(chunk_key, dst)
-                if status is not None:
+                _process_incoming(interface, context)
+                if get_ack_status(start_key, dst) == 0:
+                    ack_received = True
                     break
                 time.sleep(0.01)
-            if status == 0:
-                clear_ack(chunk_key, dst)
-                logger.debug(f"[FTP] CHUNK {seq} ACKed")
+
+            if ack_received:
+                clear_ack(start_key, dst)
+                logger.debug("[FTP] START ACK received")
                 break
-            clear_ack(chunk_key, dst)
-            logger.warning(f"[FTP] CHUNK {seq} failed (status={status}), retrying")
+
+            clear_ack(start_key, dst)
+            logger.warning(f"[FTP] START not ACKed on attempt {attempt}, retrying")
         else:
-            logger.error(f"[FTP] CHUNK {seq} failed after {MAX_RETRIES} attempts")
-            
-
-    # --- 3) END frame with retries ---
-    end_key = "FTP_END"
-    clear_ack(end_key, dst)
-    end_frame = build_mesh_frame('F', src, dst, payload=serialize_ftp_end(total_chunks))
-
-    for attempt in range(1, MAX_RETRIES + 1):
-        interface.send(end_frame)
-        logger.info(f"[FTP] END sent (attempt {attempt}) | total_chunks={total_chunks}")
-        start_t = time.time()
-        while time.time() - start_t < timeout_secs:
-            raw = interface.read() if not hasattr(interface, 'uart') else interface.uart.read()
-            if raw:
-                frm = parse_mesh_frame(raw)
-                route_frame(frm, interface)
+            logger.error(f"[FTP] START not ACKed within timeout")
+
+        # --- 2) CHUNK frames ---
+        # Receivers that predate bitmap ACKs answer START with 0 (per-chunk ACKs)
+        ack_every = get_ack_status("FTP_ACK_EVERY", dst) if ack_received else None
+        clear_ack("FTP_ACK_EVERY", dst)
+        _send_chunks(interface, reader, src, dst, context,
+                     ack_every if isinstance(ack_every, int) else 0)
+
+        # --- 3) END frame with retries ---
+        end_key = "FTP_END"
+        clear_ack(end_key, dst)
+        end_frame = build_mesh_frame('F', src, dst, payload=serialize_ftp_end(total_chunks), context=context)
+
+        for attempt in range(1, MAX_RETRIES + 1):
+            send_frame(interface, end_frame)
+            logger.info(f"[FTP] END sent (attempt {attempt}) | total_chunks={total_chunks}")
+            start_t = time.time()
+            while time.time() - start_t < timeout_secs:
+                _process_incoming(interface, context)
                 if get_ack_status(end_key, dst) == 0:
                     clear_ack(end_key, dst)
                     logger.debug("[FTP] END ACK received")
                     return
-            time.sleep(0.01)
-        clear_ack(end_key, dst)
-        logger.warning(f"[FTP] END not ACKed on attempt {attempt}")
-    logger.error("[FTP] END not ACKed within timeout")
\ No newline at end of file
+                time.sleep(0.01)
+            clear_ack(end_key, dst)
+            logger.warning(f"[FTP] END not ACKed on attempt {attempt}")
+        logger.error("[FTP] END not ACKed within timeout")
\ No newline at end of file
@@ -0,0 +1,122 @@
+# src/tools/ftp/ftp_window.py
+
+"""
+FTP Window Module
+
+Flow-control state for the pipelined FTP sender:
+
+  - CongestionWindow: number of chunks allowed in flight, adapted AIMD-style
+    (+1 chunk per window of ACKs, halved on loss at most once per window).
+  - RttEstimator: smoothed round-trip time and retransmission timeout
+    (RFC 6298: SRTT/RTTVAR, RTO = SRTT + 4·RTTVAR, doubled on timeout at
+    most once per window).
+"""
+
+
+class CongestionWindow:
+    """
+    Additive-increase / multiplicative-decrease window, in chunks.
+
+    Attributes:
+        size (float): Current window (fractional between increases).
+        minimum (int): Smallest window.
+        maximum (int): Largest window.
+    """
+
+    def __init__(self, initial: int, minimum: int = 1, maximum: int = 64) -> None:
+        """
+        Args:
+            initial (int): Starting window.
+            minimum (int): Lower bound (>= 1).
+            maximum (int): Upper bound (>= minimum).
+        """
+        if not 1 <= minimum <= maximum:
+            raise ValueError(f"Invalid window bounds: min={minimum}, max={maximum}")
+        self.minimum = minimum
+        self.maximum = maximum
+        self.size = float(min(max(initial, minimum), maximum))
+        self._recover = 0    # losses of chunks below this seq belong to the last decrease
+
+    @property
+    def limit(self) -> int:
+        """Chunks that may be in flight now."""
+        return int(self.size)
+
+    def on_ack(self) -> None:
+        """Grow by 1/size, i.e. one chunk per full window of ACKs."""
+        self.size = min(self.maximum, self.size + 1.0 / self.size)
+
+    def on_loss(self, seq: int, next_seq: int) -> None:
+        """
+        Halve the window for a lost chunk, unless the loss belongs to a window
+        that was already halved (every chunk sent before that decrease).
+
+        Args:
+            seq (int): Sequence number of the lost chunk.
+            next_seq (int): First sequence number not yet sent.
+        """
+        if seq < self._recover:
+            return
+        self.size = max(float(self.minimum), self.size / 2.0)
+        self._recover = next_seq
+
+
+class RttEstimator:
+    """
+    Retransmission timeout from measured round trips.
+
+    Attributes:
+        srtt (float | None): Smoothed RTT in seconds; None before the first sample.
+        rttvar (float): RTT variation in seconds.
+        rto (float): Current retransmission timeout in seconds.
+    """
+
+    ALPHA = 0.125
+    BETA = 0.25
+
+    def __init__(self, initial_rto: float, min_rto: float = 0.05, max_rto: float = 60.0) -> None:
+        """
+        Args:
+            initial_rto (float): Timeout before the first sample.
+            min_rto (float): Lower bound of the timeout.
+            max_rto (float): Upper bound of the timeout (also caps backoff).
+        """
+        self.min_rto = min_rto
+        self.max_rto = max_rto
+        self.srtt = None
+        self.rttvar = 0.0
+        self.rto = min(max(initial_rto, min_rto), max_rto)
+        self._recover = 0    # timeouts of sends below this order belong to the last backoff
+
+    def sample(self, rtt: float) -> None:
+        """
+        Add a round-trip measurement (only for chunks sent once; Karn's rule).
+
+        Args:
+            rtt (float): Seconds from send to ACK.
+        """
+        if self.srtt is None:
+            self.srtt = rtt
+            self.rttvar = rtt / 2.0
+        else:
+            self.rttvar = (1 - self.BETA) * self.rttvar + self.BETA * abs(self.srtt - rtt)
+            self.srtt = (1 - self.ALPHA) * self.srtt + self.ALPHA * rtt
+        self.rto = min(max(self.srtt + 4.0 * self.rttvar, self.min_rto), self.max_rto)
+
+    def backoff(self) -> None:
+        """Double the timeout."""
+        self.rto = min(self.rto * 2.0, self.max_rto)
+
+    def on_timeout(self, order: int, next_order: int) -> None:
+        """
+        Back off for a timed-out send, unless the send belongs to a window
+        that already backed off (every send made before that backoff).
+
+        Args:
+            order (int): Send counter value of the timed-out send.
+            next_order (int): Send counter value of the next send.
+        """
+        if order < self._recover:
+            return
+        self.backoff()
+        self._recover = next_order
@@ -6,35 +6,103 @@ Telemetry Builder Module
 Provides functions to construct raw telemetry frames for different data types
 by serializing payloads and encapsulating them in mesh frames. Each builder
 function corresponds to a specific telemetry ID.
+
+When `telemetry.compact` is enabled in config.json, payloads use the compact
+encoding (see src/serializers/telemetry_compact.py) wherever possible.
+
+Every type in the codec registry (src/serializers/telemetry_codecs.py) also
+gets a generated builder: `build_tlm_<name>` resolves to `make_tlm_builder(name)`
+unless a hand-written builder of that name exists below.
 """
 
-from typing import Any, List, Optional
+import json
+from pathlib import Path
+from typing import Any, Callable, Mapping, Optional, Sequence, Tuple, Union
+
+from src.core.frame_codec import build_mesh_frame
+from src.core.protocol_context import ProtocolContext, get_protocol_context
+from src.serializers.telemetry_codecs import get_codec
+from src.serializers.telemetry_serializer import serialize_telemetry, serialize_tlm_bundle
+
+# === Load telemetry settings from project root config.json ===
+CONFIG_PATH: Path = Path(__file__).parents[3] / "config.json"
+with open(CONFIG_PATH, "r", encoding="utf-8") as _cfg_file:
+    _tlm_cfg = json.load(_cfg_file).get("telemetry", {})
 
-from src.core.frame_codec import build_mesh_frame, load_device_id
-from src.serializers.telemetry_serializer import serialize_telemetry
+COMPACT_TELEMETRY: bool = bool(_tlm_cfg.get("compact", False))
 
 
 def build_tlm_frame(
-    tlm_id: int,
-    params: List[Any],
+    tlm_id: Union[int, str],
+    params: Union[Sequence[Any], Mapping[str, Any]],
     dst: int = 0xFF,
-    src: Optional[int] = None
+    src: Optional[int] = None,
+    compact: Optional[bool] = None,
+    context: Optional[ProtocolContext] = None
 ) -> bytes:
     """
     Construct a generic telemetry mesh frame.
 
     Args:
-        tlm_id (int): Telemetry identifier (e.g., 0x01 for GPS).
-        params (List[Any]): Ordered list of parameters matching the telemetry schema.
+        tlm_id (int | str): Telemetry identifier or type name (e.g., 0x01 or "gps").
+        params (Sequence[Any] | Mapping[str, Any]): Values in schema order, or by field name.
         dst (int, optional): Destination device ID (default: 0xFF for broadcast).
-        src (int | None, optional): Source device ID; if None, loaded from config.
+        src (int | None, optional): Source device ID; if None, taken from the protocol context.
+        compact (bool | None, optional): Compact encoding; if None, `telemetry.compact` from config.
+        context (ProtocolContext | None, optional): Protocol context of the link; the shared default if None.
 
     Returns:
         bytes: Complete mesh frame ready for transmission.
     """
-    source_id = src if src is not None else load_device_id()
-    payload = serialize_telemetry(tlm_id, *params)
-    return build_mesh_frame('T', source_id, dst, payload)
+    ctx = context if context is not None else get_protocol_context()
+    source_id = src if src is not None else ctx.device_id
+    use_compact = COMPACT_TELEMETRY if compact is None else compact
+    codec = get_codec(tlm_id)
+    payload = serialize_telemetry(codec.tlm_id, *codec.bind(params), compact=use_compact, dst=dst)
+    return build_mesh_frame('T', source_id, dst, payload, context=ctx)
+
+
+def make_tlm_builder(tlm: Union[int, str]) -> Callable[..., bytes]:
+    """
+    Generate a builder for a registered telemetry type.
+
+    The builder takes the schema fields positionally or by name, plus the
+    keyword-only dst, src, compact and context of build_tlm_frame:
+
+        build_tlm_wind = make_tlm_builder("wind")
+        frame = build_tlm_wind(speed=4.2, direction=270, dst=1)
+
+    Args:
+        tlm (int | str): Telemetry type ID or name.
+
+    Returns:
+        Callable[..., bytes]: Function returning the mesh frame.
+    """
+    codec = get_codec(tlm)
+
+    def builder(
+        *values: Any,
+        dst: int = 0xFF,
+        src: Optional[int] = None,
+        compact: Optional[bool] = None,
+        context: Optional[ProtocolContext] = None,
+        **named: Any
+    ) -> bytes:
+        return build_tlm_frame(codec.tlm_id, codec.bind(values, **named), dst, src, compact, context)
+
+    builder.__name__ = builder.__qualname__ = f"build_tlm_{codec.name}"
+    builder.__doc__ = f"Build a {codec.label} telemetry frame. Fields: {', '.join(codec.fields)}."
+    return builder
+
+
+def __getattr__(name: str) -> Callable[..., bytes]:
+    # build_tlm_<name> for registered types without a hand-written builder
+    if name.startswith("build_tlm_"):
+        try:
+            return make_tlm_builder(name[len("build_tlm_"):])
+        except ValueError:
+            pass
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 def build_tlm_gps(
@@ -42,7 +110,8 @@ def build_tlm_gps(
     lon: float,
     alt: float,
     dst: int = 0xFF,
-    src: Optional[int] = None
+    src: Optional[int] = None,
+    context: Optional[ProtocolContext] = None
 ) -> bytes:
     """
     Build a GPS telemetry frame.
@@ -53,11 +122,12 @@ def build_tlm_gps(
         alt (float): Altitude in meters.
         dst (int, optional): Destination device ID.
         src (int | None, optional): Source device ID.
+        context (ProtocolContext | None, optional): Protocol context of the link.
 
     Returns:
         bytes: Mesh frame containing serialized GPS data.
     """
-    return build_tlm_frame(0x01, [lat, lon, alt], dst, src)
+    return build_tlm_frame(0x01, [lat, lon, alt], dst, src, context=context)
 
 
 def build_tlm_imu(
@@ -65,7 +135,8 @@ def build_tlm_imu(
     pitch: float,
     yaw: float,
     dst: int = 0xFF,
-    src: Optional[int] = None
+    src: Optional[int] = None,
+    context: Optional[ProtocolContext] = None
 ) -> bytes:
     """
     Build an IMU telemetry frame.
@@ -76,11 +147,12 @@ def build_tlm_imu(
         yaw (float): Yaw angle in degrees.
         dst (int, optional): Destination device ID.
         src (int | None, optional): Source device ID.
+        context (ProtocolContext | None, optional): Protocol context of the link.
 
     Returns:
         bytes: Mesh frame containing serialized IMU data.
     """
-    return build_tlm_frame(0x02, [roll, pitch, yaw], dst, src)
+    return build_tlm_frame(0x02, [roll, pitch, yaw], dst, src, context=context)
 
 
 def build_tlm_battery(
@@ -88,7 +160,8 @@ def build_tlm_battery(
     current: float,
     level: float,
     dst: int = 0xFF,
-    src: Optional[int] = None
+    src: Optional[int] = None,
+    context: Optional[ProtocolContext] = None
 ) -> bytes:
     """
     Build a battery telemetry frame.
@@ -99,11 +172,12 @@ def build_tlm_battery(
         level (float): Remaining battery percentage (0.0–100.0).
         dst (int, optional): Destination device ID.
         src (int | None, optional): Source device ID.
+        context (ProtocolContext | None, optional): Protocol context of the link.
 
     Returns:
         bytes: Mesh frame containing serialized battery data.
     """
-    return build_tlm_frame(0x03, [voltage, current, level], dst, src)
+    return build_tlm_frame(0x03, [voltage, current, level], dst, src, context=context)
 
 
 def build_tlm_heartbeat(
@@ -113,7 +187,8 @@ def build_tlm_heartbeat(
     gps_fix: bool,
     sat_count: int,
     dst: int = 0xFF,
-    src: Optional[int] = None
+    src: Optional[int] = None,
+    context: Optional[ProtocolContext] = None
 ) -> bytes:
     """
     Build a heartbeat telemetry frame conveying system status.
@@ -126,6 +201,7 @@ def build_tlm_heartbeat(
         sat_count (int): Number of satellites in view.
         dst (int, optional): Destination device ID.
         src (int | None, optional): Source device ID.
+        context (ProtocolContext | None, optional): Protocol context of the link.
 
     Returns:
         bytes: Mesh frame containing serialized heartbeat data.
@@ -134,5 +210,38 @@ def build_tlm_heartbeat(
         0x04,
         [mode, health, is_armed, gps_fix, sat_count],
         dst,
-        src
+        src,
+        context=context
     )
+
+
+def build_tlm_bundle(
+    records: Sequence[Tuple[Union[int, str], Any]],
+    dst: int = 0xFF,
+    src: Optional[int] = None,
+    compact: Optional[bool] = None,
+    context: Optional[ProtocolContext] = None
+) -> bytes:
+    """
+    Build one telemetry frame carrying several records (TLM_BUNDLE_ID).
+
+    Args:
+        records (Sequence[Tuple[int | str, Any]]): (tlm_id or name, params) pairs,
+            e.g. [(0x01, [lat, lon, alt]), ("battery", {"voltage": ..., ...})].
+        dst (int, optional): Destination device ID.
+        src (int | None, optional): Source device ID; if None, taken from the protocol context.
+        compact (bool | None, optional): Compact encoding; if None, `telemetry.compact` from config.
+        context (ProtocolContext | None, optional): Protocol context of the link; the shared default if None.
+
+    Returns:
+        bytes: Mesh frame containing the telemetry bundle.
+    """
+    ctx = context if context is not None else get_protocol_context()
+    source_id = src if src is not None else ctx.device_id
+    use_compact = COMPACT_TELEMETRY if compact is None else compact
+    payloads = []
+    for tlm_id, params in records:
+        codec = get_codec(tlm_id)
+        payloads.append(serialize_telemetry(codec.tlm_id, *codec.bind(params), compact=use_compact, dst=dst))
+    payload = serialize_tlm_bundle(payloads)
+    return build_mesh_frame('T', source_id, dst, payload, context=ctx)
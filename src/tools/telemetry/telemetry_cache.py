@@ -5,23 +5,89 @@ Telemetry Cache Module
 
 Provides in-memory storage and retrieval of telemetry data for multiple devices,
 indexed by source ID and data type. Each data entry is timestamped on insertion.
+
+Besides the latest entry, the last `telemetry.history_capacity` samples of
+each (src_id, data_type) are kept in a ring buffer (see telemetry_history)
+and returned by `get_history()`; 0 disables the history.
+
+Devices are indexed by last update, so active/stale queries only visit the
+devices they return. Consumers can `subscribe()` to updates instead of
+polling and copying the whole cache.
+
+`get_columnar_snapshot()` returns the latest numeric fields of every device
+as NumPy arrays for vectorized fleet computations; the columns are kept up
+to date on each write (see telemetry_columns). NumPy is only needed by that
+function.
 """
 
+import json
+import threading
 import time
-from typing import Any, Dict, Optional
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+from src.tools.log.logger import logger
+from src.tools.telemetry.telemetry_columns import TelemetryColumnTable
+
+from src.tools.telemetry.telemetry_history import DEFAULT_HISTORY_CAPACITY, Column, TelemetryRingBuffer
+
+# === Load history settings from project root config.json ===
+CONFIG_PATH: Path = Path(__file__).parents[3] / "config.json"
+with open(CONFIG_PATH, "r", encoding="utf-8") as _cfg_file:
+    _tlm_cfg = json.load(_cfg_file).get("telemetry", {})
+
+HISTORY_CAPACITY: int = int(_tlm_cfg.get("history_capacity", DEFAULT_HISTORY_CAPACITY))
 
 # Internal cache structure:
 # {
-#     src_id: {
-#         data_type: {
-#             ... arbitrary telemetry fields ...,
-#             "timestamp": float
+#     src_id: _DeviceSlot(
+#         entries={
+#             data_type: {
+#                 ... arbitrary telemetry fields ...,
+#                 "timestamp": float
+#             },
+#             ...
 #         },
-#         ...
-#     },
+#         history={data_type: TelemetryRingBuffer, ...}
+#     ),
 #     ...
 # }
-_device_cache: Dict[int, Dict[str, Dict[str, Any]]] = {}
+#
+# Concurrency (RX thread, scheduler jobs and UI threads share the cache):
+#  - Writers of one device serialise on that device's lock (lock striping
+#    per src_id); writers of different devices never contend.
+#  - `entries` is copy-on-write: a writer publishes a new dict, so readers
+#    take no lock and always see a complete per-device snapshot.
+#  - The top-level map is also copy-on-write (replaced when a device first
+#    appears), so iterating it never sees a change in size.
+#  - Stored payload dicts must be treated as read-only by callers.
+
+
+class _DeviceSlot:
+    __slots__ = ("lock", "entries", "history")
+
+    def __init__(self) -> None:
+        self.lock = threading.Lock()
+        self.entries: Dict[str, Dict[str, Any]] = {}
+        self.history: Dict[str, TelemetryRingBuffer] = {}
+
+
+_device_cache: Dict[int, _DeviceSlot] = {}
+# Held only while adding a device or resetting the cache
+_devices_lock = threading.Lock()
+
+# data_type -> latest numeric fields of every device, column-wise
+_column_tables: Dict[str, TelemetryColumnTable] = {}
+
+# Last-seen index: src_id -> last update timestamp, least recently updated first
+_last_seen: "OrderedDict[int, float]" = OrderedDict()
+_last_seen_lock = threading.Lock()
+
+# Update callbacks: (callback, src_id filter, data_type filter); replaced, never mutated
+UpdateCallback = Callable[[int, str, Dict[str, Any]], None]
+_subscribers: Tuple[Tuple[UpdateCallback, Optional[int], Optional[str]], ...] = ()
+_subscribers_lock = threading.Lock()
 
 
 def _current_timestamp() -> float:
@@ -31,6 +97,18 @@ def _current_timestamp() -> float:
     return time.time()
 
 
+def _slot_for(src_id: int) -> _DeviceSlot:
+    global _device_cache
+    slot = _device_cache.get(src_id)
+    if slot is None:
+        with _devices_lock:
+            slot = _device_cache.get(src_id)
+            if slot is None:
+                slot = _DeviceSlot()
+                _device_cache = {**_device_cache, src_id: slot}
+    return slot
+
+
 def set_device_data(src_id: int, data_type: str, data: Dict[str, Any]) -> None:
     """
     Store or update telemetry data for a given device and data type.
@@ -51,14 +129,153 @@ def set_device_data(src_id: int, data_type: str, data: Dict[str, Any]) -> None:
     if not isinstance(data, dict):
         raise TypeError(f"'data' must be dict, got {type(data).__name__}")
 
-    # Timestamp the data entry
-    data["timestamp"] = _current_timestamp()
+    slot = _slot_for(src_id)
+    with slot.lock:
+        # Timestamp under the device lock so the device's history stays in time order
+        timestamp = data["timestamp"] = _current_timestamp()
+
+        # Publish a new entries dict; readers keep whichever one they hold
+        entries = dict(slot.entries)
+        entries[data_type] = data
+        slot.entries = entries
+
+        if HISTORY_CAPACITY > 0:
+            _record_history(slot, data_type, data)
+
+        table = _column_tables.get(data_type)
+        if table is None:
+            with _devices_lock:
+                table = _column_tables.setdefault(data_type, TelemetryColumnTable(data_type))
+        table.update(src_id, timestamp, data)
+
+    with _last_seen_lock:
+        # Another device's writer may have stamped later but got here first;
+        # never go below the newest entry, so the index stays sorted by time
+        if _last_seen:
+            timestamp = max(timestamp, _last_seen[next(reversed(_last_seen))])
+        _last_seen[src_id] = timestamp
+        _last_seen.move_to_end(src_id)
+
+    if _subscribers:
+        _notify(src_id, data_type, data)
+
+
+def _notify(src_id: int, data_type: str, data: Dict[str, Any]) -> None:
+    for callback, want_src, want_type in _subscribers:
+        if (want_src is None or want_src == src_id) and (want_type is None or want_type == data_type):
+            try:
+                callback(src_id, data_type, data)
+            except Exception as e:
+                # A failing consumer must not break the RX path
+                logger.error(f"[TELEMETRY] Cache subscriber {callback!r} failed: {e}")
+
+
+def subscribe(
+    callback: UpdateCallback,
+    src_id: Optional[int] = None,
+    data_type: Optional[str] = None
+) -> UpdateCallback:
+    """
+    Register a callback for cache updates.
+
+    The callback runs on the writer's thread (usually the RX path) right
+    after the entry is stored, so it should be quick and not block.
+
+    Args:
+        callback (Callable[[int, str, dict], None]): Called as
+            callback(src_id, data_type, data); data must not be modified.
+        src_id (int | None): Only updates from this device; None for all.
+        data_type (str | None): Only updates of this type; None for all.
+
+    Returns:
+        Callable: The callback, for passing to unsubscribe().
+    """
+    global _subscribers
+    with _subscribers_lock:
+        _subscribers = _subscribers + ((callback, src_id, data_type),)
+    return callback
+
 
-    # Initialize device entry if absent
-    if src_id not in _device_cache:
-        _device_cache[src_id] = {}
+def unsubscribe(callback: UpdateCallback) -> None:
+    """
+    Remove every registration of a callback (no-op if not registered).
 
-    _device_cache[src_id][data_type] = data
+    Args:
+        callback (Callable): Callback passed to subscribe().
+    """
+    global _subscribers
+    with _subscribers_lock:
+        _subscribers = tuple(sub for sub in _subscribers if sub[0] != callback)
+
+
+def _record_history(slot: _DeviceSlot, data_type: str, data: Dict[str, Any]) -> None:
+    # Called with slot.lock held
+    buffer = slot.history.get(data_type)
+    if buffer is None or not buffer.accepts(data):
+        buffer = slot.history[data_type] = TelemetryRingBuffer(data, HISTORY_CAPACITY)
+    # A field changing type (e.g. int -> float) widens its column, history is kept
+    buffer.append(data["timestamp"], data)
+
+
+def get_history(
+    src_id: int,
+    data_type: str,
+    since: Optional[float] = None,
+    until: Optional[float] = None
+) -> Optional[Dict[str, Column]]:
+    """
+    Retrieve past samples of a device and data type, oldest first.
+
+    Args:
+        src_id (int): Device identifier.
+        data_type (str): Telemetry category.
+        since (float | None): Earliest UNIX timestamp (e.g. time.time() - 60); None for all kept.
+        until (float | None): Latest UNIX timestamp; None for the newest.
+
+    Returns:
+        dict or None: Column-wise copy {"timestamp": [...], <field>: [...]}
+        (typed arrays for numeric fields), or None if no history exists.
+    """
+    slot = _device_cache.get(src_id)
+    buffer = slot.history.get(data_type) if slot is not None else None
+    if buffer is None:
+        return None
+    return buffer.window(since, until)
+
+
+def get_columnar_snapshot(data_type: str, fields: Optional[Iterable[str]] = None) -> Dict[str, Any]:
+    """
+    Retrieve the latest values of one data type for all devices as NumPy arrays.
+
+    Example:
+        snap = get_columnar_snapshot("gps", ["lat", "lon", "alt"])
+        near = snap["ids"][np.hypot(snap["lat"] - lat0, snap["lon"] - lon0) < 1e-3]
+
+    Args:
+        data_type (str): Telemetry category (e.g. "gps", "battery").
+        fields (Iterable[str] | None): Numeric fields to include; None for all.
+
+    Returns:
+        dict: {"ids": int64[n], "timestamp": float64[n], <field>: float64[n], ...};
+        row i of every array belongs to device ids[i]. Fields a device has not
+        reported are NaN. Arrays are copies.
+
+    Raises:
+        ImportError: If NumPy is not installed.
+    """
+    try:
+        import numpy as np
+    except ImportError as e:
+        raise ImportError("get_columnar_snapshot requires NumPy (pip install numpy)") from e
+
+    table = _column_tables.get(data_type)
+    if table is None:
+        table = TelemetryColumnTable(data_type)
+    columns = table.snapshot(fields)
+    return {
+        name: np.frombuffer(column, dtype=np.int64 if name == "ids" else np.float64)
+        for name, column in columns.items()
+    }
 
 
 def get_device_data(src_id: int, data_type: str) -> Optional[Dict[str, Any]]:
@@ -72,7 +289,8 @@ def get_device_data(src_id: int, data_type: str) -> Optional[Dict[str, Any]]:
     Returns:
         dict or None: The telemetry payload including 'timestamp', or None if not found.
     """
-    return _device_cache.get(src_id, {}).get(data_type)
+    slot = _device_cache.get(src_id)
+    return slot.entries.get(data_type) if slot is not None else None
 
 
 def get_active_device_ids(timeout: float = 5.0) -> list[int]:
@@ -85,19 +303,50 @@ def get_active_device_ids(timeout: float = 5.0) -> list[int]:
     Returns:
         List[int]: Sorted list of active device source IDs.
     """
-    now = _current_timestamp()
+    cutoff = _current_timestamp() - timeout
     active_ids: list[int] = []
 
-    for src_id, entries in _device_cache.items():
-        # If any data entry is recent enough, mark device as active
-        for entry in entries.values():
-            if now - entry.get("timestamp", 0) <= timeout:
-                active_ids.append(src_id)
+    with _last_seen_lock:
+        # Newest first; stop at the first device older than the window
+        for src_id in reversed(_last_seen):
+            if _last_seen[src_id] < cutoff:
                 break
+            active_ids.append(src_id)
 
     return sorted(active_ids)
 
 
+def get_stale_device_ids(timeout: float = 5.0) -> List[int]:
+    """
+    List device IDs that have not sent telemetry within the past `timeout` seconds.
+
+    Args:
+        timeout (float): Time window in seconds to consider a device active.
+
+    Returns:
+        List[int]: Sorted list of stale device source IDs.
+    """
+    cutoff = _current_timestamp() - timeout
+    stale_ids: List[int] = []
+
+    with _last_seen_lock:
+        # Oldest first; stop at the first device inside the window
+        for src_id, seen in _last_seen.items():
+            if seen >= cutoff:
+                break
+            stale_ids.append(src_id)
+
+    return sorted(stale_ids)
+
+
+def get_last_seen(src_id: int) -> Optional[float]:
+    """
+    Return the UNIX timestamp of a device's latest update, or None if never seen.
+    """
+    with _last_seen_lock:
+        return _last_seen.get(src_id)
+
+
 def get_all_data_for_device(src_id: int) -> Optional[Dict[str, Dict[str, Any]]]:
     """
     Retrieve all telemetry entries for a given device.
@@ -106,23 +355,28 @@ def get_all_data_for_device(src_id: int) -> Optional[Dict[str, Dict[str, Any]]]:
         src_id (int): Device identifier.
 
     Returns:
-        Dict[data_type, payload] or None: Mapping of data types to their latest payloads.
+        Dict[data_type, payload] or None: Snapshot mapping of data types to
+        their latest payloads (not updated by later writes).
     """
-    return _device_cache.get(src_id)
+    slot = _device_cache.get(src_id)
+    return slot.entries if slot is not None and slot.entries else None
 
 
 def get_all_cached_data() -> Dict[int, Dict[str, Dict[str, Any]]]:
     """
     Retrieve the entire telemetry cache, omitting any 'src_id' fields within entries.
 
+    Never blocks writers; each device's entries come from one consistent
+    snapshot.
+
     Returns:
         Dict[src_id, Dict[data_type, payload]]: Complete cache snapshot.
     """
     cleaned: Dict[int, Dict[str, Dict[str, Any]]] = {}
 
-    for src_id, entries in _device_cache.items():
+    for src_id, slot in _device_cache.items():
         cleaned[src_id] = {}
-        for dtype, payload in entries.items():
+        for dtype, payload in slot.entries.items():
             # Exclude any embedded 'src_id' keys from payload
             filtered = {k: v for k, v in payload.items() if k != "src_id"}
             cleaned[src_id][dtype] = filtered
@@ -132,6 +386,12 @@ def get_all_cached_data() -> Dict[int, Dict[str, Dict[str, Any]]]:
 
 def reset_cache() -> None:
     """
-    Clear all stored telemetry data from the cache.
+    Clear all stored telemetry data (latest entries and history) from the cache.
+    Subscriptions are kept.
     """
-    _device_cache.clear()
+    global _device_cache
+    with _devices_lock:
+        _device_cache = {}
+        _column_tables.clear()
+    with _last_seen_lock:
+        _last_seen.clear()
@@ -0,0 +1,94 @@
+# src/tools/telemetry/telemetry_columns.py
+
+"""
+Telemetry Column Module
+
+Column-wise view of the latest telemetry of every device for one data type
+(e.g. all vehicles' lat/lon/alt), kept up to date on each cache write so a
+fleet-wide read does not walk the nested cache dicts.
+
+Each device owns one row; numeric fields (float, int, bool) are stored as
+float64 in `array('d')` columns, with NaN where a device has not reported a
+field. Rows are appended in first-seen order and never move.
+"""
+
+import math
+import threading
+from array import array
+from typing import Any, Dict, Iterable, Mapping, Optional, Tuple
+
+NAN = math.nan
+
+
+class TelemetryColumnTable:
+    """
+    Latest numeric fields of one data type, one row per device.
+
+    Attributes:
+        data_type (str): Telemetry category the table holds (e.g. "gps").
+    """
+
+    def __init__(self, data_type: str) -> None:
+        self.data_type = data_type
+        self._rows: Dict[int, int] = {}          # src_id -> row
+        self._ids = array('q')
+        self._timestamps = array('d')
+        self._columns: Dict[str, array] = {}
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    @property
+    def fields(self) -> Tuple[str, ...]:
+        """Numeric fields seen so far, in first-seen order."""
+        return tuple(self._columns)
+
+    def update(self, src_id: int, timestamp: float, data: Mapping[str, Any]) -> None:
+        """
+        Overwrite a device's row with its latest values.
+
+        Args:
+            src_id (int): Device identifier.
+            timestamp (float): Update time (UNIX seconds).
+            data (Mapping[str, Any]): Telemetry fields; non-numeric ones are ignored.
+        """
+        with self._lock:
+            row = self._rows.get(src_id)
+            if row is None:
+                row = self._rows[src_id] = len(self._ids)
+                self._ids.append(src_id)
+                self._timestamps.append(timestamp)
+                for column in self._columns.values():
+                    column.append(NAN)
+            else:
+                self._timestamps[row] = timestamp
+
+            for name, value in data.items():
+                if name == "timestamp" or not isinstance(value, (int, float)):
+                    continue
+                column = self._columns.get(name)
+                if column is None:
+                    # New field: earlier rows have not reported it
+                    column = self._columns[name] = array('d', [NAN]) * len(self._ids)
+                column[row] = value
+
+    def snapshot(self, fields: Optional[Iterable[str]] = None) -> Dict[str, array]:
+        """
+        Consistent copy of the table.
+
+        Args:
+            fields (Iterable[str] | None): Columns to include; None for all.
+
+        Returns:
+            dict: {"ids": array('q'), "timestamp": array('d'), <field>: array('d'), ...},
+            all of one length and in row order. A field no device has
+            reported yet is all NaN.
+        """
+        with self._lock:
+            names = self.fields if fields is None else tuple(fields)
+            result: Dict[str, array] = {"ids": self._ids[:], "timestamp": self._timestamps[:]}
+            for name in names:
+                column = self._columns.get(name)
+                result[name] = column[:] if column is not None else array('d', [NAN]) * len(self._ids)
+        return result
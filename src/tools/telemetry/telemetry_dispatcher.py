@@ -6,17 +6,77 @@ Telemetry Dispatcher Module
 Constructs and sends various telemetry frames over a communication interface.
 Each function builds a specific telemetry payload (GPS, IMU, Battery, Heartbeat)
 and transmits it, while logging the action for traceability.
+
+Other types in the codec registry get a generated sender: `send_tlm_<name>`
+resolves to `make_tlm_sender(name)`.
 """
 
+from typing import Any, Callable, Sequence, Tuple, Union
+
+from src.core.frame_batch import FrameBatchEncoder
+from src.core.protocol_context import resolve_context
+from src.serializers.telemetry_codecs import get_codec
+from src.serializers.telemetry_serializer import serialize_telemetry
 from src.tools.telemetry.telemetry_builder import (
+    COMPACT_TELEMETRY,
     build_tlm_gps,
     build_tlm_imu,
     build_tlm_battery,
-    build_tlm_heartbeat
+    build_tlm_heartbeat,
+    build_tlm_bundle,
+    build_tlm_frame
 )
 from src.tools.comm.transmitter import send_frame
 from src.tools.log.logger import logger
 
+
+def make_tlm_sender(tlm: Union[int, str]) -> Callable[..., None]:
+    """
+    Generate a sender for a registered telemetry type.
+
+    The sender takes the interface, then the schema fields positionally or by
+    name, plus the keyword-only dst, src and compact:
+
+        send_tlm_wind = make_tlm_sender("wind")
+        send_tlm_wind(interface, speed=4.2, direction=270, dst=1)
+
+    Args:
+        tlm (int | str): Telemetry type ID or name.
+
+    Returns:
+        Callable[..., None]: Function building and sending the frame.
+    """
+    codec = get_codec(tlm)
+
+    def sender(
+        interface,
+        *values: Any,
+        dst: int = 0xFF,
+        src: int | None = None,
+        compact: bool | None = None,
+        **named: Any
+    ) -> None:
+        bound = codec.bind(values, **named)
+        send_frame(interface, build_tlm_frame(codec.tlm_id, bound, dst, src, compact, resolve_context(interface)))
+        logger.info(
+            f"[TELEMETRY] SENT {codec.label} | DST: {dst} | {codec.describe(dict(zip(codec.fields, bound)))}"
+        )
+
+    sender.__name__ = sender.__qualname__ = f"send_tlm_{codec.name}"
+    sender.__doc__ = f"Send a {codec.label} telemetry frame. Fields: {', '.join(codec.fields)}."
+    return sender
+
+
+def __getattr__(name: str) -> Callable[..., None]:
+    # send_tlm_<name> for registered types without a hand-written sender
+    if name.startswith("send_tlm_"):
+        try:
+            return make_tlm_sender(name[len("send_tlm_"):])
+        except ValueError:
+            pass
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
 def send_tlm_gps(
     interface,
     lat: float,
@@ -34,9 +94,10 @@ def send_tlm_gps(
         lon (float): Longitude in decimal degrees.
         alt (float): Altitude in meters above sea level.
         dst (int, optional): Destination device ID (default: 0xFF for broadcast).
-        src (int | None, optional): Source device ID; if None, omitted.
+        src (int | None, optional): Source device ID; if None, taken from the
+            interface's protocol context.
     """
-    frame = build_tlm_gps(lat, lon, alt, dst, src)
+    frame = build_tlm_gps(lat, lon, alt, dst, src, resolve_context(interface))
     send_frame(interface, frame)
     logger.info(
         f"[TELEMETRY] SENT GPS | DST: {dst} | LAT: {lat:.6f}, LON: {lon:.6f}, ALT: {alt:.2f}"
@@ -62,7 +123,7 @@ def send_tlm_imu(
         dst (int, optional): Destination device ID.
         src (int | None, optional): Source device ID.
     """
-    frame = build_tlm_imu(roll, pitch, yaw, dst, src)
+    frame = build_tlm_imu(roll, pitch, yaw, dst, src, resolve_context(interface))
     send_frame(interface, frame)
     logger.info(
         f"[TELEMETRY] SENT IMU | DST: {dst} | ROLL: {roll:.2f}, PITCH: {pitch:.2f}, YAW: {yaw:.2f}"
@@ -88,7 +149,7 @@ def send_tlm_battery(
         dst (int, optional): Destination device ID.
         src (int | None, optional): Source device ID.
     """
-    frame = build_tlm_battery(voltage, current, level, dst, src)
+    frame = build_tlm_battery(voltage, current, level, dst, src, resolve_context(interface))
     send_frame(interface, frame)
     logger.info(
         f"[TELEMETRY] SENT BATTERY | DST: {dst} | VOLT: {voltage:.2f} V, CURR: {current:.2f} A, LEVEL: {level:.1f}%"
@@ -118,9 +179,79 @@ def send_tlm_heartbeat(
         dst (int, optional): Destination device ID.
         src (int | None, optional): Source device ID.
     """
-    frame = build_tlm_heartbeat(mode, health, is_armed, gps_fix, sat_count, dst, src)
+    frame = build_tlm_heartbeat(mode, health, is_armed, gps_fix, sat_count, dst, src, resolve_context(interface))
     send_frame(interface, frame)
     logger.info(
         f"[TELEMETRY] SENT HEARTBEAT | DST: {dst} | MODE: {mode}, HEALTH: {health}, "
         f"ARMED: {is_armed}, GPS_FIX: {gps_fix}, SATS: {sat_count}"
     )
+
+
+def send_tlm_batch(
+    interface,
+    records: Sequence[Tuple[Union[int, str], Any]],
+    dst: int = 0xFF,
+    src: int | None = None,
+    compact: bool | None = None
+) -> None:
+    """
+    Send several telemetry frames with a single interface write.
+
+    Each record becomes its own 'T' frame, but all frames are packed into one
+    buffer by FrameBatchEncoder and flushed together (one UDP datagram / one
+    UART write per call).
+
+    Args:
+        interface: Communication interface instance.
+        records (Sequence[Tuple[int | str, Any]]): (tlm_id or name, params) pairs,
+            e.g. [(0x01, [lat, lon, alt]), ("imu", {"roll": ..., ...})].
+        dst (int, optional): Destination device ID.
+        src (int | None, optional): Source device ID; if None, taken from the
+            interface's protocol context.
+        compact (bool | None, optional): Compact encoding; if None,
+            `telemetry.compact` from config.
+    """
+    context = resolve_context(interface)
+    source = src if src is not None else context.device_id
+    use_compact = COMPACT_TELEMETRY if compact is None else compact
+
+    batch = FrameBatchEncoder(context=context)
+    for tlm_id, params in records:
+        codec = get_codec(tlm_id)
+        payload = serialize_telemetry(codec.tlm_id, *codec.bind(params), compact=use_compact, dst=dst)
+        batch.add('T', source, dst, payload)
+
+    size = batch.nbytes
+    count = batch.flush(lambda data: send_frame(interface, data))
+    logger.info(
+        f"[TELEMETRY] SENT BATCH | DST: {dst} | FRAMES: {count} | SIZE: {size}B"
+    )
+
+
+def send_tlm_bundle(
+    interface,
+    records: Sequence[Tuple[Union[int, str], Any]],
+    dst: int = 0xFF,
+    src: int | None = None,
+    compact: bool | None = None
+) -> None:
+    """
+    Send several telemetry records inside a single 'T' frame (TLM bundle).
+
+    Unlike send_tlm_batch, the records share one mesh header and CRC, so a
+    node sends one frame per tick instead of one per telemetry type.
+
+    Args:
+        interface: Communication interface instance.
+        records (Sequence[Tuple[int | str, Any]]): (tlm_id or name, params) pairs.
+        dst (int, optional): Destination device ID.
+        src (int | None, optional): Source device ID; if None, taken from the
+            interface's protocol context.
+        compact (bool | None, optional): Compact encoding; if None,
+            `telemetry.compact` from config.
+    """
+    frame = build_tlm_bundle(records, dst, src, compact, resolve_context(interface))
+    send_frame(interface, frame)
+    logger.info(
+        f"[TELEMETRY] SENT BUNDLE | DST: {dst} | RECORDS: {len(records)} | SIZE: {len(frame)}B"
+    )
@@ -0,0 +1,154 @@
+# src/tools/telemetry/telemetry_history.py
+
+"""
+Telemetry History Module
+
+Fixed-capacity ring buffer of timestamped telemetry samples for one
+(src_id, data_type) pair. Numeric fields are stored column-wise in typed
+`array.array` buffers allocated once, so appending is O(1) and memory stays
+bounded however long the flight runs; the oldest sample is overwritten
+when the buffer is full.
+
+Column type is chosen from the first sample:
+
+    float -> array('d')   int -> array('q')   bool -> array('b') (0/1)
+    anything else (e.g. heartbeat mode strings) -> list
+
+A later value that does not fit widens the column in place, keeping the
+stored samples: a float in an int/bool column (alt 100 then 100.5) turns it
+into array('d'), a non-number turns it into a list.
+"""
+
+import threading
+from array import array
+from typing import Any, Dict, List, Mapping, Optional, Union
+
+DEFAULT_HISTORY_CAPACITY = 600   # 1 minute at 10 Hz
+
+Column = Union[array, List[Any]]
+
+
+def _new_column(sample: Any, capacity: int) -> Column:
+    if isinstance(sample, bool):
+        return array('b', bytes(capacity))
+    if isinstance(sample, int):
+        return array('q', [0]) * capacity
+    if isinstance(sample, float):
+        return array('d', [0.0]) * capacity
+    return [None] * capacity
+
+
+def _widen_column(column: Column, value: Any) -> Column:
+    # Numbers widen to float; anything else needs a list
+    if isinstance(column, array) and column.typecode != 'd' and isinstance(value, (int, float)):
+        return array('d', column)
+    return list(column)
+
+
+class TelemetryRingBuffer:
+    """
+    Ring buffer of samples with a fixed set of fields.
+
+    Attributes:
+        capacity (int): Maximum number of samples kept.
+        fields (tuple): Field names stored (timestamp excluded).
+    """
+
+    def __init__(self, sample: Mapping[str, Any], capacity: int = DEFAULT_HISTORY_CAPACITY) -> None:
+        """
+        Args:
+            sample (Mapping[str, Any]): First sample; its keys and value types
+                define the columns ("timestamp" is handled separately).
+            capacity (int): Maximum number of samples (> 0).
+        """
+        if capacity <= 0:
+            raise ValueError(f"History capacity must be positive: {capacity}")
+        self.capacity = capacity
+        self.fields = tuple(k for k in sample if k != "timestamp")
+        self._timestamps = array('d', [0.0]) * capacity
+        self._columns: Dict[str, Column] = {k: _new_column(sample[k], capacity) for k in self.fields}
+        self._head = 0     # next write position
+        self._count = 0
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return self._count
+
+    def accepts(self, sample: Mapping[str, Any]) -> bool:
+        """True if the sample has exactly this buffer's fields."""
+        return len(sample) - ("timestamp" in sample) == len(self.fields) and all(k in sample for k in self.fields)
+
+    def append(self, timestamp: float, sample: Mapping[str, Any]) -> None:
+        """
+        Store a sample, overwriting the oldest one when full.
+
+        Args:
+            timestamp (float): Sample time (UNIX seconds).
+            sample (Mapping[str, Any]): Values for every field in `fields`.
+        """
+        with self._lock:
+            pos = self._head
+            self._timestamps[pos] = timestamp
+            for name, column in self._columns.items():
+                value = sample[name]
+                try:
+                    column[pos] = value
+                except (TypeError, OverflowError):
+                    column = self._columns[name] = _widen_column(column, value)
+                    column[pos] = value
+            self._head = (pos + 1) % self.capacity
+            if self._count < self.capacity:
+                self._count += 1
+
+    def _start(self) -> int:
+        return (self._head - self._count) % self.capacity
+
+    def _bisect(self, t: float, right: bool = False) -> int:
+        # Binary search over logical positions (0 = oldest); timestamps ascend.
+        # Returns the first position with timestamp >= t (> t if right).
+        ts, start, cap = self._timestamps, self._start(), self.capacity
+        lo, hi = 0, self._count
+        while lo < hi:
+            mid = (lo + hi) // 2
+            value = ts[(start + mid) % cap]
+            if value < t or (right and value == t):
+                lo = mid + 1
+            else:
+                hi = mid
+        return lo
+
+    def _slice(self, column: Column, lo: int, hi: int) -> Column:
+        # Copy logical [lo, hi) out of the ring (at most two physical runs)
+        if hi == lo:
+            return column[0:0]
+        cap, start = self.capacity, self._start()
+        a, b = (start + lo) % cap, (start + hi) % cap
+        if a < b:
+            return column[a:b]
+        return column[a:] + column[:b]
+
+    def window(self, since: Optional[float] = None, until: Optional[float] = None) -> Dict[str, Column]:
+        """
+        Samples with since <= timestamp <= until, oldest first, column-wise.
+
+        Args:
+            since (float | None): Earliest timestamp; None for the oldest kept.
+            until (float | None): Latest timestamp; None for the newest.
+
+        Returns:
+            dict: {"timestamp": array('d'), <field>: column, ...}; each column
+            is a copy of equal length.
+        """
+        with self._lock:
+            lo = 0 if since is None else self._bisect(since)
+            hi = self._count if until is None else max(lo, self._bisect(until, right=True))
+            result: Dict[str, Column] = {"timestamp": self._slice(self._timestamps, lo, hi)}
+            for name, column in self._columns.items():
+                result[name] = self._slice(column, lo, hi)
+        return result
+
+    def clear(self) -> None:
+        """Drop all samples (the allocated columns are kept)."""
+        with self._lock:
+            self._head = 0
+            self._count = 0
@@ -0,0 +1,398 @@
+# src/tools/telemetry/telemetry_recorder.py
+
+"""
+Telemetry Recorder Module
+
+Appends every telemetry sample stored in the cache to a compact binary log
+for post-flight analysis, and reads it back through memory-mapped files.
+
+Layout (one directory per telemetry type, e.g. <root>/01_gps/):
+
+    000001.seg   header (16B) + fixed-size records, in time order
+    000001.idx   index of a closed segment
+    000002.seg   ...
+
+    segment header:  magic "LTLM", version u8, tlm_id u8, record_size u16,
+                     created f64 (UNIX seconds)                  little-endian
+    record:          timestamp f64, src_id u8, body (the telemetry type's
+                     wire body, see telemetry_codecs)
+    index:           first_ts f64, last_ts f64, count u32, n_sources u32,
+                     n_sources x (src_id u8, n u32), then the record numbers
+                     of each source as u32, in source order
+
+Records of one type have a fixed size, so record i sits at a computable
+offset, a time window is found by binary search over the timestamps, and
+the index lists the records of each source without scanning. A segment is
+closed (and indexed) after `segment_records` records or on `close()`; the
+open segment is scanned by the reader instead.
+
+Records within a segment are kept sorted by timestamp: a sample stamped
+slightly before the previous one (racing writers) is recorded at the
+previous timestamp, and a larger step back (wall clock set back) starts a
+new segment.
+
+A segment whose record size no longer matches the codec (schema changed)
+is skipped by the reader with a warning.
+"""
+
+import json
+import mmap
+import os
+import struct
+import threading
+import time
+from array import array
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Union
+
+from src.serializers.telemetry_codecs import TELEMETRY_CODECS_BY_NAME, TelemetryCodec, TelemetryRecord, get_codec
+from src.tools.log.logger import logger
+
+SEGMENT_MAGIC = b"LTLM"
+SEGMENT_VERSION = 1
+SEGMENT_SUFFIX = ".seg"
+INDEX_SUFFIX = ".idx"
+
+DEFAULT_SEGMENT_RECORDS = 65536
+DEFAULT_FLUSH_RECORDS = 64
+# Out-of-order samples up to this many seconds late are clamped, not re-segmented
+REORDER_TOLERANCE = 1.0
+
+_HEADER = struct.Struct("<4sBBHd")
+_RECORD_PREFIX = struct.Struct("<dB")
+_INDEX_HEADER = struct.Struct("<ddII")
+_INDEX_SOURCE = struct.Struct("<BI")
+_TIMESTAMP = struct.Struct("<d")
+
+
+def _type_dir(root: Path, codec: TelemetryCodec) -> Path:
+    return root / f"{codec.tlm_id:02x}_{codec.name}"
+
+
+def _record_size(codec: TelemetryCodec) -> int:
+    return _RECORD_PREFIX.size + codec.size
+
+
+class _OpenSegment:
+    """Segment being written, with its index kept in memory."""
+
+    def __init__(self, path: Path, codec: TelemetryCodec) -> None:
+        self.path = path
+        self.file = open(path, "wb")
+        self.file.write(_HEADER.pack(SEGMENT_MAGIC, SEGMENT_VERSION, codec.tlm_id, _record_size(codec), time.time()))
+        # On disk at once, so a live reader never finds a half-written header
+        self.file.flush()
+        self.count = 0
+        self.first_ts = 0.0
+        self.last_ts = 0.0
+        self.sources: Dict[int, array] = {}
+
+    def append(self, timestamp: float, src_id: int, record: bytes) -> None:
+        self.file.write(record)
+        if self.count == 0:
+            self.first_ts = timestamp
+        self.last_ts = timestamp
+        rows = self.sources.get(src_id)
+        if rows is None:
+            rows = self.sources[src_id] = array('I')
+        rows.append(self.count)
+        self.count += 1
+
+    def close(self) -> None:
+        self.file.close()
+        _write_index(self.path.with_suffix(INDEX_SUFFIX), self.first_ts, self.last_ts, self.count, self.sources)
+
+
+def _write_index(path: Path, first_ts: float, last_ts: float, count: int, sources: Dict[int, array]) -> None:
+    order = sorted(sources)
+    with open(path, "wb") as f:
+        f.write(_INDEX_HEADER.pack(first_ts, last_ts, count, len(order)))
+        for src_id in order:
+            f.write(_INDEX_SOURCE.pack(src_id, len(sources[src_id])))
+        for src_id in order:
+            f.write(sources[src_id].tobytes())
+
+
+def _read_index(path: Path) -> Optional[Tuple[float, float, int, Dict[int, array]]]:
+    try:
+        data = path.read_bytes()
+    except FileNotFoundError:
+        return None
+    first_ts, last_ts, count, n_sources = _INDEX_HEADER.unpack_from(data)
+    offset = _INDEX_HEADER.size
+    sizes = []
+    for _ in range(n_sources):
+        sizes.append(_INDEX_SOURCE.unpack_from(data, offset))
+        offset += _INDEX_SOURCE.size
+    sources: Dict[int, array] = {}
+    for src_id, n in sizes:
+        rows = array('I')
+        rows.frombytes(data[offset:offset + 4 * n])
+        sources[src_id] = rows
+        offset += 4 * n
+    return first_ts, last_ts, count, sources
+
+
+class TelemetryRecorder:
+    """
+    Writes telemetry samples to segmented binary logs.
+
+    Attributes:
+        root (Path): Log directory.
+        segment_records (int): Records per segment before rotation.
+        recorded (int): Samples written since start.
+    """
+
+    def __init__(
+        self,
+        root: Union[str, Path],
+        segment_records: int = DEFAULT_SEGMENT_RECORDS,
+        flush_records: int = DEFAULT_FLUSH_RECORDS
+    ) -> None:
+        """
+        Args:
+            root (str | Path): Log directory (created if missing).
+            segment_records (int): Records per segment file.
+            flush_records (int): Flush the file buffer every this many records.
+        """
+        if segment_records <= 0:
+            raise ValueError(f"segment_records must be positive: {segment_records}")
+        self.root = Path(root)
+        self.root.mkdir(parents=True, exist_ok=True)
+        self.segment_records = segment_records
+        self.flush_records = max(1, flush_records)
+        self.recorded = 0
+        self._segments: Dict[int, _OpenSegment] = {}
+        self._lock = threading.Lock()
+        self._subscribed = False
+
+    @classmethod
+    def from_config(cls, config_path: str = "config.json") -> Optional["TelemetryRecorder"]:
+        """
+        Build a recorder from the `telemetry.recorder` config section.
+
+        Returns:
+            TelemetryRecorder | None: None if recording is disabled.
+        """
+        with open(config_path, "r", encoding="utf-8") as f:
+            rec_cfg = json.load(f).get("telemetry", {}).get("recorder", {})
+        if not rec_cfg.get("enabled", False):
+            return None
+        return cls(
+            rec_cfg.get("directory", "logs/telemetry"),
+            segment_records=rec_cfg.get("segment_records", DEFAULT_SEGMENT_RECORDS),
+            flush_records=rec_cfg.get("flush_records", DEFAULT_FLUSH_RECORDS),
+        )
+
+    def attach(self) -> "TelemetryRecorder":
+        """Record every update stored in the telemetry cache from now on."""
+        from src.tools.telemetry.telemetry_cache import subscribe
+        if not self._subscribed:
+            subscribe(self.on_cache_update)
+            self._subscribed = True
+        return self
+
+    def on_cache_update(self, src_id: int, data_type: str, data: Dict[str, Any]) -> None:
+        """Cache subscriber: record samples of registered telemetry types."""
+        codec = TELEMETRY_CODECS_BY_NAME.get(data_type)
+        if codec is None:
+            return
+        try:
+            self.record(codec.tlm_id, src_id, data["timestamp"], codec.bind({k: data[k] for k in codec.fields}))
+        except (ValueError, KeyError, OSError) as e:
+            logger.error(f"[RECORDER] Could not record {data_type} from SRC: {src_id}: {e}")
+
+    def record(self, tlm: Union[int, str], src_id: int, timestamp: float, values) -> None:
+        """
+        Append one sample.
+
+        Args:
+            tlm (int | str): Telemetry type ID or name.
+            src_id (int): Source device ID (0..255).
+            timestamp (float): Sample time (UNIX seconds).
+            values (Sequence | Mapping): Field values, as for TelemetryCodec.bind.
+        """
+        codec = get_codec(tlm)
+        body = codec.pack(*codec.bind(values))
+        with self._lock:
+            segment = self._segments.get(codec.tlm_id)
+            if segment is not None and timestamp < segment.last_ts:
+                # Readers binary-search the timestamps: keep the segment sorted
+                if segment.last_ts - timestamp <= REORDER_TOLERANCE:
+                    timestamp = segment.last_ts
+                else:
+                    segment.close()
+                    segment = None
+            if segment is None:
+                segment = self._segments[codec.tlm_id] = self._open_segment(codec)
+            segment.append(timestamp, src_id, _RECORD_PREFIX.pack(timestamp, src_id) + body)
+            self.recorded += 1
+            if segment.count >= self.segment_records:
+                segment.close()
+                del self._segments[codec.tlm_id]
+            elif segment.count % self.flush_records == 0:
+                segment.file.flush()
+
+    def _open_segment(self, codec: TelemetryCodec) -> _OpenSegment:
+        directory = _type_dir(self.root, codec)
+        directory.mkdir(exist_ok=True)
+        numbers = [int(p.stem) for p in directory.glob(f"*{SEGMENT_SUFFIX}") if p.stem.isdigit()]
+        path = directory / f"{max(numbers, default=0) + 1:06d}{SEGMENT_SUFFIX}"
+        logger.info(f"[RECORDER] New {codec.label} segment: {path}")
+        return _OpenSegment(path, codec)
+
+    def flush(self) -> None:
+        """Write buffered records of the open segments to disk."""
+        with self._lock:
+            for segment in self._segments.values():
+                segment.file.flush()
+
+    def close(self) -> None:
+        """Close and index the open segments, and stop recording cache updates."""
+        if self._subscribed:
+            from src.tools.telemetry.telemetry_cache import unsubscribe
+            unsubscribe(self.on_cache_update)
+            self._subscribed = False
+        with self._lock:
+            for segment in self._segments.values():
+                segment.close()
+            self._segments.clear()
+
+
+class _SegmentReader:
+    """Memory-mapped view of one segment file."""
+
+    def __init__(self, path: Path, codec: TelemetryCodec, index=None) -> None:
+        self.path = path
+        self.codec = codec
+        self.record_size = _record_size(codec)
+        self._file = open(path, "rb")
+        self._map: Optional[mmap.mmap] = None
+        size = os.fstat(self._file.fileno()).st_size
+        if size < _HEADER.size:
+            raise ValueError(f"Truncated segment header: {path}")
+        header = _HEADER.unpack(self._file.read(_HEADER.size))
+        magic, version, tlm_id, record_size, _created = header
+        if magic != SEGMENT_MAGIC or version != SEGMENT_VERSION or tlm_id != codec.tlm_id:
+            raise ValueError(f"Not a {codec.label} telemetry segment: {path}")
+        if record_size != self.record_size:
+            raise ValueError(f"Record size {record_size}B does not match the {codec.label} schema: {path}")
+        # A crash can leave a partial last record; it is ignored
+        self.count = (size - _HEADER.size) // record_size
+        if self.count:
+            self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        # The index of a closed segment; the open segment is scanned
+        self.sources = index[3] if index is not None and index[2] == self.count else None
+
+    def close(self) -> None:
+        if self._map is not None:
+            self._map.close()
+        self._file.close()
+
+    def timestamp(self, i: int) -> float:
+        return _TIMESTAMP.unpack_from(self._map, _HEADER.size + i * self.record_size)[0]
+
+    def bisect(self, t: float, right: bool = False) -> int:
+        lo, hi = 0, self.count
+        while lo < hi:
+            mid = (lo + hi) // 2
+            value = self.timestamp(mid)
+            if value < t or (right and value == t):
+                lo = mid + 1
+            else:
+                hi = mid
+        return lo
+
+    def rows(self, src_id: Optional[int], since: Optional[float], until: Optional[float]) -> Iterator[int]:
+        lo = 0 if since is None else self.bisect(since)
+        hi = self.count if until is None else self.bisect(until, right=True)
+        if lo >= hi:
+            return
+        if src_id is None:
+            yield from range(lo, hi)
+        elif self.sources is not None:
+            rows = self.sources.get(src_id)
+            if rows:
+                # Record numbers are ascending: cut them to [lo, hi) by bisection
+                start, stop = _bisect_rows(rows, lo), _bisect_rows(rows, hi)
+                yield from rows[start:stop]
+        else:
+            base = _HEADER.size + _TIMESTAMP.size
+            for i in range(lo, hi):
+                if self._map[base + i * self.record_size] == src_id:
+                    yield i
+
+    def read(self, i: int) -> Tuple[float, int, TelemetryRecord]:
+        offset = _HEADER.size + i * self.record_size
+        timestamp, src_id = _RECORD_PREFIX.unpack_from(self._map, offset)
+        start = offset + _RECORD_PREFIX.size
+        return timestamp, src_id, self.codec.decode(self._map[start:start + self.codec.size])
+
+
+def _bisect_rows(rows: array, value: int) -> int:
+    lo, hi = 0, len(rows)
+    while lo < hi:
+        mid = (lo + hi) // 2
+        if rows[mid] < value:
+            lo = mid + 1
+        else:
+            hi = mid
+    return lo
+
+
+class TelemetryLog:
+    """
+    Reader for a directory written by TelemetryRecorder.
+
+    Example:
+        log = TelemetryLog("logs/telemetry")
+        for timestamp, src_id, gps in log.query("gps", src_id=3, since=t0):
+            print(timestamp, gps.lat, gps.lon)
+    """
+
+    def __init__(self, root: Union[str, Path]) -> None:
+        self.root = Path(root)
+
+    def segments(self, tlm: Union[int, str]) -> List[Path]:
+        """Segment files of a telemetry type, oldest first."""
+        directory = _type_dir(self.root, get_codec(tlm))
+        return sorted(directory.glob(f"*{SEGMENT_SUFFIX}"))
+
+    def query(
+        self,
+        tlm: Union[int, str],
+        src_id: Optional[int] = None,
+        since: Optional[float] = None,
+        until: Optional[float] = None
+    ) -> Iterator[Tuple[float, int, TelemetryRecord]]:
+        """
+        Iterate over recorded samples, oldest first.
+
+        Args:
+            tlm (int | str): Telemetry type ID or name.
+            src_id (int | None): Only this source; None for all.
+            since (float | None): Earliest UNIX timestamp.
+            until (float | None): Latest UNIX timestamp.
+
+        Yields:
+            Tuple[float, int, TelemetryRecord]: (timestamp, src_id, record).
+        """
+        codec = get_codec(tlm)
+        for path in self.segments(codec.tlm_id):
+            index = _read_index(path.with_suffix(INDEX_SUFFIX))
+            if index is not None and index[2]:
+                first_ts, last_ts = index[0], index[1]
+                # Closed segment entirely outside the window: not opened
+                if (since is not None and last_ts < since) or (until is not None and first_ts > until):
+                    continue
+            try:
+                segment = _SegmentReader(path, codec, index)
+            except ValueError as e:
+                logger.warning(f"[RECORDER] Segment skipped: {e}")
+                continue
+            try:
+                if segment.count:
+                    for i in segment.rows(src_id, since, until):
+                        yield segment.read(i)
+            finally:
+                segment.close()
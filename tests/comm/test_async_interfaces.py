@@ -0,0 +1,127 @@
+def test_async_mock_interfaces_share_one_loop():
+    import asyncio
+    from src.core.frame_codec import build_mesh_frame
+    from src.tools.comm.async_interfaces import AsyncMockInterface
+
+    async def scenario():
+        links = [AsyncMockInterface() for _ in range(200)]
+        for link in links:
+            await link.start()
+
+        async def consume(link):
+            return [frame async for frame in link]
+
+        consumers = [asyncio.create_task(consume(link)) for link in links]
+        for i, link in enumerate(links):
+            await link.send(build_mesh_frame('T', i % 250, 1, bytes([i % 256])))
+            await link.send(build_mesh_frame('A', i % 250, 1, b"\x01"))
+        for link in links:
+            await link.stop()
+        return await asyncio.gather(*consumers)
+
+    results = asyncio.run(scenario())
+    assert len(results) == 200
+    assert all(len(frames) == 2 for frames in results)
+    assert results[7][0][3] == ord('T') and results[7][1][3] == ord('A')
+
+
+def test_async_uart_interface_loopback(tmp_path):
+    import asyncio
+    import json
+    from src.core.frame_codec import build_mesh_frame
+    from src.tools.comm.async_interfaces import AsyncUARTInterface
+
+    cfg = {
+        "vehicle": {"id": 1},
+        "protocol": {"start_byte": 84, "start_byte_2": 199, "version": 1},
+        "uart": {"port": "loop://", "baudrate": 57600, "timeout": 0.05}
+    }
+    path = tmp_path / "config.json"
+    path.write_text(json.dumps(cfg))
+
+    async def scenario():
+        iface = AsyncUARTInterface(str(path))
+        await iface.start()
+        frames = [build_mesh_frame('C', 2, 1, bytes([i]) * 5, context=iface.context) for i in range(3)]
+        await iface.send(b"".join(frames))
+        received = [await asyncio.wait_for(iface.recv(), 1.0) for _ in frames]
+        await iface.stop()
+        return frames, received, await iface.recv()
+
+    frames, received, after_stop = asyncio.run(scenario())
+    assert received == frames
+    assert after_stop is None
+
+
+def test_create_async_interface_selects_transport(tmp_path):
+    import asyncio
+    import json
+    from src.tools.comm.async_interfaces import AsyncMockInterface
+    from src.tools.comm.interface_factory import create_async_interface
+
+    cfg = {
+        "vehicle": {"id": 3},
+        "protocol": {"start_byte": 84, "start_byte_2": 199, "version": 1},
+        "interface": {"comm_type": "MOCK_UART"}
+    }
+    path = tmp_path / "config.json"
+    path.write_text(json.dumps(cfg))
+
+    async def scenario():
+        interface = await create_async_interface(path)
+        await interface.stop()
+        return interface
+
+    interface = asyncio.run(scenario())
+    assert isinstance(interface, AsyncMockInterface)
+    assert interface.context.device_id == 3
+
+
+def test_async_stop_with_full_queue_keeps_received_frames():
+    import asyncio
+    from src.core.frame_codec import build_mesh_frame
+    from src.tools.comm.async_interfaces import AsyncCommInterface
+
+    async def scenario():
+        idle = AsyncCommInterface()
+        waiter = asyncio.create_task(idle.recv())
+        await asyncio.sleep(0)
+        await idle.stop()
+
+        link = AsyncCommInterface(rx_queue_size=3)
+        frames = [build_mesh_frame('T', 2, 1, bytes([i])) for i in range(3)]
+        for frame in frames:
+            link._deliver(frame)
+        await link.stop()
+        return await waiter, frames, [frame async for frame in link], await link.recv()
+
+    woken, frames, received, after_stop = asyncio.run(scenario())
+    assert woken is None
+    assert received == frames
+    assert after_stop is None
+
+
+def test_async_rx_queue_applies_configured_drop_policy(tmp_path):
+    import json
+    from src.core.frame_codec import build_mesh_frame
+    from src.tools.comm.async_interfaces import AsyncCommInterface, AsyncUARTInterface
+
+    link = AsyncCommInterface(rx_queue_size=2, rx_drop_policy="drop_by_type")
+    telemetry = [build_mesh_frame('T', 2, 1, bytes([i])) for i in range(2)]
+    command = build_mesh_frame('C', 2, 1, b"\x01")
+    for frame in telemetry + [command]:
+        link._deliver(frame)
+    assert link.read_many() == [telemetry[1], command]
+    stats = link.rx_stats()
+    assert (stats["policy"], stats["maxsize"], stats["dropped"]) == ("drop_by_type", 2, {'T': 1})
+    assert link.dropped_frames == 1
+
+    cfg = {
+        "vehicle": {"id": 1},
+        "protocol": {"start_byte": 84, "start_byte_2": 199, "version": 1},
+        "uart": {"port": "loop://", "baudrate": 57600, "rx_queue_size": 4, "rx_drop_policy": "drop_oldest"}
+    }
+    path = tmp_path / "config.json"
+    path.write_text(json.dumps(cfg))
+    stats = AsyncUARTInterface(str(path)).rx_stats()
+    assert (stats["policy"], stats["maxsize"]) == ("drop_oldest", 4)
@@ -0,0 +1,101 @@
+def test_uart_capture_replays_into_router(tmp_path):
+    import json
+    from src.tools.comm.capture import CaptureReader, DIR_RX, DIR_TX, LINK_STREAM
+    from src.tools.comm.replay import ReplayEngine, MAX_SPEED
+    from src.tools.comm.uart_handler import UARTHandler
+    from src.tools.telemetry.telemetry_builder import build_tlm_gps
+    from src.tools.telemetry.telemetry_cache import get_device_data, reset_cache
+
+    cfg = {
+        "vehicle": {"id": 1},
+        "protocol": {"start_byte": 84, "start_byte_2": 199, "version": 1},
+        "uart": {"port": "loop://", "baudrate": 57600, "timeout": 0.1,
+                 "capture": {"enabled": True, "path": str(tmp_path / "uart.lcap")}}
+    }
+    path = tmp_path / "config.json"
+    path.write_text(json.dumps(cfg))
+
+    handler = UARTHandler(str(path))
+    handler.start()
+    try:
+        frames = [build_tlm_gps(40.0 + i, 29.0, 100.0, dst=1, src=7) for i in range(3)]
+        handler.send(b"\x00\xFF" + b"".join(frames))
+        assert [handler.wait_frame(timeout=1.0) for _ in frames] == frames
+    finally:
+        handler.stop()
+    assert handler.capture is None
+
+    reader = CaptureReader(tmp_path / "uart.lcap")
+    records = list(reader)
+    assert reader.link_type == LINK_STREAM
+    assert records[0].direction == DIR_TX
+    assert b"".join(r.data for r in records if r.direction == DIR_RX) == records[0].data
+
+    reset_cache()
+    engine = ReplayEngine(tmp_path / "uart.lcap", context=handler.context, speed=MAX_SPEED)
+    stats = engine.run()
+    assert (stats["frames"], stats["routed"], stats["errors"]) == (3, 3, 0)
+    assert stats["discarded_bytes"] == 2
+    assert get_device_data(7, "gps")["lat"] == 42.0
+
+
+def test_datagram_replay_counts_bad_frames_and_paces(tmp_path):
+    from src.core.frame_codec import build_mesh_frame
+    from src.tools.comm.capture import CaptureReader, CaptureWriter, DIR_RX, LINK_DATAGRAM
+    from src.tools.comm.replay import ReplayEngine
+
+    capture = CaptureWriter(tmp_path / "udp.lcap", LINK_DATAGRAM)
+    good = build_mesh_frame('X', 2, 1, b"\x01\x02")
+    bad = bytearray(good)
+    bad[-1] ^= 0xFF
+    capture.write_rx(good + good)
+    capture.write_tx(good)
+    capture.write_rx(bytes(bad))
+    capture.close()
+
+    now = [0.0]
+    sleeps = []
+
+    def sleep(seconds):
+        sleeps.append(seconds)
+        now[0] += seconds
+
+    engine = ReplayEngine(tmp_path / "udp.lcap", speed=2.0, route=False,
+                          clock=lambda: now[0], sleep=sleep)
+    stats = engine.run()
+    assert (stats["records"], stats["frames"], stats["errors"], stats["routed"]) == (2, 3, 1, 0)
+    rx_times = [r.time_ns for r in CaptureReader(tmp_path / "udp.lcap") if r.direction == DIR_RX]
+    assert abs(sum(sleeps) - (rx_times[-1] - rx_times[0]) / 1e9 / 2.0) < 1e-9
+
+    stats = ReplayEngine(tmp_path / "udp.lcap", speed=0).run()
+    assert stats["routed"] == 2
+
+
+def test_capture_reader_rejects_other_files(tmp_path):
+    import pytest
+    from src.tools.comm.capture import CaptureReader
+
+    path = tmp_path / "not_a_capture.bin"
+    path.write_bytes(b"\x00" * 64)
+    with pytest.raises(ValueError):
+        CaptureReader(path)
+
+
+def test_stream_replay_keeps_rx_and_tx_apart(tmp_path):
+    from src.core.frame_codec import build_mesh_frame
+    from src.tools.comm.capture import CaptureWriter, DIR_RX, DIR_TX, LINK_STREAM
+    from src.tools.comm.replay import ReplayEngine
+
+    rx = build_mesh_frame('X', 2, 1, b"\x01" * 8)
+    tx = build_mesh_frame('X', 1, 2, b"\x02" * 8)
+    capture = CaptureWriter(tmp_path / "uart.lcap", LINK_STREAM)
+    # A TX write lands in the middle of an RX frame
+    capture.write_rx(rx[:5])
+    capture.write_tx(tx)
+    capture.write_rx(rx[5:])
+    capture.close()
+
+    stats = ReplayEngine(tmp_path / "uart.lcap", speed=0, directions=(DIR_RX, DIR_TX), route=False).run()
+    assert (stats["frames"], stats["errors"], stats["discarded_bytes"]) == (2, 0, 0)
+    stats = ReplayEngine(tmp_path / "uart.lcap", speed=0, route=False).run()
+    assert stats["frames"] == 1
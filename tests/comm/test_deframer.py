@@ -0,0 +1,33 @@
+def test_stream_deframer_chunks_noise_and_resync():
+    import random
+    from src.core.frame_codec import build_mesh_frame
+    from src.core.protocol_context import get_protocol_context
+    from src.tools.comm.deframer import StreamDeframer
+
+    ctx = get_protocol_context()
+    frames = [build_mesh_frame('T', 1, 2, bytes([i]) * (i * 7)) for i in range(6)]
+
+    # A corrupted frame that hides a real one right after its sync bytes
+    broken = bytearray(build_mesh_frame('C', 1, 2, b'\x00' * 20))
+    broken[-1] ^= 0xFF
+    hidden = build_mesh_frame('A', 3, 4, b'\xaa\x01\x00')
+    # Long runs of start bytes with a wrong version used to recurse per byte
+    noise = (ctx.sync + b'\x63') * 2000
+
+    stream = noise + frames[0] + bytes(broken[:2]) + hidden + b''.join(frames[1:])
+
+    deframer = StreamDeframer(ctx)
+    rng = random.Random(1)
+    out, pos = [], 0
+    while pos < len(stream):
+        step = rng.randint(1, 40)
+        out.extend(deframer.feed(stream[pos:pos + step]))
+        pos += step
+
+    assert out == [frames[0], hidden] + frames[1:]
+    assert deframer.stats["version_errors"] >= 2000
+
+    # A rejected CRC candidate is rescanned for a frame start
+    deframer = StreamDeframer(ctx)
+    assert deframer.feed(bytes(broken) + frames[2]) == [frames[2]]
+    assert deframer.stats["crc_errors"] == 1
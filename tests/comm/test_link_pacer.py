@@ -0,0 +1,25 @@
+def test_link_pacer_airtime_and_token_bucket():
+    from src.tools.comm.link_pacer import LinkPacer
+
+    now = [0.0]
+    slept = []
+
+    def sleep(seconds):
+        slept.append(seconds)
+        now[0] += seconds
+
+    # 57600 baud 8N1 -> 5760 bytes/s; 1536-byte FTP chunk ~267 ms on air
+    pacer = LinkPacer.for_uart(57600, max_utilisation=1.0, burst_ms=100,
+                               clock=lambda: now[0], sleep=sleep)
+    assert abs(pacer.airtime(1536) - 1536 / 5760) < 1e-9
+
+    assert pacer.acquire(1536) == 0.0          # burst budget available
+    assert pacer.ready_in() > 0.16             # debt: 267 ms - 100 ms burst
+    waited = pacer.acquire(100)
+    assert abs(waited - (1536 / 5760 - 0.1)) < 1e-9
+    assert slept == [waited]
+    assert 0.28 < pacer.utilisation() < 0.3
+
+    now[0] += 5.0
+    assert pacer.utilisation() == 0.0
+    assert pacer.ready_in() == 0.0
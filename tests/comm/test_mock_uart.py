@@ -9,3 +9,18 @@ def test_mock_uart_interface_send_and_read():
     interface.send(data)
     received = interface.read()
     assert received == data, f"Expected {data!r}, got {received!r}"
+
+
+def test_mock_uart_read_many_drains_all_frames():
+    from src.core.frame_codec import build_mesh_frame
+    from src.tools.comm.interfaces import UARTInterface
+    from src.tools.comm.mock_handler import MockUARTHandler
+
+    interface = UARTInterface(MockUARTHandler())
+    frames = [build_mesh_frame('T', 2, 1, bytes([i])) for i in range(5)]
+    for frame in frames:
+        interface.uart.inject_frame(frame)
+
+    assert interface.read_many(max_frames=2) == frames[:2]
+    assert list(interface.iter_frames()) == frames[2:]
+    assert interface.read_many() == []
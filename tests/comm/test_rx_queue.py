@@ -0,0 +1,38 @@
+def _frame(frame_type, n):
+    from src.core.frame_codec import build_mesh_frame
+    return build_mesh_frame(frame_type, 2, 1, bytes([n]))
+
+
+def test_rx_queue_drop_oldest_and_newest():
+    from src.tools.comm.rx_queue import BoundedFrameQueue
+
+    frames = [_frame('T', i) for i in range(5)]
+
+    oldest = BoundedFrameQueue(3, "drop_oldest")
+    for frame in frames:
+        oldest.put(frame)
+    assert oldest.drain() == frames[2:]
+
+    newest = BoundedFrameQueue(3, "drop_newest")
+    results = [newest.put(frame) for frame in frames]
+    assert results == [True, True, True, False, False]
+    assert newest.drain() == frames[:3]
+    assert newest.stats()["dropped"] == {'T': 2}
+
+
+def test_rx_queue_drop_by_type_keeps_commands_and_acks():
+    from src.tools.comm.rx_queue import BoundedFrameQueue
+
+    queue = BoundedFrameQueue(3, "drop_by_type")
+    t0, c0, t1, a0, t2 = _frame('T', 0), _frame('C', 0), _frame('T', 1), _frame('A', 0), _frame('T', 2)
+    for frame in (t0, c0, t1):
+        queue.put(frame)
+    assert queue.put(a0) is False      # evicts oldest telemetry (t0)
+    assert queue.put(t2) is False      # evicts t1, keeps arrival order
+    assert queue.drain() == [c0, a0, t2]
+
+    for frame in (c0, a0, _frame('C', 1)):
+        queue.put(frame)
+    assert queue.put(t0) is False      # telemetry rejected when only commands/ACKs are queued
+    assert len(queue) == 3
+    assert queue.stats()["dropped"] == {'T': 3}
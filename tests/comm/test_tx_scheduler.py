@@ -0,0 +1,34 @@
+def test_tx_scheduler_ack_preempts_queued_ftp():
+    import time
+    from src.core.frame_codec import build_mesh_frame
+    from src.tools.comm.link_pacer import LinkPacer
+    from src.tools.comm.transmitter import send_frame
+    from src.tools.comm.tx_scheduler import TxScheduler
+
+    class RecordingInterface:
+        def __init__(self):
+            self.sent = []
+
+            self.pacer = LinkPacer(5000, max_utilisation=1.0, burst_ms=0)
+
+        def send(self, data):
+            self.pacer.acquire(len(data))
+            self.sent.append(data)
+
+    iface = RecordingInterface()
+    # ~20 ms per 100-byte FTP frame
+    iface.tx_scheduler = TxScheduler(iface)
+    iface.tx_scheduler.start()
+
+    ftp = [build_mesh_frame('F', 1, 2, bytes([i]) * 90) for i in range(5)]
+    ack = build_mesh_frame('A', 1, 2, b"\x01\x00")
+    for frame in ftp:
+        send_frame(iface, frame)
+    time.sleep(0.005)
+    send_frame(iface, ack)
+
+    iface.tx_scheduler.stop()
+    assert len(iface.sent) == 6
+    assert iface.sent.index(ack) <= 1
+    assert [f for f in iface.sent if f != ack] == ftp
+    assert iface.tx_scheduler.stats()["sent"] == {'F': 5, 'A': 1}
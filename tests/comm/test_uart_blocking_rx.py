@@ -0,0 +1,24 @@
+def test_uart_blocking_rx_delivers_frames(tmp_path):
+    import json
+    from src.core.frame_codec import build_mesh_frame
+    from src.tools.comm.uart_handler import UARTHandler
+
+    cfg = {
+        "vehicle": {"id": 1},
+        "protocol": {"start_byte": 84, "start_byte_2": 199, "version": 1},
+        "uart": {"port": "loop://", "baudrate": 57600, "timeout": 0.1, "rx_mode": "blocking"}
+    }
+    path = tmp_path / "config.json"
+    path.write_text(json.dumps(cfg))
+
+    handler = UARTHandler(str(path))
+    handler.start()
+    try:
+        frames = [build_mesh_frame('T', 2, 1, bytes([i]) * 4, context=handler.context) for i in range(3)]
+        handler.send(b"\x00\xFF" + b"".join(frames))
+        received = [handler.wait_frame(timeout=1.0) for _ in frames]
+        assert received == frames
+        assert handler.read() is None
+    finally:
+        handler.stop()
+    assert not handler.thread.is_alive()
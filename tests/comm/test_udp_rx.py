@@ -0,0 +1,34 @@
+def test_udp_rx_drains_datagrams_over_loopback(tmp_path):
+    import json
+    import socket
+    import time
+    from src.core.frame_codec import build_mesh_frame
+    from src.tools.comm.udp_handler import UDPHandler
+
+    cfg = {
+        "vehicle": {"id": 1},
+        "protocol": {"start_byte": 84, "start_byte_2": 199, "version": 1},
+        "udp": {"local_ip": "127.0.0.1", "local_port": 47011,
+                "remote_ip": "127.0.0.1", "remote_port": 47012, "rx_batch": 4}
+    }
+    path = tmp_path / "config.json"
+    path.write_text(json.dumps(cfg))
+
+    handler = UDPHandler(str(path))
+    handler.start()
+    tx = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    try:
+        frames = [build_mesh_frame('T', 2, 1, bytes([i]) * 3, context=handler.context) for i in range(10)]
+        for frame in frames:
+            tx.sendto(frame, ("127.0.0.1", 47011))
+
+        received = []
+        deadline = time.monotonic() + 2.0
+        while len(received) < len(frames) and time.monotonic() < deadline:
+            received.extend(handler.read_many())
+            time.sleep(0.01)
+        assert received == frames
+        assert handler.rx_datagrams == len(frames)
+    finally:
+        tx.close()
+        handler.stop()
@@ -0,0 +1,12 @@
+def test_crc_backends_and_incremental_update():
+    import os
+    from src.core.crc import CRC_INIT, crc16, update, update_python
+
+    # Standard check value for CRC-16-CCITT-FALSE
+    assert crc16(b"123456789") == 0x29B1
+    assert update_python(CRC_INIT, b"123456789") == 0x29B1
+
+    data = os.urandom(1537)
+    whole = crc16(data)
+    assert update(update(CRC_INIT, data[:5]), memoryview(data)[5:]) == whole
+    assert update_python(update_python(CRC_INIT, data[:700]), data[700:]) == whole
@@ -0,0 +1,23 @@
+def test_frame_batch_single_send_and_split():
+    from src.core.frame_batch import FrameBatchEncoder
+    from src.core.frame_codec import build_mesh_frame, decode_mesh_frame
+    from src.tools.comm.interfaces import UARTInterface
+    from src.tools.comm.mock_handler import MockUARTHandler
+
+    payloads = [b"\x01" * 12, b"\x02" * 3, b""]
+    batch = FrameBatchEncoder(capacity=16)
+    offsets = [batch.add('T', 4, 0xFF, p) for p in payloads]
+    expected = b"".join(build_mesh_frame('T', 4, 0xFF, p) for p in payloads)
+    assert batch.getvalue() == expected
+    assert offsets == [0, 22, 35]
+
+    interface = UARTInterface(MockUARTHandler())
+    assert batch.flush(interface.send) == 3
+    assert len(interface.uart._outbox) == 1
+    assert len(batch) == 0
+
+    frames = [interface.read() for _ in payloads]
+    assert all(type(frame) is bytes for frame in frames)
+    received = [decode_mesh_frame(frame).payload for frame in frames]
+    assert received == payloads
+    assert interface.read() is None
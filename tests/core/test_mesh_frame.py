@@ -0,0 +1,20 @@
+def test_decode_mesh_frame_zero_copy_and_routing():
+    from src.core.frame_codec import build_mesh_frame, decode_mesh_frame, parse_mesh_frame
+    from src.core.frame_router import route_frame
+    from src.serializers.telemetry_serializer import serialize_telemetry
+    from src.tools.telemetry.telemetry_cache import get_device_data, reset_cache
+
+    reset_cache()
+    payload = serialize_telemetry(0x04, "GUIDED", "OK", True, True, 12)
+    buf = bytearray(build_mesh_frame('T', 7, 0xFF, payload))
+
+    frame = decode_mesh_frame(buf)
+    assert isinstance(frame.payload, memoryview)
+    assert frame.payload.obj is buf
+    assert frame["src_id"] == 7 and frame.get("dst_id") == 0xFF
+    assert frame.to_dict() == parse_mesh_frame(bytes(buf))
+
+    route_frame(frame, None)
+    heartbeat = get_device_data(7, "heartbeat")
+    assert heartbeat["mode"] == "GUIDED"
+    assert heartbeat["sat_count"] == 12
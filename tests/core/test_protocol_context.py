@@ -0,0 +1,57 @@
+import json
+
+
+def test_protocol_context_reload(tmp_path):
+    from src.core.protocol_context import ProtocolContext
+    from src.core.frame_codec import build_mesh_frame, parse_mesh_frame
+
+    config_path = tmp_path / "config.json"
+    cfg = {"protocol": {"start_byte": 84, "start_byte_2": 199, "version": 1}, "vehicle": {"id": 5}}
+    config_path.write_text(json.dumps(cfg))
+
+    ctx = ProtocolContext.from_config(str(config_path))
+    assert ctx.device_id == 5
+
+    frame = build_mesh_frame('T', ctx.device_id, 7, b'ABC', context=ctx)
+    parsed = parse_mesh_frame(frame, context=ctx)
+    assert parsed["src_id"] == 5
+    assert parsed["payload"] == b'ABC'
+
+    cfg["vehicle"]["id"] = 9
+    config_path.write_text(json.dumps(cfg))
+    assert ctx.device_id == 5
+    ctx.reload()
+    assert ctx.device_id == 9
+
+
+def test_dispatchers_use_the_interface_context():
+    from src.core.frame_codec import parse_mesh_frame
+    from src.core.protocol_context import ProtocolContext
+    from src.swarm.swarm_commander import send_goto
+    from src.tools.ack.ack_dispatcher import send_ack, send_ftp_ack, send_ftp_bitmap_ack
+    from src.tools.command.command_dispatcher import cmd_reboot
+    from src.tools.telemetry import telemetry_dispatcher
+
+    class Link:
+        context = ProtocolContext(0x55, 0xAA, 3, 42)
+
+        def __init__(self):
+            self.sent = []
+
+        def send(self, frame):
+            self.sent.append(frame)
+
+    link = Link()
+    send_ack(link, 0x01, 7)
+    send_ftp_ack(link, 7, "CHUNK", status_code=3)
+    send_ftp_bitmap_ack(link, 7, 4, b"\x05")
+    cmd_reboot(link, 7)
+    telemetry_dispatcher.send_tlm_gps(link, 40.0, 29.0, 100.0, dst=7)
+    telemetry_dispatcher.send_tlm_bundle(link, [("imu", [1.0, 2.0, 3.0])], dst=7)
+    send_goto(link, 7, 40.0, 29.0, 100.0)
+
+    assert len(link.sent) == 7
+    for frame in link.sent:
+        assert frame[:3] == bytes([0x55, 0xAA, 3])
+        parsed = parse_mesh_frame(frame, context=link.context)
+        assert (parsed["src_id"], parsed["dst_id"]) == (42, 7)
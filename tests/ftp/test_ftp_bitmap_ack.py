@@ -0,0 +1,77 @@
+def test_bitmap_encoding_and_start_compat():
+    from src.serializers.ftp_serializer import (
+        FTP_ACK_REQUEST, bitmap_has_chunk, deserialize_ftp_chunk, deserialize_ftp_start,
+        deserialize_ftp_start_ack_every, encode_chunk_bitmap, serialize_ftp_chunk, serialize_ftp_start
+    )
+
+    bitmap = encode_chunk_bitmap(3, {0, 1, 2, 5, 11}, 11)
+    assert bitmap == bytes([0b10000010])
+    assert [seq for seq in range(16) if bitmap_has_chunk(3, bitmap, seq)] == [0, 1, 2, 5, 11]
+    assert encode_chunk_bitmap(3, {0, 1, 2}, 2) == b""
+
+    legacy = serialize_ftp_start("a.png")
+    assert deserialize_ftp_start_ack_every(legacy) == 0
+    assert deserialize_ftp_start(serialize_ftp_start("a.png", 16)) == "a.png"
+    assert deserialize_ftp_start_ack_every(serialize_ftp_start("a.png", 16)) == 16
+
+    chunk = serialize_ftp_chunk(7, b"xy", ack_request=True)
+    assert chunk[0] & FTP_ACK_REQUEST
+    assert deserialize_ftp_chunk(chunk) == (7, b"xy")
+
+
+def test_bitmap_transfer_over_lossy_link(tmp_path, monkeypatch):
+    import os
+    from src.core.frame_codec import decode_mesh_frame
+    from src.serializers.ftp_serializer import FTP_PHASE_IDS, FTP_ACK_REQUEST, deserialize_ftp_chunk
+    from src.tools.ack.ack_tracker import clear_all_acks
+    from src.tools.ftp import ftp_builder
+    import src.tools.ftp.storage as storage
+
+    monkeypatch.setattr(ftp_builder, "PKT_SIZE", 16)
+    monkeypatch.setattr(ftp_builder, "TIMEOUT_MS", 200)
+    monkeypatch.setattr(ftp_builder, "WINDOW_SIZE", 8)
+    monkeypatch.setattr(ftp_builder, "ACK_EVERY", 8)
+
+    class LoopLink:
+        """Loops frames back to this node, dropping the first copy of chunks 5 and 40."""
+        context = None
+
+        def __init__(self):
+            self.pending = []
+            self.chunks = []
+            self.acks = 0
+
+        def send(self, frame):
+            frame = bytes(frame)
+            parsed = decode_mesh_frame(frame)
+            if parsed.frame_type == ord('A'):
+                self.acks += 1
+            elif parsed.payload[0] & ~FTP_ACK_REQUEST == FTP_PHASE_IDS["CHUNK"]:
+                seq, _ = deserialize_ftp_chunk(parsed.payload)
+                self.chunks.append(seq)
+                if seq in (5, 40) and self.chunks.count(seq) == 1:
+                    return
+            self.pending.append(frame)
+
+        def read_many(self, max_frames=None):
+            frames, self.pending = self.pending, []
+            return frames
+
+    data = os.urandom(16 * 64 - 3)
+    source = tmp_path / "bitmap_ack_test.bin"
+    source.write_bytes(data)
+    target = os.path.join(storage._DOWNLOAD_DIR, "bitmap_ack_test.bin")
+
+    clear_all_acks()
+    link = LoopLink()
+    try:
+        ftp_builder.send_ftp_file(link, str(source), src=1, dst=1)
+        with open(target, "rb") as f:
+            assert f.read() == data
+    finally:
+        if os.path.exists(target):
+            os.remove(target)
+
+    assert sorted(link.chunks) == sorted(list(range(64)) + [5, 40])
+    # START + END ACKs plus one bitmap per few chunks instead of 64 chunk ACKs
+    assert link.acks < 64 // 2
@@ -0,0 +1,137 @@
+def test_congestion_window_aimd():
+    from src.tools.ftp.ftp_window import CongestionWindow
+
+    window = CongestionWindow(4, maximum=8)
+    for _ in range(5):
+        window.on_ack()
+    assert window.limit == 5
+
+    window.on_loss(seq=3, next_seq=10)
+    assert window.limit == 2
+    # Further losses from the same window do not shrink it again
+    window.on_loss(seq=7, next_seq=10)
+    assert window.limit == 2
+    window.on_loss(seq=10, next_seq=12)
+    assert window.limit == 1
+
+
+def test_rtt_estimator_bounds_and_backoff():
+    from src.tools.ftp.ftp_window import RttEstimator
+
+    rtt = RttEstimator(2.0, min_rto=0.05, max_rto=2.0)
+    rtt.sample(0.1)
+    assert abs(rtt.rto - 0.3) < 1e-9
+    rtt.backoff()
+    assert abs(rtt.rto - 0.6) < 1e-9
+    for _ in range(10):
+        rtt.backoff()
+    assert rtt.rto == 2.0
+
+
+def test_rtt_estimator_backs_off_once_per_window():
+    from src.tools.ftp.ftp_window import RttEstimator
+
+    rtt = RttEstimator(0.1, min_rto=0.05, max_rto=60.0)
+    # A whole window of 8 sends (orders 0-7) times out together
+    for order in range(8):
+        rtt.on_timeout(order, next_order=8)
+    assert abs(rtt.rto - 0.2) < 1e-9
+    # A retransmission sent after the backoff times out again
+    rtt.on_timeout(8, next_order=9)
+    assert abs(rtt.rto - 0.4) < 1e-9
+
+
+def test_windowed_sender_retransmits_only_lost_chunks(monkeypatch):
+    import io
+    from src.core.frame_codec import decode_mesh_frame
+    from src.serializers.ftp_serializer import FTP_PHASE_IDS, deserialize_ftp_chunk
+    from src.tools.ack.ack_tracker import clear_all_acks, register_ack
+    from src.tools.ftp import ftp_builder
+
+    monkeypatch.setattr(ftp_builder, "TIMEOUT_MS", 100)
+    monkeypatch.setattr(ftp_builder, "WINDOW_SIZE", 4)
+
+    class LossyLink:
+        """Drops the first copy of chunks 2 and 5, ACKs every chunk it delivers."""
+        context = None
+
+        def __init__(self):
+            self.sent = []
+            self.in_flight = 0
+            self.max_in_flight = 0
+
+        def send(self, frame):
+            payload = decode_mesh_frame(frame).payload
+            if payload[0] != FTP_PHASE_IDS["CHUNK"]:
+                return
+            seq, _ = deserialize_ftp_chunk(payload)
+            self.sent.append(seq)
+            if seq in (2, 5) and self.sent.count(seq) == 1:
+                return
+            register_ack(f"FTP_CHUNK_{seq}", 9, 0)
+
+        def read_many(self, max_frames=None):
+            return []
+
+    clear_all_acks()
+    link = LossyLink()
+    reader = ftp_builder.ChunkReader(io.BytesIO(bytes(range(40))), 4)
+    failed = ftp_builder._send_chunks(link, reader, 1, 9, None)
+
+    assert failed == []
+    assert sorted(link.sent) == sorted(list(range(10)) + [2, 5])
+    # Pipelined: chunks after the lost one went out before its retransmission
+    resent_two = [i for i, seq in enumerate(link.sent) if seq == 2][1]
+    assert link.sent.index(3) < resent_two
+
+
+def test_sender_streams_file_in_bounded_memory(tmp_path, monkeypatch):
+    import os
+    import tracemalloc
+    from src.core.frame_codec import decode_mesh_frame
+    from src.serializers.ftp_serializer import FTP_ACK_REQUEST, FTP_PHASE_IDS, deserialize_ftp_chunk
+    from src.tools.ack.ack_tracker import clear_all_acks, register_ack
+    from src.tools.ftp import ftp_builder
+    from src.tools.log.logger import logger
+
+    monkeypatch.setattr(ftp_builder, "PKT_SIZE", 1024)
+    monkeypatch.setattr(ftp_builder, "ACK_EVERY", 0)
+    # Captured log records would dominate the measurement
+    monkeypatch.setattr(logger, "disabled", True)
+
+    data = os.urandom(4 * 1024 * 1024 + 100)
+    path = tmp_path / "survey.bin"
+    path.write_bytes(data)
+
+    class AckingLink:
+        """ACKs every phase immediately and checks chunk contents."""
+        context = None
+        chunks = 0
+
+        def send(self, frame):
+            payload = decode_mesh_frame(frame).payload
+            phase = payload[0] & ~FTP_ACK_REQUEST
+            if phase == FTP_PHASE_IDS["START"]:
+                register_ack("FTP_START", 9, 0)
+            elif phase == FTP_PHASE_IDS["CHUNK"]:
+                seq, chunk = deserialize_ftp_chunk(payload)
+                assert chunk == data[seq * 1024:(seq + 1) * 1024]
+                self.chunks += 1
+                register_ack(f"FTP_CHUNK_{seq}", 9, 0)
+            else:
+                register_ack("FTP_END", 9, 0)
+
+        def read_many(self, max_frames=None):
+            return []
+
+    clear_all_acks()
+    link = AckingLink()
+    tracemalloc.start()
+    try:
+        ftp_builder.send_ftp_file(link, str(path), src=1, dst=9)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    assert link.chunks == 4097
+    assert peak < len(data) // 8
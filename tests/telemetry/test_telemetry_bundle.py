@@ -0,0 +1,35 @@
+def test_tlm_bundle_fans_out_to_cache():
+    from src.core.frame_codec import decode_mesh_frame
+    from src.handlers.telemetry.telemetry_handler import handle_telemetry
+    from src.tools.telemetry.telemetry_builder import build_tlm_bundle, build_tlm_frame
+    from src.tools.telemetry.telemetry_cache import get_all_data_for_device, reset_cache
+
+    reset_cache()
+    records = [
+        (0x01, [37.0, 35.0, 100.0]),
+        (0x02, [1.0, 2.0, 3.0]),
+        (0x03, [11.5, 2.0, 90.0]),
+        (0x04, ["AUTO", "OK", True, True, 10]),
+    ]
+    for compact in (False, True):
+        frame = build_tlm_bundle(records, dst=1, src=9, compact=compact)
+        frm = decode_mesh_frame(frame)
+        handle_telemetry(frm.payload, {"src_id": 9, "dst_id": 1})
+
+        cached = get_all_data_for_device(9)
+        assert set(cached) == {"gps", "imu", "battery", "heartbeat"}
+        assert cached["heartbeat"]["mode"] == "AUTO" and cached["battery"]["voltage"] == 11.5
+        assert abs(cached["gps"]["lat"] - 37.0) < 1e-5
+
+    separate = sum(len(build_tlm_frame(tlm_id, params, 1, 9, compact=False)) for tlm_id, params in records)
+    assert len(build_tlm_bundle(records, dst=1, src=9, compact=False)) < separate
+
+
+def test_tlm_bundle_rejects_truncated_payload():
+    import pytest
+    from src.serializers.telemetry_serializer import iter_tlm_bundle, serialize_telemetry, serialize_tlm_bundle
+
+    bundle = serialize_tlm_bundle([serialize_telemetry(0x02, 1.0, 2.0, 3.0)])
+    assert [(t, bytes(b)) for t, b in iter_tlm_bundle(bundle)] == [(0x02, bundle[4:])]
+    with pytest.raises(ValueError):
+        list(iter_tlm_bundle(bundle[:-1]))
@@ -4,4 +4,166 @@ def test_telemetry_cache_update():
     set_device_data(1, "gps", {"lat": 37.0, "lon": 35.0, "alt": 100})
     gps = get_device_data(1, "gps")
     assert gps is not None
-    assert gps["lat"] == 37.0
\ No newline at end of file
+    assert gps["lat"] == 37.0
+
+
+def test_telemetry_history_ring_buffer_window():
+    from array import array
+    from src.tools.telemetry.telemetry_history import TelemetryRingBuffer
+
+    ring = TelemetryRingBuffer({"lat": 0.0, "sats": 0, "mode": "AUTO"}, capacity=4)
+    for t in range(10):
+        ring.append(float(t), {"lat": t / 10, "sats": t, "mode": f"M{t}"})
+
+    assert len(ring) == 4
+    window = ring.window()
+    assert list(window["timestamp"]) == [6.0, 7.0, 8.0, 9.0]
+    assert isinstance(window["lat"], array) and window["sats"].typecode == 'q'
+    assert window["mode"] == ["M6", "M7", "M8", "M9"]
+    assert list(ring.window(since=7.5, until=9.0)["sats"]) == [8, 9]
+    assert list(ring.window(since=20.0)["timestamp"]) == []
+
+
+def test_telemetry_history_widens_columns_in_place():
+    from src.tools.telemetry.telemetry_cache import get_history, reset_cache, set_device_data
+
+    reset_cache()
+    set_device_data(4, "gps", {"lat": 37.0, "lon": 35.0, "alt": 100})
+    set_device_data(4, "gps", {"lat": 37.0, "lon": 35.0, "alt": 100.5})
+    set_device_data(4, "gps", {"lat": None, "lon": 35.0, "alt": 101})
+
+    history = get_history(4, "gps")
+    assert history["alt"].typecode == 'd' and list(history["alt"]) == [100.0, 100.5, 101.0]
+    assert history["lat"] == [37.0, 37.0, None]
+
+
+def test_telemetry_cache_keeps_bounded_history():
+    from src.tools.telemetry import telemetry_cache
+    from src.tools.telemetry.telemetry_cache import get_history, reset_cache, set_device_data
+
+    reset_cache()
+    for i in range(telemetry_cache.HISTORY_CAPACITY + 5):
+        set_device_data(3, "gps", {"lat": float(i), "lon": 35.0, "alt": 100.0})
+
+    history = get_history(3, "gps")
+    assert len(history["lat"]) == telemetry_cache.HISTORY_CAPACITY
+    assert history["lat"][-1] == telemetry_cache.HISTORY_CAPACITY + 4
+    assert list(get_history(3, "gps", since=history["timestamp"][-1])["lat"])[-1] == history["lat"][-1]
+    assert get_history(3, "imu") is None
+
+
+def test_telemetry_cache_concurrent_writers_and_readers():
+    import threading
+    from src.tools.telemetry.telemetry_cache import (
+        get_active_device_ids, get_all_cached_data, get_device_data, reset_cache, set_device_data
+    )
+
+    reset_cache()
+    errors = []
+    done = threading.Event()
+
+    def writer(base):
+        try:
+            for i in range(2000):
+                src = base + i % 20
+                set_device_data(src, "gps", {"lat": float(i), "lon": 35.0, "alt": 100.0})
+                set_device_data(src, "imu", {"roll": 1.0, "pitch": 2.0, "yaw": 3.0})
+        except Exception as e:
+            errors.append(e)
+
+    def reader():
+        try:
+            while not done.is_set():
+                for entries in get_all_cached_data().values():
+                    assert "timestamp" in next(iter(entries.values()))
+                get_active_device_ids()
+        except Exception as e:
+            errors.append(e)
+
+    writers = [threading.Thread(target=writer, args=(base,)) for base in (0, 10, 100)]
+    readers = [threading.Thread(target=reader) for _ in range(2)]
+    for t in readers + writers:
+        t.start()
+    for t in writers:
+        t.join()
+    done.set()
+    for t in readers:
+        t.join()
+
+    assert not errors
+    assert len(get_all_cached_data()) == 50
+    assert get_device_data(10, "imu")["yaw"] == 3.0
+
+
+def test_telemetry_cache_last_seen_index_and_subscriptions(monkeypatch):
+    from src.tools.telemetry import telemetry_cache
+    from src.tools.telemetry.telemetry_cache import (
+        get_active_device_ids, get_last_seen, get_stale_device_ids, reset_cache,
+        set_device_data, subscribe, unsubscribe
+    )
+
+    reset_cache()
+    now = [1000.0]
+    monkeypatch.setattr(telemetry_cache, "_current_timestamp", lambda: now[0])
+    for src in (5, 6, 7):
+        set_device_data(src, "imu", {"roll": 0.0, "pitch": 0.0, "yaw": 0.0})
+        now[0] += 10
+    set_device_data(5, "imu", {"roll": 1.0, "pitch": 0.0, "yaw": 0.0})
+
+    assert get_last_seen(5) == 1030.0
+    assert get_active_device_ids(timeout=15) == [5, 7]
+    assert get_stale_device_ids(timeout=15) == [6]
+
+    seen = []
+    callback = subscribe(lambda *update: seen.append(update), data_type="gps")
+    set_device_data(6, "imu", {"roll": 0.0, "pitch": 0.0, "yaw": 0.0})
+    set_device_data(6, "gps", {"lat": 1.0, "lon": 2.0, "alt": 3.0})
+    unsubscribe(callback)
+    set_device_data(6, "gps", {"lat": 1.0, "lon": 2.0, "alt": 3.0})
+    assert [(src, dtype) for src, dtype, _ in seen] == [(6, "gps")]
+
+
+def test_telemetry_cache_last_seen_stays_ordered_when_writers_race(monkeypatch):
+    from src.tools.telemetry import telemetry_cache
+    from src.tools.telemetry.telemetry_cache import get_active_device_ids, reset_cache, set_device_data
+
+    reset_cache()
+    # Device 2's writer stamped 999.0 but reached the index after device 1 (1000.0)
+    stamps = iter([1000.0, 999.0])
+    monkeypatch.setattr(telemetry_cache, "_current_timestamp", lambda: next(stamps, 1004.5))
+    set_device_data(1, "imu", {"roll": 0.0, "pitch": 0.0, "yaw": 0.0})
+    set_device_data(2, "imu", {"roll": 0.0, "pitch": 0.0, "yaw": 0.0})
+    assert list(telemetry_cache._last_seen.values()) == [1000.0, 1000.0]
+    assert get_active_device_ids(timeout=5) == [1, 2]
+
+
+def test_telemetry_column_table_tracks_latest_rows():
+    import math
+    from src.tools.telemetry.telemetry_columns import TelemetryColumnTable
+
+    table = TelemetryColumnTable("battery")
+    table.update(4, 10.0, {"voltage": 11.1, "level": 80.0, "timestamp": 10.0})
+    table.update(9, 11.0, {"voltage": 12.0, "current": 3.0, "state": "OK"})
+    table.update(4, 12.0, {"voltage": 10.9, "level": 79.0})
+
+    snap = table.snapshot()
+    assert list(snap["ids"]) == [4, 9] and list(snap["timestamp"]) == [12.0, 11.0]
+    assert list(snap["voltage"]) == [10.9, 12.0]
+    assert math.isnan(snap["current"][0]) and math.isnan(snap["level"][1])
+    assert "state" not in snap and table.fields == ("voltage", "level", "current")
+
+
+def test_columnar_snapshot_returns_numpy_arrays():
+    import pytest
+    np = pytest.importorskip("numpy")
+    from src.tools.telemetry.telemetry_cache import get_columnar_snapshot, reset_cache, set_device_data
+
+    reset_cache()
+    for src in (1, 2, 3):
+        set_device_data(src, "gps", {"lat": 37.0 + src, "lon": 35.0, "alt": 100.0 * src})
+
+    snap = get_columnar_snapshot("gps", ["lat", "alt"])
+    assert snap["ids"].dtype == np.int64 and list(snap["ids"]) == [1, 2, 3]
+    assert np.allclose(snap["alt"], [100.0, 200.0, 300.0])
+    assert set(snap) == {"ids", "timestamp", "lat", "alt"}
+    assert len(get_columnar_snapshot("imu")["ids"]) == 0
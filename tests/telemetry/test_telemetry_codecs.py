@@ -0,0 +1,37 @@
+def test_codecs_match_legacy_wire_format():
+    import struct
+    from src.serializers.telemetry_codecs import GPS, HEARTBEAT
+    from src.serializers.telemetry_serializer import deserialize_telemetry, serialize_telemetry
+
+    gps = serialize_telemetry(0x01, 37.5, 35.25, 120.0)
+    assert gps == struct.pack(">B3f", 0x01, 37.5, 35.25, 120.0)
+    hb = serialize_telemetry(0x04, "GUIDED", "OK", True, False, 12)
+    assert hb == b"\x04" + b"GUIDED".ljust(32, b"\x00") + b"OK".ljust(32, b"\x00") + struct.pack(">??B", True, False, 12)
+
+    assert deserialize_telemetry(hb) == {
+        "tlm_id": 4, "mode": "GUIDED", "health": "OK", "is_armed": True, "gps_fix": False, "sat_count": 12
+    }
+
+    buf = bytearray(2 + GPS.size + 1 + HEARTBEAT.size)
+    offset = 1
+    offset += GPS.pack_into(buf, offset, 37.5, 35.25, 120.0)
+    offset += HEARTBEAT.pack_into(buf, offset, "GUIDED", "OK", True, False, 12)
+    assert bytes(buf[1:offset]) == gps + hb
+
+
+def test_codec_records_use_slots_and_reject_bad_input():
+    import pytest
+    from src.serializers.telemetry_codecs import GPS, GpsRecord
+    from src.serializers.telemetry_serializer import decode_telemetry, serialize_telemetry
+
+    record = decode_telemetry(serialize_telemetry(0x01, 37.5, 35.25, 120.0))
+    assert isinstance(record, GpsRecord) and not hasattr(record, "__dict__")
+    assert (record.lat, record.lon, record.alt) == (37.5, 35.25, 120.0)
+    assert record.as_dict() == {"tlm_id": 1, "lat": 37.5, "lon": 35.25, "alt": 120.0}
+
+    with pytest.raises(ValueError):
+        GPS.decode(b"\x00" * (GPS.size - 1))
+    with pytest.raises(ValueError):
+        serialize_telemetry(0x01, 37.5, 35.25)
+    with pytest.raises(ValueError):
+        serialize_telemetry(0x7E, 1.0)
@@ -0,0 +1,51 @@
+def test_compact_heartbeat_and_gps_roundtrip():
+    from src.serializers.telemetry_compact import CompactTelemetryDecoder, CompactTelemetryEncoder
+    from src.serializers.telemetry_serializer import serialize_telemetry
+
+    enc, dec = CompactTelemetryEncoder(keyframe_interval=4), CompactTelemetryDecoder()
+
+    hb = enc.encode(0x04, ["GUIDED", "OK", True, False, 12], dst=2)
+    assert len(hb) == 5 and len(hb) < len(serialize_telemetry(0x04, "GUIDED", "OK", True, False, 12)) / 2
+    assert dec.decode(hb, src=1) == {"tlm_id": 0x04, "mode": "GUIDED", "health": "OK",
+                                     "is_armed": True, "gps_fix": False, "sat_count": 12}
+    assert enc.encode(0x04, ["MY_CUSTOM_MODE", "OK", True, True, 9]) is None
+
+    track = [(37.0 + i * 1e-5, 35.0 - i * 2e-6, 100.0 + i * 0.05) for i in range(9)]
+    payloads = [enc.encode(0x01, point, dst=2) for point in track]
+    assert [len(p) for p in payloads[:5]] == [14, 5, 5, 5, 14]   # KEY, 3x DELTA8, periodic KEY
+    for point, payload in zip(track, payloads):
+        out = dec.decode(payload, src=1)
+        assert abs(out["lat"] - point[0]) < 1e-7 and abs(out["lon"] - point[1]) < 1e-7
+        assert abs(out["alt"] - point[2]) < 1e-3
+
+
+def test_compact_gps_delta_after_loss_waits_for_keyframe():
+    import pytest
+    from src.serializers.telemetry_compact import CompactTelemetryDecoder, CompactTelemetryEncoder
+
+    enc, dec = CompactTelemetryEncoder(keyframe_interval=3), CompactTelemetryDecoder()
+    frames = [enc.encode(0x01, (40.0, 29.0, 50.0 + i), dst=7) for i in range(4)]
+    dec.decode(frames[0], src=7)
+    # frames[1] lost
+    with pytest.raises(ValueError):
+        dec.decode(frames[2], src=7)
+    assert dec.decode(frames[3], src=7)["alt"] == 53.0   # periodic KEY frame resyncs
+
+
+def test_compact_gps_broadcast_and_unicast_streams_stay_apart():
+    from src.core.frame_codec import decode_mesh_frame
+    from src.handlers.telemetry.telemetry_handler import handle_telemetry
+    from src.serializers.telemetry_compact import compact_decoder, compact_encoder
+    from src.tools.telemetry.telemetry_builder import build_tlm_frame
+    from src.tools.telemetry.telemetry_cache import get_device_data, reset_cache
+
+    reset_cache()
+    compact_encoder.reset()
+    compact_decoder.reset()
+    for i in range(12):
+        dst = 0xFF if i % 2 else 1
+        frame = decode_mesh_frame(build_tlm_frame("gps", [40.0, 29.0, 100.0 + i], dst, 5, compact=True))
+        assert frame.payload[0] & 0x80
+        handle_telemetry(frame.payload, frame)
+        # Every frame (deltas included) decodes despite the interleaved streams
+        assert get_device_data(5, "gps")["alt"] == 100.0 + i
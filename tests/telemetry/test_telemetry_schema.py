@@ -0,0 +1,41 @@
+def test_registered_schema_gets_builder_sender_and_cache_writer():
+    from src.core.frame_codec import decode_mesh_frame
+    from src.handlers.telemetry.telemetry_handler import TELEMETRY_HANDLERS, handle_telemetry
+    from src.serializers.telemetry_codecs import (
+        TELEMETRY_CODECS, TELEMETRY_CODECS_BY_NAME, Field, TelemetryCodec, register_codec
+    )
+    from src.tools.telemetry import telemetry_builder, telemetry_dispatcher
+    from src.tools.telemetry.telemetry_cache import get_device_data, reset_cache
+
+    codec = register_codec(TelemetryCodec(0x20, "wind", (
+        Field("speed", "H", "m/s", 100),
+        Field("direction", "h", "deg", 10),
+    )))
+    try:
+        reset_cache()
+        frame = telemetry_builder.build_tlm_wind(4.25, direction=270.5, dst=1, src=7)
+        assert decode_mesh_frame(frame).payload == bytes((0x20,)) + codec.body.pack(425, 2705)
+
+        handle_telemetry(decode_mesh_frame(frame).payload, {"src_id": 7, "dst_id": 1})
+        cached = get_device_data(7, "wind")
+        assert (cached["speed"], cached["direction"]) == (4.25, 270.5)
+
+        assert telemetry_dispatcher.send_tlm_wind.__name__ == "send_tlm_wind"
+        assert telemetry_builder.build_tlm_gps.__module__ == telemetry_builder.__name__
+    finally:
+        TELEMETRY_CODECS.pop(0x20, None)
+        TELEMETRY_CODECS_BY_NAME.pop("wind", None)
+        TELEMETRY_HANDLERS.pop(0x20, None)
+
+
+def test_schema_rejects_bad_registrations_and_values():
+    import pytest
+    from src.serializers.telemetry_codecs import GPS, TelemetryCodec, register_codec
+
+    with pytest.raises(ValueError):
+        register_codec(TelemetryCodec(0x01, "gps_again", (("lat", "f"),)))
+    with pytest.raises(ValueError):
+        TelemetryCodec(0x21, "bad", (("dst", "B"),))
+    with pytest.raises(ValueError):
+        GPS.bind({"lat": 1.0, "lon": 2.0})
+    assert GPS.bind([1.0], lon=2.0, alt=3.0) == (1.0, 2.0, 3.0)